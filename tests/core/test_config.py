@@ -6,7 +6,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from the_data_packet.core.config import Config, get_config, reset_config
+from the_data_packet.core.config import Config, get_config, reset_config, show_slug
 from the_data_packet.core.exceptions import ConfigurationError
 
 
@@ -64,6 +64,7 @@ class TestConfig(unittest.TestCase):
             "SHOW_NAME": "Environment Podcast",
             "LOG_LEVEL": "DEBUG",
             "MAX_ARTICLES_PER_SOURCE": "5",
+            "MONGODB_ACK_EPISODE_WRITES": "true",
         },
     )
     def test_environment_variable_loading(self):
@@ -78,15 +79,45 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.show_name, "Environment Podcast")
         self.assertEqual(config.log_level, "DEBUG")
         self.assertEqual(config.max_articles_per_source, 5)
+        self.assertTrue(config.mongodb_ack_episode_writes)
 
-    def test_output_directory_creation(self):
-        """Test that output directory is created if it doesn't exist."""
+    def test_output_directory_not_created_on_init(self):
+        """Test that building a config does not touch the filesystem."""
         with tempfile.TemporaryDirectory() as temp_dir:
             output_path = Path(temp_dir) / "new_output_dir"
             Config(output_directory=output_path)
 
-            self.assertTrue(output_path.exists())
-            self.assertTrue(output_path.is_dir())
+            self.assertFalse(output_path.exists())
+
+    def test_article_cache_dir_follows_output_directory(self):
+        """Test that the article cache defaults to a folder under the output directory."""
+        config = Config(output_directory=Path("/srv/podcast"))
+
+        self.assertEqual(config.article_cache_dir, str(Path("/srv/podcast") / "cache"))
+
+    @patch.dict(os.environ, {"ARTICLE_CACHE_DIRECTORY": "/var/cache/articles"})
+    def test_article_cache_dir_from_environment(self):
+        """Test that ARTICLE_CACHE_DIRECTORY overrides the derived location."""
+        config = Config(output_directory=Path("/srv/podcast"))
+
+        self.assertEqual(config.article_cache_dir, "/var/cache/articles")
+
+    def test_tts_cache_dir_follows_output_directory(self):
+        """Test that the TTS cache defaults to a folder under the output directory."""
+        config = Config(output_directory=Path("/srv/podcast"))
+
+        self.assertEqual(config.tts_cache_dir, str(Path("/srv/podcast") / "cache" / "tts"))
+
+    @patch.dict(os.environ, {"TTS_CACHE_DIRECTORY": "/var/cache/tts"})
+    def test_tts_cache_dir_from_environment(self):
+        """Test that TTS_CACHE_DIRECTORY overrides the derived location."""
+        config = Config(output_directory=Path("/srv/podcast"))
+
+        self.assertEqual(config.tts_cache_dir, "/var/cache/tts")
+
+    def test_tts_cache_dir_none_disables_cache(self):
+        """Test that an explicit None is kept so the cache stays disabled."""
+        self.assertIsNone(Config(tts_cache_dir=None).tts_cache_dir)
 
     def test_validate_for_script_generation_success(self):
         """Test script generation validation with valid API key."""
@@ -199,5 +230,19 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config2.show_name, "The Data Packet")  # Default
 
 
+class TestShowSlug(unittest.TestCase):
+    """Test cases for show_slug function."""
+
+    def test_single_spaces(self):
+        """Test that a plain show name maps to a dashed lowercase slug."""
+        self.assertEqual(show_slug("The Data Packet"), "the-data-packet")
+
+    def test_existing_keys_are_preserved(self):
+        """Test that irregular names keep the slug (and S3 feed key) they always had."""
+        self.assertEqual(show_slug("The  Data Packet"), "the--data-packet")
+        self.assertEqual(show_slug(" Data Packet! "), "-data-packet!-")
+        self.assertEqual(show_slug("Data\tPacket"), "data\tpacket")
+
+
 if __name__ == "__main__":
     unittest.main()
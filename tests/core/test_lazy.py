@@ -0,0 +1,28 @@
+"""Unit tests for core.lazy module."""
+
+import unittest
+
+from the_data_packet.core.lazy import lazy_getattr
+
+
+class TestLazyGetattr(unittest.TestCase):
+    """Test cases for the lazy_getattr helper."""
+
+    def test_resolves_exported_name_from_submodule(self):
+        """Test that an exported name is imported from its submodule."""
+        from the_data_packet.core.config import Config
+
+        getattr_hook = lazy_getattr("the_data_packet.core", {"Config": "config"})
+
+        self.assertIs(getattr_hook("Config"), Config)
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that names outside the mapping raise AttributeError."""
+        getattr_hook = lazy_getattr("the_data_packet.core", {"Config": "config"})
+
+        with self.assertRaisesRegex(AttributeError, "has no attribute 'Missing'"):
+            getattr_hook("Missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 """Unit tests for generation.__init__.py module."""
 
+import subprocess
+import sys
 import unittest
 
 from the_data_packet.generation import AudioGenerator, RSSGenerator, ScriptGenerator
@@ -31,6 +33,28 @@ class TestGenerationInit(unittest.TestCase):
         for item in expected_items:
             self.assertIn(item, gen_module.__all__)
 
+    def test_lazy_exports_match_modules(self):
+        """Test that lazily resolved generators are the submodule classes."""
+        from the_data_packet.generation.audio import AudioGenerator as AudioGeneratorDirect
+        from the_data_packet.generation.script import ScriptGenerator as ScriptGeneratorDirect
+
+        self.assertIs(AudioGenerator, AudioGeneratorDirect)
+        self.assertIs(ScriptGenerator, ScriptGeneratorDirect)
+
+    def test_unknown_attribute_raises(self):
+        """Test that the lazy loader only resolves exported names."""
+        import the_data_packet.generation as gen_module
+
+        with self.assertRaises(AttributeError):
+            gen_module.NotAGenerator  # noqa: B018
+
+    def test_cli_import_does_not_load_sdks(self):
+        """Test that importing the CLI leaves the Anthropic and Gemini SDKs unloaded."""
+        code = "import sys, the_data_packet.cli; print('anthropic' in sys.modules, 'google.genai' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), "False False")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,14 @@
 """Unit tests for generation.audio module."""
 
+import os
+import tempfile
 import unittest
+import wave
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from google.genai.errors import ClientError, ServerError
+
 from the_data_packet.core.exceptions import AudioGenerationError, ConfigurationError
 from the_data_packet.generation.audio import AudioGenerator, AudioResult
 
@@ -60,6 +65,7 @@ class TestAudioGenerator(unittest.TestCase):
         self.mock_config.female_voice = "Kore"
         self.mock_config.google_cloud_project = "test-project"
         self.mock_config.output_directory = Path("/tmp/test")
+        self.mock_config.tts_cache_dir = None
 
     def _make_generator(self) -> AudioGenerator:
         """Create an AudioGenerator with mocked Vertex AI client."""
@@ -176,7 +182,7 @@ Sam: Hi there.
         generator.tts_client.models.generate_content.return_value = _make_tts_response()
 
         turns = [("Alex", "Hello."), ("Sam", "Hi there."), ("Alex", "Goodbye.")]
-        generator._synthesize_turns(turns)
+        list(generator._synthesize_turns(turns))
 
         self.assertEqual(generator.tts_client.models.generate_content.call_count, 3)
 
@@ -189,10 +195,48 @@ Sam: Hi there.
         generator.tts_client.models.generate_content.return_value = _make_tts_response(pcm_chunk)
 
         turns = [("Alex", "Hello."), ("Sam", "Hi.")]
-        result = generator._synthesize_turns(turns)
+        result = b"".join(generator._synthesize_turns(turns))
 
         self.assertEqual(result, pcm_chunk + pcm_chunk)
 
+    @patch("time.sleep")
+    def test_synthesize_turns_reuses_cached_turns(self, _mock_sleep):
+        """Test that turns synthesized in an earlier run are read from the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.mock_config.tts_cache_dir = temp_dir
+            turns = [("Alex", "Hello."), ("Sam", "Hi.")]
+
+            first = self._make_generator()
+            first.tts_client = Mock()
+            first.tts_client.models.generate_content.return_value = _make_tts_response(b"\x01\x02" * 10)
+            first_pcm = b"".join(first._synthesize_turns(turns))
+
+            second = self._make_generator()
+            second.tts_client = Mock()
+            second.tts_client.models.generate_content.return_value = _make_tts_response(b"\x03\x04" * 10)
+            second_pcm = b"".join(second._synthesize_turns(turns + [("Alex", "New line.")]))
+
+        self.assertEqual(first.tts_client.models.generate_content.call_count, 2)
+        # Only the new turn reaches the API on the second run
+        self.assertEqual(second.tts_client.models.generate_content.call_count, 1)
+        self.assertEqual(second_pcm, first_pcm + b"\x03\x04" * 10)
+
+    def test_prune_turn_cache_removes_least_recently_used(self):
+        """Test that pruning deletes the oldest entries until under the size cap."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.mock_config.tts_cache_dir = temp_dir
+            generator = self._make_generator()
+            generator.TTS_CACHE_MAX_BYTES = 20
+
+            for age, name in enumerate(["new", "mid", "old"]):
+                path = Path(temp_dir) / f"{name}.pcm"
+                path.write_bytes(b"x" * 10)
+                os.utime(path, (1000 - age, 1000 - age))
+
+            generator._prune_turn_cache()
+
+            self.assertEqual(sorted(p.stem for p in Path(temp_dir).glob("*.pcm")), ["mid", "new"])
+
     @patch("time.sleep")
     def test_synthesize_turns_uses_correct_voice_per_speaker(self, _mock_sleep):
         """Test that each speaker gets their assigned voice."""
@@ -201,7 +245,7 @@ Sam: Hi there.
         generator.tts_client.models.generate_content.return_value = _make_tts_response()
 
         turns = [("Alex", "Hello."), ("Sam", "Hi.")]
-        generator._synthesize_turns(turns)
+        list(generator._synthesize_turns(turns))
 
         calls = generator.tts_client.models.generate_content.call_args_list
         alex_config = calls[0].kwargs["config"]
@@ -221,10 +265,40 @@ Sam: Hi there.
         generator.tts_client.models.generate_content.side_effect = Exception("API error")
 
         with self.assertRaises(AudioGenerationError) as cm:
-            generator._synthesize_turns([("Alex", "Hello.")])
+            list(generator._synthesize_turns([("Alex", "Hello.")]))
 
         self.assertIn("Failed to synthesize turn 1", str(cm.exception))
 
+    @patch("time.sleep")
+    def test_synthesize_turns_retries_transient_errors(self, _mock_sleep):
+        """Test that rate limits and server errors are retried for the failing turn only."""
+        generator = self._make_generator()
+        generator.tts_client = Mock()
+        generator.tts_client.models.generate_content.side_effect = [
+            ClientError(429, {"error": {"message": "quota", "status": "RESOURCE_EXHAUSTED"}}),
+            ServerError(503, {"error": {"message": "unavailable", "status": "UNAVAILABLE"}}),
+            _make_tts_response(b"\x01\x02"),
+        ]
+
+        result = b"".join(generator._synthesize_turns([("Alex", "Hello.")]))
+
+        self.assertEqual(result, b"\x01\x02")
+        self.assertEqual(generator.tts_client.models.generate_content.call_count, 3)
+
+    @patch("time.sleep")
+    def test_synthesize_turns_does_not_retry_client_errors(self, _mock_sleep):
+        """Test that a non-rate-limit client error fails without retrying."""
+        generator = self._make_generator()
+        generator.tts_client = Mock()
+        generator.tts_client.models.generate_content.side_effect = ClientError(
+            400, {"error": {"message": "bad voice", "status": "INVALID_ARGUMENT"}}
+        )
+
+        with self.assertRaises(AudioGenerationError):
+            list(generator._synthesize_turns([("Alex", "Hello.")]))
+
+        self.assertEqual(generator.tts_client.models.generate_content.call_count, 1)
+
     def test_generate_audio_empty_script_raises_error(self):
         """Test that empty script raises AudioGenerationError."""
         generator = self._make_generator()
@@ -272,7 +346,7 @@ Sam: Absolutely. Let's dive into the details."""
         mock_ntf.__exit__ = Mock(return_value=False)
 
         with (
-            patch.object(generator, "_synthesize_turns", return_value=pcm) as mock_synth,
+            patch.object(generator, "_synthesize_turns", return_value=iter([pcm])) as mock_synth,
             patch("wave.open"),
             patch.object(generator, "convert_wav_to_mp3"),
             patch("pathlib.Path.mkdir"),
@@ -286,6 +360,27 @@ Sam: Absolutely. Let's dive into the details."""
         mock_synth.assert_called_once()
         self.assertIsInstance(result, AudioResult)
 
+    def test_generate_audio_streams_turns_into_wav(self):
+        """Test that every synthesized turn is written to the intermediate WAV."""
+        generator = self._make_generator()
+        turns = [b"\x01\x00" * 100, b"\x02\x00" * 50]
+        written = {}
+
+        def convert(wav_path, mp3_path):
+            with wave.open(str(wav_path), "rb") as wav_file:
+                written["frames"] = wav_file.getnframes()
+                written["pcm"] = wav_file.readframes(wav_file.getnframes())
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with (
+                patch.object(generator, "_synthesize_turns", return_value=iter(turns)),
+                patch.object(generator, "convert_wav_to_mp3", side_effect=convert),
+            ):
+                generator.generate_audio("Alex: " + "words " * 30, Path(temp_dir) / "episode.mp3")
+
+        self.assertEqual(written["frames"], 150)
+        self.assertEqual(written["pcm"], b"".join(turns))
+
     def test_get_available_voices_structure(self):
         """Test get_available_voices returns expected structure."""
         generator = self._make_generator()
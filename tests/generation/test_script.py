@@ -1,8 +1,18 @@
 """Unit tests for generation.script module."""
 
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
+import httpx
+from anthropic import (
+    APIConnectionError,
+    AuthenticationError,
+    BadRequestError,
+    InternalServerError,
+    RateLimitError,
+)
+
 from the_data_packet.core.exceptions import AIGenerationError, ConfigurationError
 from the_data_packet.generation.script import ScriptGenerator
 from the_data_packet.sources.base import Article
@@ -19,6 +29,7 @@ class TestScriptGenerator(unittest.TestCase):
         self.mock_config.max_tokens = 3000
         self.mock_config.temperature = 0.7
         self.mock_config.show_name = "Test Podcast"
+        self.mock_config.use_message_batches = False
 
         self.sample_article = Article(
             title="Test Article",
@@ -364,6 +375,235 @@ class TestScriptGenerator(unittest.TestCase):
                 self.assertIn("closing", sections)
                 self.assertIn("Thanks for listening!", sections["closing"])
 
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_segment_responses_batch(self, mock_anthropic, mock_get_config):
+        """Test that batch results map back to article indexes and failures are left out."""
+        mock_get_config.return_value = self.mock_config
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+
+        mock_client.messages.batches.create.return_value = Mock(id="batch_1", processing_status="in_progress")
+        mock_client.messages.batches.retrieve.return_value = Mock(id="batch_1", processing_status="ended")
+        succeeded = Mock(custom_id="1")
+        succeeded.result.type = "succeeded"
+        succeeded.result.message.content = [Mock(text="  segment text  ")]
+        errored = Mock(custom_id="0")
+        errored.result.type = "errored"
+        mock_client.messages.batches.results.return_value = [errored, succeeded]
+
+        generator = ScriptGenerator(api_key="test-key")
+        generator.BATCH_POLL_INTERVAL = 0
+
+        responses = generator._generate_segment_responses_batch([self.sample_article, self.sample_article])
+
+        self.assertEqual(responses, {1: "segment text"})
+        requests = mock_client.messages.batches.create.call_args.kwargs["requests"]
+        self.assertEqual([r["custom_id"] for r in requests], ["0", "1"])
+        self.assertEqual(requests[0]["params"]["model"], self.mock_config.claude_model)
+        mock_client.messages.batches.retrieve.assert_called_once_with("batch_1")
+
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_script_falls_back_for_missing_batch_results(self, mock_anthropic, mock_get_config):
+        """Test that articles without a batch result are generated individually."""
+        self.mock_config.use_message_batches = True
+        mock_get_config.return_value = self.mock_config
+        mock_anthropic.return_value = Mock()
+        article = Article(title="Valid Article", content="x" * 200)
+
+        generator = ScriptGenerator(api_key="test-key")
+        batch_text = "### SEGMENT SCRIPT\nAlex: Batched.\n### SEGMENT SUMMARY\nBatched summary"
+
+        with (
+            patch.object(generator, "_generate_segment_responses_batch", return_value={0: batch_text}),
+            patch.object(generator, "_generate_segment", return_value=("Alex: Single.", "Single summary")) as mock_seg,
+            patch.object(generator, "_generate_framework", return_value="") as mock_framework,
+        ):
+            generator.generate_script([article, article])
+
+        mock_seg.assert_called_once_with(article)
+        mock_framework.assert_called_once_with(["Batched summary", "Single summary"])
+
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_script_concurrent_segments_keep_order(self, mock_anthropic, mock_get_config):
+        """Test that concurrently generated segments are combined in article order, skipping refusals."""
+        self.mock_config.use_message_batches = False
+        mock_get_config.return_value = self.mock_config
+        mock_anthropic.return_value = Mock()
+        articles = [Article(title=title, content="x" * 200) for title in ("First", "Refused", "Third")]
+
+        def segment(article):
+            if article.title == "Refused":
+                raise AIGenerationError("AI refused to process content")
+            return f"Alex: {article.title}.", f"{article.title} summary"
+
+        generator = ScriptGenerator(api_key="test-key")
+        with (
+            patch.object(generator, "_generate_segment", side_effect=segment) as mock_seg,
+            patch.object(generator, "_generate_framework", return_value="") as mock_framework,
+        ):
+            generator.generate_script(articles)
+
+        self.assertEqual(mock_seg.call_count, 3)
+        mock_framework.assert_called_once_with(["First summary", "Third summary"])
+
+    @patch("time.sleep")
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_segment_retries_rate_limit(self, mock_anthropic, mock_get_config, _mock_sleep):
+        """Test that a 429 from the API is retried instead of failing the segment."""
+        mock_get_config.return_value = self.mock_config
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        mock_client.messages.create.side_effect = [
+            _rate_limit_error(),
+            _text_response("### SEGMENT SCRIPT\nAlex: Retried.\n### SEGMENT SUMMARY\nRetried summary"),
+        ]
+
+        generator = ScriptGenerator(api_key="test-key")
+        segment, summary = generator._generate_segment(self.sample_article)
+
+        self.assertEqual(segment, "Alex: Retried.")
+        self.assertEqual(summary, "Retried summary")
+        self.assertEqual(mock_client.messages.create.call_count, 2)
+
+    @patch("time.sleep")
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_script_survives_rate_limit(self, mock_anthropic, mock_get_config, _mock_sleep):
+        """Test that generate_script returns the script when a request hits a 429 once."""
+        mock_get_config.return_value = self.mock_config
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        mock_client.messages.create.side_effect = [
+            _rate_limit_error(),
+            _text_response("### SEGMENT SCRIPT\nAlex: Retried.\n### SEGMENT SUMMARY\nRetried summary"),
+            _text_response(""),
+        ]
+        article = Article(title="Valid Article", content="x" * 200)
+
+        generator = ScriptGenerator(api_key="test-key")
+        script = generator.generate_script([article])
+
+        self.assertIn("Alex: Retried.", script)
+        # Segment: one 429 then success; framework: one call
+        self.assertEqual(mock_client.messages.create.call_count, 3)
+
+    @patch("time.sleep")
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_script_concurrent_segments_survive_rate_limit(self, mock_anthropic, mock_get_config, _mock_sleep):
+        """Test that a 429 on one concurrent segment request is retried, not fatal."""
+        mock_get_config.return_value = self.mock_config
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        articles = [Article(title=title, content="x" * 200) for title in ("First", "Second", "Third")]
+        limited = set()
+        lock = threading.Lock()
+
+        def create(**params):
+            content = params["messages"][0]["content"]
+            for article in articles:
+                if f"TITLE: {article.title}" in content:
+                    with lock:
+                        # Every segment is rate limited on its first attempt
+                        if article.title not in limited:
+                            limited.add(article.title)
+                            raise _rate_limit_error()
+                    return _text_response(
+                        f"### SEGMENT SCRIPT\nAlex: {article.title}.\n### SEGMENT SUMMARY\n{article.title} summary"
+                    )
+            return _text_response("")
+
+        mock_client.messages.create.side_effect = create
+
+        generator = ScriptGenerator(api_key="test-key")
+        script = generator.generate_script(articles)
+
+        self.assertLess(script.index("Alex: First."), script.index("Alex: Second."))
+        self.assertLess(script.index("Alex: Second."), script.index("Alex: Third."))
+        # Three segments retried once each, plus the framework
+        self.assertEqual(mock_client.messages.create.call_count, 7)
+
+    @patch("time.sleep")
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_segment_rate_limit_exhausted_raises_error(self, mock_anthropic, mock_get_config, _mock_sleep):
+        """Test that a persistent 429 surfaces as AIGenerationError after the retries."""
+        mock_get_config.return_value = self.mock_config
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        mock_client.messages.create.side_effect = _rate_limit_error()
+
+        generator = ScriptGenerator(api_key="test-key")
+        with self.assertRaises(AIGenerationError) as cm:
+            generator._generate_segment(self.sample_article)
+
+        self.assertIn("Rate limit exceeded", str(cm.exception))
+        self.assertEqual(mock_client.messages.create.call_count, 5)
+
+    @patch("time.sleep")
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_segment_retries_server_and_connection_errors(self, mock_anthropic, mock_get_config, _mock_sleep):
+        """Test that 5xx responses and connection failures are retried."""
+        mock_get_config.return_value = self.mock_config
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        mock_client.messages.create.side_effect = [
+            _status_error(InternalServerError, 500),
+            APIConnectionError(request=_REQUEST),
+            _text_response("### SEGMENT SCRIPT\nAlex: Retried.\n### SEGMENT SUMMARY\nRetried summary"),
+        ]
+
+        generator = ScriptGenerator(api_key="test-key")
+        segment, _ = generator._generate_segment(self.sample_article)
+
+        self.assertEqual(segment, "Alex: Retried.")
+        self.assertEqual(mock_client.messages.create.call_count, 3)
+
+    @patch("time.sleep")
+    @patch("the_data_packet.generation.script.get_config")
+    @patch("the_data_packet.generation.script.Anthropic")
+    def test_generate_segment_does_not_retry_client_errors(self, mock_anthropic, mock_get_config, mock_sleep):
+        """Test that auth and bad-request errors fail on the first attempt."""
+        mock_get_config.return_value = self.mock_config
+        errors = [_status_error(AuthenticationError, 401), _status_error(BadRequestError, 400)]
+
+        for error in errors:
+            with self.subTest(error=type(error).__name__):
+                mock_client = Mock()
+                mock_anthropic.return_value = mock_client
+                mock_client.messages.create.side_effect = error
+
+                generator = ScriptGenerator(api_key="test-key")
+                with self.assertRaises(AIGenerationError):
+                    generator._generate_segment(self.sample_article)
+
+                self.assertEqual(mock_client.messages.create.call_count, 1)
+
+        mock_sleep.assert_not_called()
+
+
+_REQUEST = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+
+
+def _status_error(error_class, status_code: int):
+    """Build the SDK error raised for an HTTP error status."""
+    return error_class("API error", response=httpx.Response(status_code, request=_REQUEST), body=None)
+
+
+def _rate_limit_error() -> RateLimitError:
+    """Build the SDK error raised for an HTTP 429."""
+    return _status_error(RateLimitError, 429)
+
+
+def _text_response(text: str) -> Mock:
+    """Build a mock Messages API response with a single text block."""
+    return Mock(content=[Mock(text=text)])
+
 
 if __name__ == "__main__":
     unittest.main()
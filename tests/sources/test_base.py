@@ -1,5 +1,6 @@
 """Unit tests for sources.base module."""
 
+import sys
 import unittest
 
 from the_data_packet.core.exceptions import ValidationError
@@ -125,6 +126,31 @@ class TestArticle(unittest.TestCase):
 
         self.assertEqual(article.to_dict(), expected_dict)
 
+    def test_to_dict_exclude(self) -> None:
+        """Test that excluded fields are left out of to_dict."""
+        article = Article(title="Test Article", content="Test content", url="https://example.com")
+
+        self.assertEqual(
+            article.to_dict(exclude={"content"}),
+            {"title": "Test Article", "author": None, "url": "https://example.com", "category": None, "source": None},
+        )
+
+    def test_cached_length_excluded_from_repr_and_eq(self) -> None:
+        """Test that the cached content length does not leak into repr or equality."""
+        article = Article(title="Test Article", content="  Test content  ")
+
+        self.assertNotIn("_content_length", repr(article))
+        self.assertEqual(article, Article(title="Test Article", content="  Test content  "))
+
+    @unittest.skipIf(sys.version_info < (3, 10), "slotted dataclasses require Python 3.10+")
+    def test_article_uses_slots(self) -> None:
+        """Test that Article instances carry no per-instance __dict__."""
+        article = Article(title="Test Article", content="Test content")
+
+        self.assertFalse(hasattr(article, "__dict__"))
+        with self.assertRaises(AttributeError):
+            article.extra = "value"  # type: ignore[attr-defined]
+
 
 class ConcreteArticleSource(ArticleSource):
     """Concrete implementation of ArticleSource for testing."""
@@ -193,6 +219,26 @@ class TestArticleSource(unittest.TestCase):
         self.source.validate_category("tech")
         self.source.validate_category("science")
 
+    def test_supported_set_is_cached(self) -> None:
+        """Test that the membership set is built once from supported_categories."""
+        supported = self.source._supported_set
+
+        self.assertEqual(supported, frozenset(["tech", "science"]))
+        self.assertIs(self.source._supported_set, supported)
+
+    def test_prefetch_feeds_default_is_noop(self) -> None:
+        """Test that the default prefetch_feeds does nothing."""
+        self.assertIsNone(self.source.prefetch_feeds(["tech", "science"]))
+
+    def test_exclude_urls(self) -> None:
+        """Test that exclude_urls replaces the per-instance exclusion set."""
+        self.assertEqual(self.source.excluded_urls, frozenset())
+
+        self.source.exclude_urls(["https://example.com/a", "https://example.com/a"])
+
+        self.assertEqual(self.source.excluded_urls, frozenset({"https://example.com/a"}))
+        self.assertEqual(ArticleSource.excluded_urls, frozenset())
+
     def test_validate_category_invalid(self) -> None:
         """Test validate_category with invalid category."""
         with self.assertRaises(ValidationError) as cm:
@@ -1,11 +1,17 @@
 """Unit tests for sources.techcrunch module."""
 
+import tempfile
 import unittest
+from itertools import islice
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from the_data_packet.core.exceptions import ValidationError
+from bs4 import BeautifulSoup
+
+from the_data_packet.core.exceptions import ScrapingError, ValidationError
 from the_data_packet.sources.base import Article, ArticleSource
 from the_data_packet.sources.techcrunch import TechCrunchSource
+from the_data_packet.utils.cache import ResponseCache
 
 
 class TestTechCrunchSource(unittest.TestCase):
@@ -83,7 +89,7 @@ class TestTechCrunchSource(unittest.TestCase):
             self.assertEqual(article.category, "ai")
 
     @patch.object(TechCrunchSource, "_extract_article")
-    @patch.object(TechCrunchSource, "_get_urls_from_rss")
+    @patch.object(TechCrunchSource, "_iter_urls_from_rss")
     def test_get_multiple_articles_structure(self, mock_get_urls: MagicMock, mock_extract: MagicMock):
         """Test get_multiple_articles method structure (mocked)."""
         mock_get_urls.return_value = [
@@ -129,6 +135,148 @@ class TestTechCrunchSource(unittest.TestCase):
                 self.assertIsInstance(article, Article)
                 self.assertEqual(article.source, "techcrunch")
 
+    def test_iter_urls_from_rss_respects_count(self):
+        """Test that URL iteration stops at the requested count."""
+        feed = (
+            b"<rss><channel><item><link>https://techcrunch.com/a</link></item>"
+            b"<item><link>https://techcrunch.com/b</link></item></channel></rss>"
+        )
+
+        with patch.object(self.source.http_client, "get_bounded", return_value=feed):
+            self.assertEqual(list(self.source._iter_urls_from_rss("ai", 1)), ["https://techcrunch.com/a"])
+
+    def test_iter_urls_from_rss_skips_excluded_urls(self):
+        """Test that excluded URLs are skipped without counting toward the limit."""
+        feed = (
+            b"<rss><channel><item><link>https://techcrunch.com/a</link></item>"
+            b"<item><link>https://techcrunch.com/b</link></item></channel></rss>"
+        )
+        self.source.exclude_urls(["https://techcrunch.com/a"])
+
+        with patch.object(self.source.http_client, "get_bounded", return_value=feed):
+            self.assertEqual(list(self.source._iter_urls_from_rss("ai", 1)), ["https://techcrunch.com/b"])
+
+    def test_iter_urls_from_rss_empty_feed(self):
+        """Test that a feed without item links raises ScrapingError."""
+        feed = b"<rss><channel><title>Empty</title></channel></rss>"
+
+        with patch.object(self.source.http_client, "get_bounded", return_value=feed):
+            with self.assertRaises(ScrapingError):
+                list(self.source._iter_urls_from_rss("ai", 3))
+
+    def test_should_skip_content(self):
+        """Test skip-pattern and length checks in _should_skip_content."""
+        self.assertTrue(self.source._should_skip_content("Sign up for our Newsletter today"))
+        self.assertTrue(self.source._should_skip_content("Visit TechCrunch+ for more"))
+        self.assertTrue(self.source._should_skip_content("  short  "))
+        self.assertFalse(self.source._should_skip_content("A new zero-day was disclosed this week."))
+
+    def test_iter_feed_links_rss(self):
+        """Test RSS link extraction stops after the requested count."""
+        feed = (
+            b"<rss><channel><link>https://techcrunch.com</link>"
+            b"<item><link>https://techcrunch.com/a</link></item>"
+            b"<item><link>https://techcrunch.com/b</link></item>"
+            b"<item><link>https://techcrunch.com/c</link></item>"
+            b"</channel></rss>"
+        )
+
+        self.assertEqual(
+            list(islice(self.source._iter_feed_links(feed), 2)),
+            ["https://techcrunch.com/a", "https://techcrunch.com/b"],
+        )
+
+    def test_iter_feed_links_atom(self):
+        """Test Atom link extraction from href attributes."""
+        feed = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><link href="https://techcrunch.com"/>'
+            b'<entry><link href="https://techcrunch.com/a"/></entry></feed>'
+        )
+
+        self.assertEqual(list(self.source._iter_feed_links(feed)), ["https://techcrunch.com/a"])
+
+    def test_iter_feed_links_malformed(self):
+        """Test that an unparseable feed raises ScrapingError."""
+        with self.assertRaises(ScrapingError):
+            list(self.source._iter_feed_links(b"<rss><channel><item>"))
+
+    def test_extract_title_strips_site_suffix(self):
+        """Test the <title> fallback strips the TechCrunch suffix."""
+        soup = BeautifulSoup("<html><head><title>Big Breach | TechCrunch</title></head></html>", "html.parser")
+
+        self.assertEqual(self.source._extract_title(soup), "Big Breach")
+
+    def test_extract_content_prunes_unwanted_elements(self):
+        """Test that scripts and ads are removed before content is read."""
+        body = "Researchers disclosed a remote code execution flaw affecting millions of routers worldwide."
+        soup = BeautifulSoup(
+            f'<div class="article-content"><p>{body}</p><script>track()</script>'
+            f'<div class="ad">Buy now</div><p>{body}</p></div>',
+            "html.parser",
+        )
+
+        content = self.source._extract_content(soup)
+
+        self.assertEqual(content, f"{body} {body}")
+
+    def test_clean_content_drops_boilerplate_sentences(self):
+        """Test that _clean_content removes sentences matching skip patterns."""
+        content = "The breach exposed customer records.  Sign Up for our Newsletter. Patches are now available."
+
+        self.assertEqual(
+            self.source._clean_content(content),
+            "The breach exposed customer records. Patches are now available.",
+        )
+
+    def test_clean_content_keeps_inner_dots(self):
+        """Test that only ". " ends a sentence when removing boilerplate."""
+        content = "Visit example.com to sign up today. The U.S. government responded. Follow us on X."
+
+        self.assertEqual(self.source._clean_content(content), "The U.S. government responded.")
+
+    def test_extract_content_paragraph_fallback(self):
+        """Test paragraph fallback drops short and boilerplate paragraphs."""
+        body = "Researchers disclosed a remote code execution flaw affecting millions of routers worldwide."
+        soup = BeautifulSoup(
+            f"<html><body><p>{body}</p><p>Short</p><p>Sign up for the newsletter</p><p>{body}</p></body></html>",
+            "html.parser",
+        )
+
+        self.assertEqual(self.source._extract_content(soup), f"{body} {body}")
+
+    def test_extract_content_paragraph_fallback_keeps_inline_text(self):
+        """Test that inline markup inside a paragraph does not gain extra spaces."""
+        detail = "Researchers said the flaw affects several firmware versions shipped over the last two years."
+        soup = BeautifulSoup(
+            f"<html><body><p>Attackers exploit a <em>zero</em>-day in VPN appliances.</p><p>  </p><p>{detail}</p>"
+            "</body></html>",
+            "html.parser",
+        )
+
+        self.assertEqual(
+            self.source._extract_content(soup),
+            f"Attackers exploit a zero-day in VPN appliances. {detail}",
+        )
+
+    def test_extract_article_uses_cache_when_not_modified(self):
+        """Test that a 304 response returns the cached article without parsing."""
+        url = "https://techcrunch.com/cached"
+        cached = Article(title="Cached", content="Cached body", url=url, category="ai", source="techcrunch")
+        mock_response = MagicMock(status_code=304)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.source._cache = ResponseCache(Path(temp_dir))
+            self.source._cache.set(url, cached.to_dict(), etag='"v1"')
+
+            with patch.object(self.source.http_client, "get", return_value=mock_response) as mock_get:
+                with patch.object(self.source.http_client, "parse_soup") as mock_parse:
+                    article = self.source._extract_article(url, "ai")
+
+        self.assertEqual(article, cached)
+        mock_get.assert_called_once_with(url, stream=True, headers={"If-None-Match": '"v1"'})
+        mock_parse.assert_not_called()
+        mock_response.close.assert_called_once()
+
     def test_source_initialization(self):
         """Test that source can be initialized without errors."""
         # This tests that __init__ works and doesn't raise exceptions
@@ -136,6 +284,11 @@ class TestTechCrunchSource(unittest.TestCase):
         self.assertIsNotNone(source)
         self.assertIsInstance(source, TechCrunchSource)
 
+    def test_instances_share_http_client(self):
+        """Test that sources reuse one HTTP client and connection pool."""
+        other = TechCrunchSource()
+        self.assertIs(self.source.http_client, other.http_client)
+
     def test_category_validation_integration(self):
         """Test category validation with actual supported categories."""
         # Test all supported categories are valid
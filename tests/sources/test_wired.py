@@ -1,11 +1,18 @@
 """Unit tests for sources.wired module."""
 
+import tempfile
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from the_data_packet.core.exceptions import ValidationError
+import lxml.html
+
+from the_data_packet.core.exceptions import ScrapingError, ValidationError
 from the_data_packet.sources.base import Article, ArticleSource
+from the_data_packet.sources.techcrunch import TechCrunchSource
 from the_data_packet.sources.wired import WiredSource
+from the_data_packet.utils.cache import ResponseCache
 
 
 class TestWiredSource(unittest.TestCase):
@@ -14,6 +21,9 @@ class TestWiredSource(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.source = WiredSource()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.source._feed_http_cache = ResponseCache(Path(temp_dir.name))
 
     def test_inheritance(self):
         """Test that WiredSource inherits from ArticleSource."""
@@ -139,6 +149,229 @@ class TestWiredSource(unittest.TestCase):
                 self.assertIsInstance(article, Article)
                 self.assertEqual(article.source, "wired")
 
+    @patch.object(WiredSource, "_extract_article")
+    @patch.object(WiredSource, "_get_urls_from_rss")
+    def test_get_multiple_articles_keeps_feed_order(self, mock_get_urls: MagicMock, mock_extract: MagicMock):
+        """Test concurrent extraction keeps feed order and skips failures."""
+        urls = [f"https://wired.com/article{i}" for i in range(1, 6)]
+        mock_get_urls.return_value = urls
+
+        def extract(url, category):
+            if url.endswith("3"):
+                raise ScrapingError("boom")
+            return Article(title=url, content="x" * 200, url=url, category=category, source="wired")
+
+        mock_extract.side_effect = extract
+
+        articles = self.source.get_multiple_articles("science", 5)
+
+        self.assertEqual([a.url for a in articles], [u for u in urls if not u.endswith("3")])
+
+    @staticmethod
+    def _feed_response(content=b"", status_code=200, headers=None):
+        """Build a streamed feed response mock."""
+        response = MagicMock(status_code=status_code, headers=headers or {})
+        response.iter_content.return_value = [content]
+        return response
+
+    def test_prefetch_feeds_populates_cache(self):
+        """Test that prefetched feeds are reused by _get_urls_from_rss."""
+        feed = (
+            b"<rss><channel><item><link>https://wired.com/a</link></item>"
+            b"<item><link>https://wired.com/b</link></item></channel></rss>"
+        )
+
+        with patch.object(
+            self.source.http_client, "get", side_effect=lambda *a, **k: self._feed_response(feed)
+        ) as mock_get:
+            self.source.prefetch_feeds(["security", "ai", "unsupported"])
+            self.assertEqual(mock_get.call_count, 2)
+
+            urls = self.source._get_urls_from_rss("security", 1)
+
+        self.assertEqual(urls, ["https://wired.com/a"])
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_get_urls_from_rss_skips_excluded_urls(self):
+        """Test that excluded URLs are dropped and later entries fill the count."""
+        self.source._feed_cache["ai"] = (time.monotonic(), [f"https://wired.com/{c}" for c in "abc"])
+        self.source.exclude_urls(["https://wired.com/a"])
+
+        urls = self.source._get_urls_from_rss("ai", 2)
+
+        self.assertEqual(urls, ["https://wired.com/b", "https://wired.com/c"])
+
+    @patch("feedparser.parse")
+    def test_fetch_feed_skips_html_post_processing(self, mock_parse: MagicMock):
+        """Test that feeds are parsed without HTML sanitizing or URI resolution."""
+        with patch.object(self.source.http_client, "get", return_value=self._feed_response(b"<rss/>")):
+            self.source._fetch_feed("ai")
+
+        mock_parse.assert_called_once_with(b"<rss/>", sanitize_html=False, resolve_relative_uris=False)
+
+    def test_fetch_feed_reuses_links_when_not_modified(self):
+        """Test that a 304 reply reuses the links stored from the previous download."""
+        feed = b"<rss><channel><item><link>https://wired.com/a</link></item></channel></rss>"
+        rss_url = self.source.RSS_FEEDS["ai"]
+        not_modified = self._feed_response(status_code=304)
+
+        with patch.object(
+            self.source.http_client,
+            "get",
+            side_effect=[self._feed_response(feed, headers={"ETag": '"v1"'}), not_modified],
+        ) as mock_get:
+            first = self.source._fetch_feed("ai")
+            second = self.source._fetch_feed("ai")
+
+        self.assertEqual(first, ["https://wired.com/a"])
+        self.assertEqual(second, first)
+        mock_get.assert_called_with(rss_url, stream=True, headers={"If-None-Match": '"v1"'})
+        not_modified.iter_content.assert_not_called()
+        not_modified.close.assert_called_once()
+
+    def test_get_feed_refetches_after_ttl(self):
+        """Test that a stale cached feed is downloaded again."""
+        feed = b"<rss><channel><item><link>https://wired.com/a</link></item></channel></rss>"
+        self.source._feed_cache["ai"] = (0.0, [])
+
+        with patch("the_data_packet.sources.wired.time.monotonic", return_value=self.source.FEED_CACHE_TTL + 1):
+            with patch.object(self.source.http_client, "get", return_value=self._feed_response(feed)) as mock_get:
+                urls = self.source._get_urls_from_rss("ai", 1)
+
+        mock_get.assert_called_once_with(self.source.RSS_FEEDS["ai"], stream=True, headers=None)
+        self.assertEqual(urls, ["https://wired.com/a"])
+
+    def test_extract_content_collapses_whitespace_and_skips_boilerplate(self):
+        """Test content extraction normalizes whitespace and drops skip patterns."""
+        body = "Researchers disclosed a remote   code execution flaw\naffecting millions of routers."
+        doc = lxml.html.document_fromstring(
+            f"<html><body><article><p>{body}</p><p>Sign up for the Wired newsletter today</p>"
+            f"<p>{body}</p></article></body></html>"
+        )
+
+        expected = "Researchers disclosed a remote code execution flaw affecting millions of routers."
+        self.assertEqual(self.source._extract_content(doc), f"{expected} {expected}")
+
+    def test_extract_content_matches_skip_patterns_across_line_breaks(self):
+        """Test that skip patterns are checked against whitespace-collapsed paragraphs."""
+        body = "Researchers disclosed a remote code execution flaw affecting millions of routers."
+        doc = lxml.html.document_fromstring(
+            f"<html><body><article><p>{body}</p><p>Subscribe to\n   WIRED for unlimited access</p>"
+            f"<p>{body}</p></article></body></html>"
+        )
+
+        self.assertEqual(self.source._extract_content(doc), f"{body} {body}")
+
+    def test_extract_content_ignores_scripts_styles_and_comments(self):
+        """Test that inline script, style and comment text never reaches the content."""
+        body = "Researchers disclosed a remote code execution flaw affecting millions of routers."
+        doc = lxml.html.document_fromstring(
+            "<html><body><article>"
+            f'<p>Researchers disclosed a remote<script>window.ads = {{"slot": "mid-article"}};</script> code '
+            "execution flaw<style>.ad { display: none; }</style> affecting<!-- tracking pixel --> millions of "
+            "routers.</p>"
+            f"<p>{body}</p></article></body></html>"
+        )
+
+        self.assertEqual(self.source._extract_content(doc), f"{body} {body}")
+
+    def test_extract_content_stops_at_max_chars(self):
+        """Test that paragraph collection stops once max_chars is reached."""
+        paragraphs = [f"Paragraph {i} describes the breach timeline in considerable detail." for i in range(10)]
+        doc = lxml.html.document_fromstring(
+            "<html><body><article>" + "".join(f"<p>{p}</p>" for p in paragraphs) + "</article></body></html>"
+        )
+
+        content = self.source._extract_content(doc, max_chars=150)
+
+        self.assertEqual(content, " ".join(paragraphs[:3]))
+
+    def test_extract_title_and_author_selector_order(self):
+        """Test that title and author XPaths are tried in selector order."""
+        doc = lxml.html.document_fromstring(
+            "<html><head><title>Page Title | WIRED</title></head><body>"
+            '<h1 class="headline ContentHeaderHed">Hackers Hit   Routers</h1>'
+            '<div class="byline"><a href="/by/jane">Jane   Doe</a></div>'
+            "</body></html>"
+        )
+
+        self.assertEqual(self.source._extract_title(doc), "Hackers Hit Routers")
+        self.assertEqual(self.source._extract_author(doc), "Jane Doe")
+
+    def test_extract_content_missing_container(self):
+        """Test that a page without a content container raises ScrapingError."""
+        doc = lxml.html.document_fromstring("<html><body><p>No article here</p></body></html>")
+
+        with self.assertRaises(ScrapingError):
+            self.source._extract_content(doc)
+
+    @patch.object(WiredSource, "_scrape_article")
+    def test_extract_article_uses_cache(self, mock_scrape: MagicMock):
+        """Test that a recently extracted URL is not scraped again."""
+        url = "https://wired.com/cached-article"
+        mock_scrape.return_value = Article(
+            title="Cached", content="x" * 200, url=url, category="security", source="wired"
+        )
+
+        first = self.source._extract_article(url, "security")
+        second = self.source._extract_article(url, "ai")
+
+        mock_scrape.assert_called_once_with(url, "security")
+        self.assertEqual(first.category, "security")
+        self.assertEqual(second.category, "ai")
+        self.assertEqual(second.content, first.content)
+
+    @patch.object(WiredSource, "_scrape_article")
+    def test_extract_article_cache_expires(self, mock_scrape: MagicMock):
+        """Test that a stale cached article is scraped again."""
+        url = "https://wired.com/stale-article"
+        mock_scrape.return_value = Article(title="Fresh", content="x" * 200, url=url, source="wired")
+        self.source._article_cache[url] = (0.0, Article(title="Stale", content="x" * 200, url=url))
+
+        with patch("the_data_packet.sources.wired.time.monotonic", return_value=WiredSource.ARTICLE_CACHE_TTL + 1):
+            article = self.source._extract_article(url, "ai")
+
+        self.assertEqual(article.title, "Fresh")
+        mock_scrape.assert_called_once_with(url, "ai")
+
+    @patch.object(WiredSource, "_scrape_article")
+    def test_extract_article_cache_evicts_least_recently_used(self, mock_scrape: MagicMock):
+        """Test that the article cache stays bounded and drops the least recently used URL."""
+        mock_scrape.side_effect = lambda url, category: Article(title=url, content="x" * 200, url=url)
+        urls = [f"https://wired.com/article-{i}" for i in range(3)]
+
+        with patch.object(WiredSource, "ARTICLE_CACHE_MAX_ENTRIES", 2):
+            self.source._extract_article(urls[0], "ai")
+            self.source._extract_article(urls[1], "ai")
+            self.source._extract_article(urls[0], "ai")
+            self.source._extract_article(urls[2], "ai")
+
+        self.assertEqual(list(self.source._article_cache), [urls[0], urls[2]])
+
+    @patch.object(WiredSource, "_scrape_article")
+    def test_extract_article_cache_drops_expired_entries_on_insert(self, mock_scrape: MagicMock):
+        """Test that caching a new article prunes entries past their TTL."""
+        mock_scrape.side_effect = lambda url, category: Article(title=url, content="x" * 200, url=url)
+        stale_url = "https://wired.com/stale-article"
+        self.source._article_cache[stale_url] = (0.0, Article(title="Stale", content="x" * 200, url=stale_url))
+
+        with patch("the_data_packet.sources.wired.time.monotonic", return_value=WiredSource.ARTICLE_CACHE_TTL + 1):
+            self.source._extract_article("https://wired.com/new-article", "ai")
+
+        self.assertEqual(list(self.source._article_cache), ["https://wired.com/new-article"])
+
+    @patch.object(WiredSource, "_scrape_article")
+    def test_clear_article_cache(self, mock_scrape: MagicMock):
+        """Test that clearing the cache makes the next request scrape again."""
+        url = "https://wired.com/cleared-article"
+        mock_scrape.return_value = Article(title="Article", content="x" * 200, url=url)
+
+        self.source._extract_article(url, "ai")
+        self.source.clear_article_cache()
+        self.source._extract_article(url, "ai")
+
+        self.assertEqual(mock_scrape.call_count, 2)
+
     def test_source_initialization(self):
         """Test that source can be initialized without errors."""
         # This tests that __init__ works and doesn't raise exceptions
@@ -146,6 +379,11 @@ class TestWiredSource(unittest.TestCase):
         self.assertIsNotNone(source)
         self.assertIsInstance(source, WiredSource)
 
+    def test_sources_share_http_client(self):
+        """Test that Wired and TechCrunch sources reuse one HTTP client and connection pool."""
+        self.assertIs(WiredSource().http_client, self.source.http_client)
+        self.assertIs(TechCrunchSource().http_client, self.source.http_client)
+
     def test_category_validation_integration(self):
         """Test category validation with actual supported categories."""
         # Test all supported categories are valid
@@ -1,5 +1,7 @@
 """Unit tests for __init__.py module."""
 
+import subprocess
+import sys
 import unittest
 
 import the_data_packet
@@ -84,6 +86,22 @@ class TestInit(unittest.TestCase):
 
         # Note: Not testing sources/utils/workflows as they may have dependencies
 
+    def test_package_import_loads_only_core(self):
+        """Test that importing the package does not load source, storage or SDK dependencies."""
+        modules = ["anthropic", "google.genai", "boto3", "bs4", "pymongo"]
+        code = f"import sys, the_data_packet; print([m for m in {modules!r} if m in sys.modules])"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_lazy_exports_resolve(self):
+        """Test that lazily exported names resolve to their defining classes."""
+        from the_data_packet.sources.wired import WiredSource
+        from the_data_packet.utils.s3 import S3Storage
+
+        self.assertIs(the_data_packet.WiredSource, WiredSource)
+        self.assertIs(the_data_packet.S3Storage, S3Storage)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+"""Unit tests for utils.cache module."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from the_data_packet.utils.cache import CachedResponse, ResponseCache
+
+
+class TestCachedResponse(unittest.TestCase):
+    """Test cases for CachedResponse dataclass."""
+
+    def test_conditional_headers_both_validators(self):
+        """Test that both validators map to conditional request headers."""
+        entry = CachedResponse(
+            url="https://example.com",
+            data={},
+            etag='"abc"',
+            last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+        )
+
+        self.assertEqual(
+            entry.conditional_headers(),
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+
+    def test_conditional_headers_etag_only(self):
+        """Test that missing validators are omitted."""
+        entry = CachedResponse(url="https://example.com", data={}, etag='"abc"')
+
+        self.assertEqual(entry.conditional_headers(), {"If-None-Match": '"abc"'})
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name) / "cache"
+        self.cache = ResponseCache(self.cache_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_get_missing_entry(self):
+        """Test that an unknown URL is a cache miss."""
+        self.assertIsNone(self.cache.get("https://example.com/missing"))
+
+    def test_set_and_get_round_trip(self):
+        """Test storing and loading an entry."""
+        data = {"title": "Title", "content": "Body"}
+        self.cache.set("https://example.com/a", data, etag='"v1"')
+
+        entry = self.cache.get("https://example.com/a")
+
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry.data, data)
+        self.assertEqual(entry.etag, '"v1"')
+        self.assertIsNone(entry.last_modified)
+
+    def test_set_creates_missing_parent_directories(self):
+        """Test that the first write creates the cache directory and its parents."""
+        cache_dir = Path(self.temp_dir.name) / "output" / "cache" / "wired"
+        cache = ResponseCache(cache_dir)
+
+        cache.set("https://example.com/a", {"title": "Title"}, etag='"v1"')
+
+        self.assertTrue(cache_dir.is_dir())
+        self.assertIsNotNone(cache.get("https://example.com/a"))
+
+    def test_set_without_validators_is_skipped(self):
+        """Test that entries which cannot be revalidated are not stored."""
+        self.cache.set("https://example.com/a", {"title": "Title"})
+
+        self.assertFalse(self.cache_dir.exists())
+        self.assertIsNone(self.cache.get("https://example.com/a"))
+
+    def test_corrupt_entry_is_a_miss(self):
+        """Test that an unreadable entry is treated as a miss."""
+        url = "https://example.com/a"
+        self.cache.set(url, {"title": "Title"}, etag='"v1"')
+        self.cache._path_for(url).write_text("{not json", encoding="utf-8")
+
+        self.assertIsNone(self.cache.get(url))
+
+
+if __name__ == "__main__":
+    unittest.main()
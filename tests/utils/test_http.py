@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 import requests
 from bs4 import BeautifulSoup
 
-from the_data_packet.core.exceptions import NetworkError
+from the_data_packet.core.exceptions import NetworkError, ScrapingError
 from the_data_packet.utils.http import HTTPClient
 
 
@@ -28,6 +28,7 @@ class TestHTTPClient(unittest.TestCase):
 
         self.assertEqual(client.timeout, 30)
         self.assertEqual(client.user_agent, "Test User Agent")
+        self.assertEqual(client.parser, "lxml")
         self.assertIsInstance(client.session, requests.Session)
 
     @patch("the_data_packet.core.config.get_config")
@@ -54,6 +55,30 @@ class TestHTTPClient(unittest.TestCase):
         self.assertIn("Accept-Encoding", client.session.headers)
         self.assertIn("Connection", client.session.headers)
 
+    @patch("the_data_packet.core.config.get_config")
+    def test_accept_encoding_includes_brotli(self, mock_get_config):
+        """Test that Brotli is advertised since the brotli decoder is a dependency."""
+        mock_get_config.return_value = self.mock_config
+
+        client = HTTPClient()
+
+        encodings = client.session.headers["Accept-Encoding"].split(",")
+        self.assertIn("br", encodings)
+        self.assertIn("gzip", encodings)
+
+    @patch("the_data_packet.core.config.get_config")
+    def test_session_adapter_pool_and_retries(self, mock_get_config):
+        """Test that both schemes use a pooled adapter with a retry policy."""
+        mock_get_config.return_value = self.mock_config
+
+        client = HTTPClient()
+
+        for prefix in ("https://", "http://"):
+            adapter = client.session.get_adapter(f"{prefix}example.com")
+            self.assertEqual(adapter._pool_maxsize, HTTPClient.POOL_SIZE)
+            self.assertEqual(adapter.max_retries.total, 3)
+            self.assertIn(503, adapter.max_retries.status_forcelist)
+
     @patch("the_data_packet.core.config.get_config")
     @patch("requests.Session.get")
     def test_get_success(self, mock_session_get, mock_get_config):
@@ -144,14 +169,18 @@ class TestHTTPClient(unittest.TestCase):
 
         # Mock response with HTML content
         mock_response = Mock()
-        mock_response.content = b"<html><body><h1>Test</h1></body></html>"
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [b"<html><body><h1>Test</h1></body></html>"]
         mock_get.return_value = mock_response
 
         client = HTTPClient()
         soup = client.get_soup("https://example.com")
 
         self.assertIsInstance(soup, BeautifulSoup)
-        mock_get.assert_called_once_with("https://example.com")
+        self.assertEqual(soup.original_encoding, "utf-8")
+        mock_get.assert_called_once_with("https://example.com", stream=True)
+        mock_response.close.assert_called_once()
 
         # Check that we can parse the HTML
         h1_tag = soup.find("h1")
@@ -165,13 +194,102 @@ class TestHTTPClient(unittest.TestCase):
         mock_get_config.return_value = self.mock_config
 
         mock_response = Mock()
-        mock_response.content = b"<html><body>Test</body></html>"
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [b"<html><body>Test</body></html>"]
         mock_get.return_value = mock_response
 
         client = HTTPClient()
         client.get_soup("https://example.com", headers={"Custom": "Header"})
 
-        mock_get.assert_called_once_with("https://example.com", headers={"Custom": "Header"})
+        mock_get.assert_called_once_with("https://example.com", headers={"Custom": "Header"}, stream=True)
+
+    @patch("the_data_packet.core.config.get_config")
+    @patch.object(HTTPClient, "get")
+    def test_get_soup_custom_parser(self, mock_get, mock_get_config):
+        """Test that get_soup uses the parser chosen at construction."""
+        mock_get_config.return_value = self.mock_config
+
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [b"<html><body><p>Test</p></body></html>"]
+        mock_get.return_value = mock_response
+
+        client = HTTPClient(parser="html.parser")
+        with patch("the_data_packet.utils.http.BeautifulSoup") as mock_bs:
+            client.get_soup("https://example.com")
+
+        mock_bs.assert_called_once_with(b"<html><body><p>Test</p></body></html>", "html.parser", from_encoding=None)
+
+    @patch("the_data_packet.core.config.get_config")
+    @patch.object(HTTPClient, "get")
+    def test_get_lxml_success(self, mock_get, mock_get_config):
+        """Test that get_lxml parses the body with the declared charset."""
+        mock_get_config.return_value = self.mock_config
+
+        mock_response = Mock()
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        mock_response.encoding = "utf-8"
+        body = "<html><body><h1>Caf\u00e9</h1></body></html>".encode("utf-8")
+        # Split inside the multi-byte character to exercise incremental decoding
+        mock_response.iter_content.return_value = [body[:20], body[20:]]
+        mock_get.return_value = mock_response
+
+        client = HTTPClient()
+        doc = client.get_lxml("https://example.com")
+
+        self.assertEqual(doc.findtext(".//h1"), "Caf\u00e9")
+        mock_get.assert_called_once_with("https://example.com", stream=True)
+        mock_response.close.assert_called_once()
+
+    @patch("the_data_packet.core.config.get_config")
+    @patch.object(HTTPClient, "get")
+    def test_get_lxml_empty_body(self, mock_get, mock_get_config):
+        """Test that an empty body raises ScrapingError."""
+        mock_get_config.return_value = self.mock_config
+
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = []
+        mock_get.return_value = mock_response
+
+        client = HTTPClient()
+
+        with self.assertRaises(ScrapingError):
+            client.get_lxml("https://example.com")
+
+    @patch("the_data_packet.core.config.get_config")
+    @patch.object(HTTPClient, "get")
+    def test_get_bounded_truncates(self, mock_get, mock_get_config):
+        """Test that get_bounded stops reading once the byte limit is reached."""
+        mock_get_config.return_value = self.mock_config
+
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = iter([b"a" * 10, b"b" * 10, b"c" * 10])
+        mock_get.return_value = mock_response
+
+        client = HTTPClient()
+        body = client.get_bounded("https://example.com", max_bytes=15)
+
+        self.assertEqual(body, b"a" * 10 + b"b" * 5)
+        mock_response.close.assert_called_once()
+
+    @patch("the_data_packet.core.config.get_config")
+    @patch.object(HTTPClient, "get")
+    def test_get_soup_ignores_implicit_encoding(self, mock_get, mock_get_config):
+        """Test that an encoding not declared in Content-Type is not forced on the parser."""
+        mock_get_config.return_value = self.mock_config
+
+        mock_response = Mock()
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_response.encoding = "ISO-8859-1"
+        mock_response.iter_content.return_value = ["<html><body>caf\u00e9</body></html>".encode("utf-8")]
+        mock_get.return_value = mock_response
+
+        client = HTTPClient()
+        soup = client.get_soup("https://example.com")
+
+        self.assertEqual(soup.body.get_text(), "caf\u00e9")
 
     @patch("the_data_packet.core.config.get_config")
     @patch.object(HTTPClient, "get")
@@ -1,18 +1,26 @@
 """Tests for utils.loki module."""
 
+import gzip
 import json
 import tempfile
+import threading
+import time
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import requests
+import snappy
 
 from the_data_packet.utils.loki import (
     JsonEncoder,
     LogUploadError,
     LokiUploader,
+    _encode_json_push_request,
+    _encode_labels,
+    _encode_push_request,
+    _varint,
     upload_logs_to_loki,
 )
 
@@ -143,7 +151,7 @@ class TestLokiUploader(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "URL, user, and api_key are required"):
             LokiUploader(url=None, user="test_user", api_key="test_key")
 
-    @patch("the_data_packet.utils.loki.requests.post")
+    @patch("the_data_packet.utils.loki.requests.Session.post")
     def test_upload_from_file_success(self, mock_post):
         """Test successful upload from file."""
         # Setup mock response
@@ -183,8 +191,11 @@ class TestLokiUploader(unittest.TestCase):
             # Verify request was made
             mock_post.assert_called_once()
             call_args = mock_post.call_args
-            self.assertEqual(call_args[1]["auth"], ("test_user", "test_key"))
+            self.assertEqual(uploader.session.auth, ("test_user", "test_key"))
+            self.assertEqual(uploader.session.headers["Content-Type"], "application/json")
             self.assertEqual(call_args[1]["timeout"], 30)
+            self.assertEqual(call_args[1]["headers"], {"Content-Type": "application/x-protobuf"})
+            self.assertIn(b'service_name="the_data_packet"', snappy.decompress(call_args[1]["data"]))
 
         finally:
             temp_path.unlink()
@@ -200,7 +211,7 @@ class TestLokiUploader(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             uploader.upload_from_file(Path("nonexistent_file.jsonl"))
 
-    @patch("the_data_packet.utils.loki.requests.post")
+    @patch("the_data_packet.utils.loki.requests.Session.post")
     def test_upload_from_file_empty_file(self, mock_post):
         """Test upload from empty file."""
         # Create empty test log file
@@ -223,7 +234,7 @@ class TestLokiUploader(unittest.TestCase):
         finally:
             temp_path.unlink()
 
-    @patch("the_data_packet.utils.loki.requests.post")
+    @patch("the_data_packet.utils.loki.requests.Session.post")
     def test_upload_from_file_http_error(self, mock_post):
         """Test upload from file with HTTP error."""
         # Setup mock response with error
@@ -255,7 +266,7 @@ class TestLokiUploader(unittest.TestCase):
         finally:
             temp_path.unlink()
 
-    @patch("the_data_packet.utils.loki.requests.post")
+    @patch("the_data_packet.utils.loki.requests.Session.post")
     def test_upload_logs_success(self, mock_post):
         """Test successful upload of logs."""
         # Setup mock response
@@ -285,6 +296,262 @@ class TestLokiUploader(unittest.TestCase):
         # Verify request was made
         mock_post.assert_called_once()
 
+    def test_uploads_reuse_session(self):
+        """Test that repeated uploads go through the same HTTP session."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+        )
+        logs = [{"timestamp": "2023-12-27T12:30:45Z", "level": "INFO", "message": "Test"}]
+
+        with patch.object(uploader.session, "post", return_value=Mock(ok=True)) as mock_post:
+            uploader.upload_logs(logs)
+            uploader.upload_logs(logs)
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_upload_logs_splits_into_batches(self):
+        """Test that uploads are pushed in batches sharing one trace_id."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            batch_size=2,
+            push_format="json",
+        )
+        logs = [{"timestamp": "2023-12-27T12:30:45Z", "message": f"Test {i}"} for i in range(5)]
+
+        with patch.object(uploader.session, "post", return_value=Mock(ok=True)) as mock_post:
+            result = uploader.upload_logs(logs)
+
+        self.assertEqual(result, 5)
+        streams = [json.loads(gzip.decompress(call[1]["data"]))["streams"][0] for call in mock_post.call_args_list]
+        self.assertEqual([len(stream["values"]) for stream in streams], [2, 2, 1])
+        self.assertEqual(len({stream["stream"]["trace_id"] for stream in streams}), 1)
+
+    def test_upload_from_file_streams_entries_into_batches(self):
+        """Test that file uploads stream entries into batches without loading the file first."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            for i in range(3):
+                f.write(json.dumps({"timestamp": "2023-12-27T12:30:45Z", "message": f"Test {i}"}) + "\n")
+            f.write("not json\n")
+            temp_path = Path(f.name)
+        self.addCleanup(temp_path.unlink)
+
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            batch_size=2,
+            push_format="json",
+        )
+
+        with patch.object(uploader, "_read_log_file") as mock_read:
+            with patch.object(uploader.session, "post", return_value=Mock(ok=True)) as mock_post:
+                result = uploader.upload_from_file(temp_path)
+
+        self.assertEqual(result, 3)
+        self.assertEqual(
+            [
+                len(json.loads(gzip.decompress(call[1]["data"]))["streams"][0]["values"])
+                for call in mock_post.call_args_list
+            ],
+            [2, 1],
+        )
+        mock_read.assert_not_called()
+
+    def test_upload_logs_bounds_concurrent_pushes(self):
+        """Test that pushes overlap but never exceed max_concurrent in flight."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            batch_size=1,
+            max_concurrent=3,
+        )
+        logs = [{"timestamp": "2023-12-27T12:30:45Z", "message": f"Test {i}"} for i in range(9)]
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def post(**kwargs):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.pop()
+            return Mock(ok=True)
+
+        with patch.object(uploader.session, "post", side_effect=post) as mock_post:
+            result = uploader.upload_logs(logs)
+
+        self.assertEqual(result, 9)
+        self.assertEqual(mock_post.call_count, 9)
+        self.assertGreater(max(peak), 1)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_upload_logs_stops_after_failed_push(self):
+        """Test that no further batches are sent once a push has failed."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            batch_size=1,
+            max_concurrent=1,
+        )
+        logs = [{"timestamp": "2023-12-27T12:30:45Z", "message": f"Test {i}"} for i in range(5)]
+
+        with patch.object(
+            uploader.session, "post", side_effect=[Mock(ok=True), requests.ConnectionError("reset")]
+        ) as mock_post:
+            with self.assertRaises(LogUploadError) as cm:
+                uploader.upload_logs(logs)
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertIn("after 1 entries", str(cm.exception))
+
+    def test_iter_batches_respects_max_bytes(self):
+        """Test that batches close before exceeding max_bytes, keeping oversized entries alone."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            max_bytes=10,
+        )
+        entries = [["1", "abcd"], ["2", "abcd"], ["3", "x" * 20], ["4", "ab"]]
+
+        batches = list(uploader._iter_batches(entries))
+
+        self.assertEqual(batches, [[["1", "abcd"], ["2", "abcd"]], [["3", "x" * 20]], [["4", "ab"]]])
+
+    def test_upload_logs_reports_partial_failure(self):
+        """Test that a failed batch reports how many entries were already uploaded."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            batch_size=2,
+            push_format="json",
+        )
+        logs = [{"timestamp": "2023-12-27T12:30:45Z", "message": f"Test {i}"} for i in range(4)]
+        failed = Mock(ok=False, status_code=500, reason="Server Error")
+        failed.json.return_value = {}
+
+        with patch.object(uploader.session, "post", side_effect=[Mock(ok=True), failed]):
+            with self.assertRaises(LogUploadError) as cm:
+                uploader.upload_logs(logs)
+
+        self.assertIn("after 2 entries", str(cm.exception))
+
+    def test_upload_logs_without_compression(self):
+        """Test that compression="none" sends the plain JSON body."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            compression="none",
+            push_format="json",
+        )
+        logs = [{"timestamp": "2023-12-27T12:30:45Z", "message": "Test"}]
+
+        with patch.object(uploader.session, "post", return_value=Mock(ok=True)) as mock_post:
+            uploader.upload_logs(logs)
+
+        self.assertEqual(mock_post.call_args[1]["headers"], {})
+        self.assertEqual(len(json.loads(mock_post.call_args[1]["data"])["streams"][0]["values"]), 1)
+
+    def test_upload_logs_json_is_gzipped(self):
+        """Test that JSON pushes are gzip-compressed by default."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            push_format="json",
+        )
+        logs = [{"timestamp": "2023-12-27T12:30:45Z", "message": "Test"}]
+
+        with patch.object(uploader.session, "post", return_value=Mock(ok=True)) as mock_post:
+            uploader.upload_logs(logs)
+
+        self.assertEqual(mock_post.call_args[1]["headers"], {"Content-Encoding": "gzip"})
+        payload = json.loads(gzip.decompress(mock_post.call_args[1]["data"]))
+        self.assertEqual(payload["streams"][0]["stream"]["service_name"], "the_data_packet")
+
+    def test_init_rejects_unsupported_push_format(self):
+        """Test that unknown push formats are rejected."""
+        with self.assertRaises(ValueError):
+            LokiUploader(url="https://loki.example.com", user="u", api_key="k", push_format="msgpack")
+
+    def test_init_rejects_unsupported_compression(self):
+        """Test that unknown compression values are rejected."""
+        with self.assertRaises(ValueError):
+            LokiUploader(url="https://loki.example.com", user="u", api_key="k", compression="snappy")
+
+    def test_init_rejects_non_positive_batch_limits(self):
+        """Test that batch limits must be positive."""
+        with self.assertRaises(ValueError):
+            LokiUploader(url="https://loki.example.com", user="u", api_key="k", batch_size=0)
+
+    def test_session_retries_transient_push_failures(self):
+        """Test that the session adapter pools connections and retries POSTs."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+        )
+
+        adapter = uploader.session.get_adapter(uploader.url)
+        retries = adapter.max_retries
+
+        self.assertEqual(adapter._pool_maxsize, LokiUploader.POOL_SIZE)
+        self.assertEqual(retries.total, 5)
+        self.assertIn(503, retries.status_forcelist)
+        self.assertTrue(retries.is_retry("POST", 503))
+        self.assertTrue(retries.is_retry("POST", 429, has_retry_after=True))
+        self.assertTrue(retries.respect_retry_after_header)
+
+    def test_plain_http_endpoint_uses_retrying_adapter(self):
+        """Test that http:// Loki URLs get the same pooled, retrying adapter as https://."""
+        uploader = LokiUploader(
+            url="http://loki.internal:3100/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+        )
+
+        adapter = uploader.session.get_adapter(uploader.url)
+
+        self.assertIs(adapter, uploader.session.get_adapter("https://loki.example.com"))
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter._pool_maxsize, LokiUploader.POOL_SIZE)
+
+    def test_pool_holds_a_connection_per_concurrent_push(self):
+        """Test that the connection pool grows with max_concurrent."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            max_concurrent=LokiUploader.POOL_SIZE + 6,
+        )
+
+        adapter = uploader.session.get_adapter(uploader.url)
+
+        self.assertEqual(adapter._pool_maxsize, LokiUploader.POOL_SIZE + 6)
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving a with block closes the HTTP session."""
+        with patch("the_data_packet.utils.loki.requests.Session.close") as mock_close:
+            with LokiUploader(
+                url="https://loki.example.com/loki/api/v1/push",
+                user="test_user",
+                api_key="test_key",
+            ) as uploader:
+                self.assertIsInstance(uploader, LokiUploader)
+                mock_close.assert_not_called()
+
+        mock_close.assert_called_once()
+
     def test_upload_logs_empty_list(self):
         """Test upload of empty logs list."""
         uploader = LokiUploader(
@@ -356,6 +623,23 @@ class TestLokiUploader(unittest.TestCase):
         finally:
             temp_path.unlink()
 
+    def test_read_log_file_handles_crlf_blank_lines_and_utf8(self):
+        """Test that CRLF endings, whitespace-only lines, and UTF-8 text are read correctly."""
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".jsonl", delete=False) as f:
+            f.write(b'{"message": "caf\xc3\xa9"}\r\n   \r\n\n{"message": "second"}')
+            temp_path = Path(f.name)
+        self.addCleanup(temp_path.unlink)
+
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+        )
+
+        logs = uploader._read_log_file(temp_path)
+
+        self.assertEqual(logs, [{"message": "caf\u00e9"}, {"message": "second"}])
+
     def test_format_logs_for_loki(self):
         """Test formatting logs for Loki."""
         uploader = LokiUploader(
@@ -387,6 +671,57 @@ class TestLokiUploader(unittest.TestCase):
         self.assertEqual(parsed_log["level"], "INFO")
         self.assertEqual(parsed_log["message"], "Test message")
 
+    def test_format_logs_for_loki_matches_json_encoder_output(self):
+        """Test that formatted lines decode to the same values JsonEncoder produces."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+        )
+        log = {"timestamp": "2023-12-27T12:30:45.123456+00:00", "created": datetime(2023, 1, 1), "count": 3}
+
+        [[_, log_line]] = uploader._format_logs_for_loki([dict(log)])
+
+        self.assertEqual(json.loads(log_line), json.loads(json.dumps(log, cls=JsonEncoder)))
+
+    def test_format_logs_for_loki_exact_nanoseconds(self):
+        """Test that naive, Z, and offset timestamps map to exact UTC epoch nanoseconds."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+        )
+        logs = [
+            {"timestamp": "2023-12-27T12:30:45.123457"},
+            {"timestamp": "2023-12-27T12:30:45.123457Z"},
+            {"timestamp": "2023-12-27T12:30:45.123457+02:00"},
+            {"timestamp": datetime(2023, 12, 27, 12, 30, 45, 123457)},
+        ]
+
+        result = uploader._format_logs_for_loki(logs)
+
+        self.assertEqual([timestamp for timestamp, _ in result], ["1703680245123457000"] * 4)
+        self.assertEqual(json.loads(result[0][1])["timestamp"], "2023-12-27T12:30:45.123457+00:00")
+
+    def test_format_logs_for_loki_stdlib_parser_fallback(self):
+        """Test that timestamps parse the same without the optional ciso8601 parser."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+        )
+        logs = [
+            {"timestamp": "2023-12-27T12:30:45.123457"},
+            {"timestamp": "2023-12-27T12:30:45.123457Z"},
+            {"timestamp": "2023-12-27T12:30:45.123457+02:00"},
+            {"timestamp": "invalid-timestamp"},
+        ]
+
+        with patch("the_data_packet.utils.loki._parse_iso", datetime.fromisoformat):
+            result = uploader._format_logs_for_loki(logs)
+
+        self.assertEqual([timestamp for timestamp, _ in result], ["1703680245123457000"] * 3)
+
     def test_format_logs_for_loki_with_invalid_timestamp(self):
         """Test formatting logs with invalid timestamp."""
         uploader = LokiUploader(
@@ -408,6 +743,78 @@ class TestLokiUploader(unittest.TestCase):
         self.assertEqual(len(result), 0)
 
 
+class TestEncodePushRequest(unittest.TestCase):
+    """Test cases for the logproto PushRequest encoder."""
+
+    def test_encode_push_request(self):
+        """Test encoding against hand-assembled protobuf bytes."""
+        payload = {"streams": [{"stream": {"b": "2", "a": "1"}, "values": [["1000000002", "hi"]]}]}
+
+        labels = b'{a="1", b="2"}'
+        entry = b"\x0a\x04\x08\x01\x10\x02" + b"\x12\x02hi"
+        stream = b"\x0a" + bytes([len(labels)]) + labels + b"\x12" + bytes([len(entry)]) + entry
+        expected = b"\x0a" + bytes([len(stream)]) + stream
+
+        self.assertEqual(_encode_push_request(payload), expected)
+
+    def test_encode_push_request_escapes_label_values(self):
+        """Test that quotes in label values are escaped."""
+        payload = {"streams": [{"stream": {"service_name": 'a"b'}, "values": []}]}
+
+        self.assertIn(b'{service_name="a\\"b"}', _encode_push_request(payload))
+
+    def test_labels_encoded_once_per_upload(self):
+        """Test that batches of one upload reuse the memoized labels field."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+            batch_size=1,
+        )
+        logs = [{"timestamp": "2023-12-27T12:30:45Z", "message": f"Test {i}"} for i in range(3)]
+        _encode_labels.cache_clear()
+
+        with patch.object(uploader.session, "post", return_value=Mock(ok=True)):
+            uploader.upload_logs(logs)
+
+        info = _encode_labels.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    def test_varint_multi_byte(self):
+        """Test varints spanning several bytes."""
+        self.assertEqual(_varint(300), b"\xac\x02")
+        self.assertEqual(_varint(0), b"\x00")
+
+
+class TestEncodeJsonPushRequest(unittest.TestCase):
+    """Test cases for the spliced JSON push body."""
+
+    def test_matches_full_serialization(self):
+        """Test that the spliced body decodes to the original payload."""
+        uploader = LokiUploader(
+            url="https://loki.example.com/loki/api/v1/push",
+            user="test_user",
+            api_key="test_key",
+        )
+        values = [["1703680245123457000", '{"message": "a \\"quoted\\" line"}'], ["1703680246000000000", "{}"]]
+        payload = uploader._create_loki_payload(values, "svc", "test", trace_id="t-1")
+
+        body = _encode_json_push_request(payload)
+
+        self.assertEqual(json.loads(body), payload)
+
+    def test_multiple_streams(self):
+        """Test that each stream gets its own header and values."""
+        payload = {
+            "streams": [
+                {"stream": {"service_name": "a"}, "values": [["1", "x"]]},
+                {"stream": {"service_name": "b"}, "values": []},
+            ]
+        }
+
+        self.assertEqual(json.loads(_encode_json_push_request(payload)), payload)
+
+
 class TestUploadLogsToLoki(unittest.TestCase):
     """Test cases for upload_logs_to_loki convenience function."""
 
@@ -442,6 +849,7 @@ class TestUploadLogsToLoki(unittest.TestCase):
 
         # Verify upload_from_file was called
         mock_uploader.upload_from_file.assert_called_once_with(test_path)
+        mock_uploader.close.assert_called_once()
 
         # Verify return value
         self.assertEqual(result, 5)
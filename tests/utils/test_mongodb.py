@@ -3,6 +3,10 @@
 import unittest
 from unittest.mock import Mock, patch
 
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from the_data_packet.utils import mongodb
 from the_data_packet.utils.mongodb import MongoDBClient
 
 
@@ -15,6 +19,13 @@ class TestMongoDBClient(unittest.TestCase):
         self.password = "test_password"
         self.test_collection = "test_collection"
         self.test_document = {"_id": "123", "name": "test", "value": 42}
+        mongodb._client_cache.clear()
+        mongodb._unique_indexes.clear()
+
+    def tearDown(self):
+        """Drop pooled clients so each test sees a fresh MongoClient."""
+        mongodb._client_cache.clear()
+        mongodb._unique_indexes.clear()
 
     @patch("the_data_packet.utils.mongodb.MongoClient")
     def test_init_creates_client_and_database(self, mock_mongo_client):
@@ -74,6 +85,43 @@ class TestMongoDBClient(unittest.TestCase):
         mock_collection.insert_one.assert_called_once_with(self.test_document)
         self.assertEqual(result, mock_insert_result)
 
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_fire_and_forget_insert_uses_unacknowledged_write(self, mock_mongo_client):
+        """Test that fire_and_forget_insert sends insert_one with write concern w=0."""
+        mock_client_instance = Mock()
+        mock_database = Mock()
+        mock_collection = Mock()
+
+        mock_client_instance.the_data_packet = mock_database
+        mock_database.__getitem__ = Mock(return_value=mock_collection)
+        mock_mongo_client.return_value = mock_client_instance
+
+        client = MongoDBClient(self.username, self.password)
+        client.fire_and_forget_insert(self.test_collection, self.test_document)
+
+        write_concern = mock_collection.with_options.call_args.kwargs["write_concern"]
+        self.assertFalse(write_concern.acknowledged)
+        mock_collection.with_options.return_value.insert_one.assert_called_once_with(self.test_document)
+        mock_collection.insert_one.assert_not_called()
+
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_bulk_write_is_unordered_by_default(self, mock_mongo_client):
+        """Test that bulk_write forwards operations unordered."""
+        mock_client_instance = Mock()
+        mock_database = Mock()
+        mock_collection = Mock()
+
+        mock_client_instance.the_data_packet = mock_database
+        mock_database.__getitem__ = Mock(return_value=mock_collection)
+        mock_mongo_client.return_value = mock_client_instance
+
+        operations = [InsertOne(self.test_document), DeleteOne({"_id": "old"})]
+        client = MongoDBClient(self.username, self.password)
+        result = client.bulk_write(self.test_collection, operations)
+
+        mock_collection.bulk_write.assert_called_once_with(operations, ordered=False)
+        self.assertEqual(result, mock_collection.bulk_write.return_value)
+
     @patch("the_data_packet.utils.mongodb.MongoClient")
     def test_find_documents_calls_collection_find(self, mock_mongo_client):
         """Test that find_documents calls the collection's find method."""
@@ -136,19 +184,137 @@ class TestMongoDBClient(unittest.TestCase):
         self.assertEqual(result, mock_cursor)
 
     @patch("the_data_packet.utils.mongodb.MongoClient")
-    def test_close_calls_client_close(self, mock_mongo_client):
-        """Test that close calls the client's close method."""
+    def test_insert_new_documents_upserts_and_returns_new_keys(self, mock_mongo_client):
+        """Test that documents are upserted by key and only inserted keys are returned."""
+        mock_client_instance = Mock()
+        mock_database = Mock()
+        mock_collection = Mock()
+
+        mock_client_instance.the_data_packet = mock_database
+        mock_database.__getitem__ = Mock(return_value=mock_collection)
+        mock_collection.bulk_write.return_value = Mock(upserted_ids={1: "id-b"})
+        mock_mongo_client.return_value = mock_client_instance
+
+        documents = [{"url": "https://example.com/a"}, {"url": "https://example.com/b"}]
+        client = MongoDBClient(self.username, self.password)
+        new_keys = client.insert_new_documents(self.test_collection, documents, key="url")
+
+        self.assertEqual(new_keys, {"https://example.com/b"})
+        mock_collection.create_index.assert_called_once_with("url", unique=True)
+        operations = mock_collection.bulk_write.call_args.args[0]
+        self.assertEqual(
+            operations[0],
+            UpdateOne({"url": "https://example.com/a"}, {"$setOnInsert": documents[0]}, upsert=True),
+        )
+        self.assertEqual(mock_collection.bulk_write.call_args.kwargs, {"ordered": False})
+
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_ensure_unique_index_once_per_process(self, mock_mongo_client):
+        """Test that the unique index is only requested once."""
+        mock_client_instance = Mock()
+        mock_database = Mock()
+        mock_collection = Mock()
+
+        mock_client_instance.the_data_packet = mock_database
+        mock_database.__getitem__ = Mock(return_value=mock_collection)
+        mock_mongo_client.return_value = mock_client_instance
+
+        client = MongoDBClient(self.username, self.password)
+        client.ensure_unique_index(self.test_collection, "url")
+        client.ensure_unique_index(self.test_collection, "url")
+
+        mock_collection.create_index.assert_called_once_with("url", unique=True)
+
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_ensure_unique_index_with_existing_duplicates(self, mock_mongo_client):
+        """Test that existing duplicates log how to clean them up and are retried next time."""
         mock_client_instance = Mock()
         mock_database = Mock()
+        mock_collection = Mock()
+
+        mock_client_instance.the_data_packet = mock_database
+        mock_database.__getitem__ = Mock(return_value=mock_collection)
+        mock_collection.create_index.side_effect = OperationFailure("E11000 duplicate key error", code=11000)
+        mock_mongo_client.return_value = mock_client_instance
+
+        client = MongoDBClient(self.username, self.password)
+        with self.assertLogs("the_data_packet.utils.mongodb", level="WARNING") as cm:
+            client.ensure_unique_index(self.test_collection, "url")
+        client.ensure_unique_index(self.test_collection, "url")
+
+        self.assertIn("duplicate values", cm.output[0])
+        self.assertIn("db.test_collection.aggregate", cm.output[0])
+        self.assertEqual(mock_collection.create_index.call_count, 2)
+
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_insert_new_documents_concurrent_duplicate(self, mock_mongo_client):
+        """Test that a duplicate-key race counts the document as not new."""
+        mock_client_instance = Mock()
+        mock_database = Mock()
+        mock_collection = Mock()
 
         mock_client_instance.the_data_packet = mock_database
+        mock_database.__getitem__ = Mock(return_value=mock_collection)
+        mock_collection.bulk_write.side_effect = BulkWriteError(
+            {
+                "writeErrors": [{"index": 0, "code": 11000, "errmsg": "duplicate"}],
+                "upserted": [{"index": 1, "_id": "id-b"}],
+            }
+        )
+        mock_mongo_client.return_value = mock_client_instance
+
+        documents = [{"url": "https://example.com/a"}, {"url": "https://example.com/b"}]
+        client = MongoDBClient(self.username, self.password)
+
+        self.assertEqual(
+            client.insert_new_documents(self.test_collection, documents, key="url"), {"https://example.com/b"}
+        )
+
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_close_keeps_shared_pool_open(self, mock_mongo_client):
+        """Test that close leaves the shared client's pool open."""
+        mock_client_instance = Mock()
         mock_mongo_client.return_value = mock_client_instance
 
         client = MongoDBClient(self.username, self.password)
         client.close()
 
-        # Verify client.close was called
-        mock_client_instance.close.assert_called_once()
+        mock_client_instance.close.assert_not_called()
+
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_instances_share_mongo_client(self, mock_mongo_client):
+        """Test that instances with the same credentials reuse one MongoClient."""
+        first = MongoDBClient(self.username, self.password)
+        first.close()
+        second = MongoDBClient(self.username, self.password)
+
+        mock_mongo_client.assert_called_once()
+        mock_mongo_client.return_value.admin.command.assert_called_once_with("ping")
+        self.assertIs(first.client, second.client)
+
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_different_credentials_get_separate_clients(self, mock_mongo_client):
+        """Test that the client cache is keyed by credentials."""
+        mock_mongo_client.side_effect = [Mock(), Mock()]
+
+        first = MongoDBClient(self.username, self.password)
+        second = MongoDBClient("other_user", self.password)
+
+        self.assertEqual(mock_mongo_client.call_count, 2)
+        self.assertIsNot(first.client, second.client)
+
+    @patch("the_data_packet.utils.mongodb.MongoClient")
+    def test_failed_connection_is_not_cached(self, mock_mongo_client):
+        """Test that a client whose ping fails is not reused."""
+        failing = Mock()
+        failing.admin.command.side_effect = ConnectionError("unreachable")
+        mock_mongo_client.side_effect = [failing, Mock()]
+
+        with self.assertRaises(ConnectionError):
+            MongoDBClient(self.username, self.password)
+        MongoDBClient(self.username, self.password)
+
+        self.assertEqual(mock_mongo_client.call_count, 2)
 
     @patch("the_data_packet.utils.mongodb.MongoClient")
     def test_connection_string_format(self, mock_mongo_client):
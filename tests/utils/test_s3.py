@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from the_data_packet.core.exceptions import ConfigurationError
+from the_data_packet.utils import s3
 from the_data_packet.utils.s3 import S3Storage, S3UploadResult
 
 
@@ -55,6 +56,26 @@ class TestS3Storage(unittest.TestCase):
         self.mock_config.aws_region = "us-east-1"
         self.mock_config.aws_access_key_id = "test-access-key"
         self.mock_config.aws_secret_access_key = "test-secret-key"
+        s3._client_cache.clear()
+
+    def tearDown(self):
+        """Drop S3 clients cached by the test."""
+        s3._client_cache.clear()
+
+    @patch("the_data_packet.utils.s3.get_config")
+    @patch("boto3.client")
+    def test_init_reuses_client_per_region_and_credentials(self, mock_boto3_client, mock_get_config):
+        """Test that storages with the same region and credentials share one boto3 client."""
+        mock_get_config.return_value = self.mock_config
+        mock_boto3_client.side_effect = lambda *args, **kwargs: Mock()
+
+        first = S3Storage()
+        second = S3Storage()
+        other_region = S3Storage(region="eu-west-1")
+
+        self.assertIs(first.s3_client, second.s3_client)
+        self.assertIsNot(first.s3_client, other_region.s3_client)
+        self.assertEqual(mock_boto3_client.call_count, 2)
 
     def test_init_missing_bucket_name_raises_error(self):
         """Test that missing bucket name raises ConfigurationError."""
@@ -182,6 +203,12 @@ class TestS3Storage(unittest.TestCase):
                 # Verify S3 upload was called
                 mock_s3_client.upload_file.assert_called_once()
 
+                # Verify the multipart transfer settings were passed
+                transfer_config = mock_s3_client.upload_file.call_args.kwargs["Config"]
+                self.assertEqual(transfer_config.multipart_chunksize, S3Storage.MULTIPART_CHUNK_SIZE)
+                self.assertEqual(transfer_config.max_concurrency, S3Storage.MAX_CONCURRENCY)
+                self.assertTrue(transfer_config.use_threads)
+
     @patch("the_data_packet.utils.s3.get_config")
     @patch("boto3.client")
     def test_upload_file_with_content_type(self, mock_boto3_client, mock_get_config):
@@ -263,33 +290,36 @@ class TestS3Storage(unittest.TestCase):
 
     @patch("the_data_packet.utils.s3.get_config")
     @patch("boto3.client")
-    def test_test_credentials_success(self, mock_boto3_client, mock_get_config):
-        """Test successful credential testing."""
+    def test_init_makes_no_requests(self, mock_boto3_client, mock_get_config):
+        """Test that initialization does not probe credentials over the network."""
         mock_get_config.return_value = self.mock_config
         mock_s3_client = Mock()
-        mock_s3_client.head_bucket.return_value = {}
         mock_boto3_client.return_value = mock_s3_client
 
-        # Should not raise an exception
-        storage = S3Storage()
-        self.assertIsNotNone(storage)
+        S3Storage()
+
+        mock_s3_client.list_buckets.assert_not_called()
+        mock_s3_client.head_bucket.assert_not_called()
 
     @patch("the_data_packet.utils.s3.get_config")
     @patch("boto3.client")
-    def test_test_credentials_failure(self, mock_boto3_client, mock_get_config):
-        """Test credential testing failure."""
+    def test_upload_file_missing_credentials(self, mock_boto3_client, mock_get_config):
+        """Test that missing credentials surface as a failed upload result."""
         mock_get_config.return_value = self.mock_config
         mock_s3_client = Mock()
-        mock_s3_client.list_buckets.side_effect = ClientError(
-            {"Error": {"Code": "AccessDenied", "Message": "Access denied"}},
-            "list_buckets",
-        )
+        mock_s3_client.upload_file.side_effect = NoCredentialsError()
         mock_boto3_client.return_value = mock_s3_client
 
-        with self.assertRaises(ConfigurationError) as cm:
-            S3Storage()
+        storage = S3Storage()
 
-        self.assertIn("AWS credentials are invalid", str(cm.exception))
+        with patch("pathlib.Path.exists", return_value=True):
+            with patch("pathlib.Path.stat") as mock_stat:
+                mock_stat.return_value = Mock(st_size=1024)
+
+                result = storage.upload_file(Path("/tmp/test.txt"))
+
+        self.assertFalse(result.success)
+        self.assertIn("AWS credentials not found", result.error_message)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Unit tests for workflows.__init__.py module."""
 
+import subprocess
+import sys
 import unittest
 
 from the_data_packet.workflows import PodcastPipeline, PodcastResult
@@ -43,6 +45,20 @@ class TestWorkflowsInit(unittest.TestCase):
         self.assertIs(PodcastPipeline, PodcastPipelineDirect)
         self.assertIs(PodcastResult, PodcastResultDirect)
 
+    def test_unknown_attribute_raises(self):
+        """Test that the lazy loader only resolves exported names."""
+        import the_data_packet.workflows as workflows_module
+
+        with self.assertRaises(AttributeError):
+            workflows_module.NotAWorkflow  # noqa: B018
+
+    def test_package_import_does_not_load_pipeline(self):
+        """Test that importing the package leaves the pipeline module unloaded."""
+        code = "import sys, the_data_packet; print('the_data_packet.workflows.podcast' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), "False")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,13 @@
 """Unit tests for workflows.podcast module."""
 
+import sys
+import threading
 import unittest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+from the_data_packet.core.exceptions import ValidationError
 from the_data_packet.sources.base import Article
 from the_data_packet.workflows.podcast import PodcastPipeline, PodcastResult
 
@@ -11,6 +15,11 @@ from the_data_packet.workflows.podcast import PodcastPipeline, PodcastResult
 class TestPodcastResult(unittest.TestCase):
     """Test cases for PodcastResult dataclass."""
 
+    @unittest.skipIf(sys.version_info < (3, 10), "slotted dataclasses require Python 3.10+")
+    def test_podcast_result_uses_slots(self):
+        """Test that PodcastResult instances carry no per-instance __dict__."""
+        self.assertFalse(hasattr(PodcastResult(), "__dict__"))
+
     def test_podcast_result_creation_defaults(self):
         """Test PodcastResult creation with defaults."""
         result = PodcastResult()
@@ -81,6 +90,8 @@ class TestPodcastPipeline(unittest.TestCase):
         self.mock_config.elevenlabs_api_key = "test-elevenlabs-key"
         self.mock_config.s3_bucket_name = "test-bucket"
         self.mock_config.aws_access_key_id = "test-access-key"
+        self.mock_config.mongodb_username = None
+        self.mock_config.mongodb_password = None
 
         self.sample_article = Article(
             title="Test Security Article",
@@ -138,6 +149,16 @@ class TestPodcastPipeline(unittest.TestCase):
             PodcastPipeline()
             mock_validate.assert_called_once()
 
+    def test_validate_config_unknown_sources(self):
+        """Test that unknown sources are reported once each, in config order."""
+        self.mock_config.article_sources = ["wired", "medium", "arstechnica", "medium"]
+
+        with self.assertRaises(ValidationError) as cm:
+            PodcastPipeline(self.mock_config)
+
+        self.assertIn("Unknown article sources: medium, arstechnica", str(cm.exception))
+
+    @patch("the_data_packet.workflows.podcast.upload_current_day_log")
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
     @patch.object(PodcastPipeline, "_collect_articles")
@@ -146,6 +167,7 @@ class TestPodcastPipeline(unittest.TestCase):
         mock_collect: MagicMock,
         mock_validate: MagicMock,
         mock_get_config: MagicMock,
+        mock_upload_log: MagicMock,
     ):
         """Test pipeline run when no articles are collected."""
         mock_get_config.return_value = self.mock_config
@@ -158,6 +180,31 @@ class TestPodcastPipeline(unittest.TestCase):
         self.assertEqual(result.number_of_articles_collected, 0)
         self.assertEqual(result.articles_collected, [])
         self.assertIn("No new articles were collected", result.error_message)
+        self.assertIsNotNone(result.execution_time_seconds)
+        # The day's log is uploaded once, by the shared finalize step
+        mock_upload_log.assert_called_once_with(self.mock_config)
+
+    @patch("the_data_packet.workflows.podcast.upload_current_day_log")
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    @patch.object(PodcastPipeline, "_collect_articles")
+    @patch("the_data_packet.workflows.podcast.time.perf_counter")
+    def test_run_measures_execution_time_with_perf_counter(
+        self,
+        mock_perf_counter: MagicMock,
+        mock_collect: MagicMock,
+        mock_validate: MagicMock,
+        mock_get_config: MagicMock,
+        mock_upload_log: MagicMock,
+    ):
+        """Test that the run duration comes from the monotonic performance counter."""
+        mock_get_config.return_value = self.mock_config
+        mock_collect.return_value = []
+        mock_perf_counter.side_effect = [100.0, 102.5]
+
+        result = PodcastPipeline().run()
+
+        self.assertEqual(result.execution_time_seconds, 2.5)
 
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
@@ -233,11 +280,12 @@ class TestPodcastPipeline(unittest.TestCase):
 
         # Mock source classes
         mock_wired_source = Mock()
-        mock_wired_source.supported_categories = ["security", "ai", "science"]
         mock_wired_source.get_latest_article.return_value = self.sample_article
         mock_wired_source.get_multiple_articles.return_value = [self.sample_article]
+        mock_wired_source.supported_categories = ["security", "ai", "science"]
+        mock_wired_class = Mock(return_value=mock_wired_source)
 
-        with patch.dict(PodcastPipeline.SOURCES, {"wired": lambda: mock_wired_source}):
+        with patch.dict(PodcastPipeline.SOURCES, {"wired": mock_wired_class}):
             pipeline = PodcastPipeline()
             articles = pipeline._collect_articles()
 
@@ -247,6 +295,182 @@ class TestPodcastPipeline(unittest.TestCase):
             self.assertEqual(articles[0].content, self.sample_article.content)
             # Since max_articles_per_source is 1, it should call get_latest_article
             mock_wired_source.get_latest_article.assert_called_once_with("security")
+            mock_wired_source.exclude_urls.assert_called_once_with(set())
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_collect_articles_concurrent_keeps_order_and_isolates_failures(
+        self, mock_validate: MagicMock, mock_get_config: MagicMock
+    ):
+        """Test that categories collected concurrently come back in config order."""
+        self.mock_config.article_categories = ["security", "ai", "science"]
+        mock_get_config.return_value = self.mock_config
+
+        def latest(category):
+            if category == "ai":
+                raise Exception("feed down")
+            return Article(
+                title=category,
+                url=f"https://example.com/{category}",
+                content="Content long enough to be considered a valid article for this test. " * 3,
+                source="wired",
+                category=category,
+            )
+
+        mock_wired_source = Mock()
+        mock_wired_source.get_latest_article.side_effect = latest
+        mock_wired_source.supported_categories = ["security", "ai", "science"]
+        mock_wired_class = Mock(return_value=mock_wired_source)
+
+        with patch.dict(PodcastPipeline.SOURCES, {"wired": mock_wired_class}):
+            articles = PodcastPipeline()._collect_articles()
+
+        self.assertEqual([article.category for article in articles], ["security", "science"])
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_collect_articles_drops_cross_category_duplicates(
+        self, mock_validate: MagicMock, mock_get_config: MagicMock
+    ):
+        """Test that a story filed under several categories is kept only once."""
+        self.mock_config.article_categories = ["security", "ai"]
+        mock_get_config.return_value = self.mock_config
+
+        mock_wired_class = Mock()
+        mock_wired_class.return_value.supported_categories = ["security", "ai"]
+        mock_wired_class.return_value.get_latest_article.return_value = self.sample_article
+
+        with patch.dict(PodcastPipeline.SOURCES, {"wired": mock_wired_class}):
+            articles = PodcastPipeline()._collect_articles()
+
+        self.assertEqual(articles, [self.sample_article])
+
+    def test_deduplicate_articles_without_url_uses_title_and_author(self):
+        """Test that URL-less articles are deduplicated by title and author."""
+        first = Article(title="Story", content="Body", author="A")
+        same = Article(title="Story", content="Other body", author="A")
+        other_author = Article(title="Story", content="Body", author="B")
+
+        self.assertEqual(
+            PodcastPipeline._deduplicate_articles([first, same, other_author]),
+            [first, other_author],
+        )
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_collect_articles_skips_sources_without_supported_categories(
+        self, mock_validate: MagicMock, mock_get_config: MagicMock
+    ):
+        """Test that a source with none of the configured categories is never fetched from."""
+        self.mock_config.article_sources = ["wired", "techcrunch"]
+        self.mock_config.article_categories = ["science"]
+        mock_get_config.return_value = self.mock_config
+
+        mock_wired_class = Mock()
+        mock_wired_class.return_value.supported_categories = ["security", "science"]
+        mock_wired_class.return_value.get_latest_article.return_value = self.sample_article
+        mock_techcrunch_class = Mock()
+        mock_techcrunch_class.return_value.supported_categories = ["ai", "security"]
+
+        with patch.dict(PodcastPipeline.SOURCES, {"wired": mock_wired_class, "techcrunch": mock_techcrunch_class}):
+            articles = PodcastPipeline()._collect_articles()
+
+        self.assertEqual(articles, [self.sample_article])
+        mock_wired_class.return_value.prefetch_feeds.assert_called_once_with(["science"])
+        mock_techcrunch_class.return_value.prefetch_feeds.assert_not_called()
+        mock_techcrunch_class.return_value.get_latest_article.assert_not_called()
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch("the_data_packet.workflows.podcast.MongoDBClient")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_load_used_urls_with_mongodb(
+        self,
+        mock_validate: MagicMock,
+        mock_mongodb_client: Mock,
+        mock_get_config: MagicMock,
+    ):
+        """Test that used URLs are read with a single distinct query."""
+        self.mock_config.mongodb_username = "test_user"
+        self.mock_config.mongodb_password = "test_password"
+        mock_get_config.return_value = self.mock_config
+
+        mock_client_instance = Mock()
+        mock_client_instance.get_collection.return_value.distinct.return_value = [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        mock_mongodb_client.return_value = mock_client_instance
+
+        pipeline = PodcastPipeline()
+
+        self.assertEqual(pipeline._load_used_urls(), {"https://example.com/a", "https://example.com/b"})
+        mock_client_instance.get_collection.assert_called_once_with("articles")
+        mock_client_instance.get_collection.return_value.distinct.assert_called_once_with("url")
+        # Kept open for the rest of the run
+        mock_client_instance.close.assert_not_called()
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch("the_data_packet.workflows.podcast.MongoDBClient")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_load_used_urls_connection_failure(
+        self,
+        mock_validate: MagicMock,
+        mock_mongodb_client: Mock,
+        mock_get_config: MagicMock,
+    ):
+        """Test that an unreachable MongoDB yields no exclusions."""
+        self.mock_config.mongodb_username = "test_user"
+        self.mock_config.mongodb_password = "test_password"
+        mock_get_config.return_value = self.mock_config
+        mock_mongodb_client.side_effect = Exception("connection refused")
+
+        pipeline = PodcastPipeline()
+
+        self.assertEqual(pipeline._load_used_urls(), set())
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch("the_data_packet.workflows.podcast.MongoDBClient")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_get_mongo_reuses_one_client(
+        self,
+        mock_validate: MagicMock,
+        mock_mongodb_client: Mock,
+        mock_get_config: MagicMock,
+    ):
+        """Test that MongoDB steps share one client, closed once by _close_mongo."""
+        self.mock_config.mongodb_username = "test_user"
+        self.mock_config.mongodb_password = "test_password"
+        mock_get_config.return_value = self.mock_config
+
+        pipeline = PodcastPipeline()
+        first = pipeline._get_mongo()
+        second = pipeline._get_mongo()
+        pipeline._close_mongo()
+
+        self.assertIs(first, second)
+        mock_mongodb_client.assert_called_once_with(username="test_user", password="test_password")
+        mock_mongodb_client.return_value.ensure_unique_index.assert_called_once_with("articles", "url")
+        mock_mongodb_client.return_value.close.assert_called_once()
+        self.assertIsNone(pipeline._mongo_client)
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    @patch.object(PodcastPipeline, "_collect_articles")
+    @patch.object(PodcastPipeline, "_close_mongo")
+    def test_run_closes_mongo_client(
+        self,
+        mock_close_mongo: MagicMock,
+        mock_collect: MagicMock,
+        mock_validate: MagicMock,
+        mock_get_config: MagicMock,
+    ):
+        """Test that run closes the MongoDB client even when the run fails."""
+        mock_get_config.return_value = self.mock_config
+        mock_collect.side_effect = Exception("Collection failed")
+
+        PodcastPipeline().run()
+
+        mock_close_mongo.assert_called_once()
 
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
@@ -256,6 +480,8 @@ class TestPodcastPipeline(unittest.TestCase):
         config_unknown_source.article_sources = ["unknown_source"]
         config_unknown_source.article_categories = ["security"]
         config_unknown_source.max_articles_per_source = 1
+        config_unknown_source.mongodb_username = None
+        config_unknown_source.mongodb_password = None
         mock_get_config.return_value = config_unknown_source
 
         pipeline = PodcastPipeline()
@@ -267,7 +493,174 @@ class TestPodcastPipeline(unittest.TestCase):
 
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
-    @patch("the_data_packet.workflows.podcast.ScriptGenerator")
+    @patch("the_data_packet.generation.audio.AudioGenerator")
+    @patch("the_data_packet.generation.script.ScriptGenerator")
+    def test_run_warms_up_generators_during_collection(
+        self,
+        mock_script_generator_class: MagicMock,
+        mock_audio_generator_class: MagicMock,
+        mock_validate: MagicMock,
+        mock_get_config: MagicMock,
+    ):
+        """Test that generators are built while articles are collected and reused afterwards."""
+        mock_get_config.return_value = self.mock_config
+
+        pipeline = PodcastPipeline()
+        with patch.object(pipeline, "_collect_articles", return_value=[]):
+            pipeline.run()
+
+        mock_script_generator_class.assert_called_once_with()
+        mock_audio_generator_class.assert_called_once_with()
+        self.assertIs(pipeline._audio_generator, mock_audio_generator_class.return_value)
+
+    @patch("the_data_packet.workflows.podcast.S3Storage")
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_run_only_uses_newly_claimed_articles(
+        self, mock_validate: MagicMock, mock_get_config: MagicMock, mock_s3_storage_class: MagicMock
+    ):
+        """Test that articles already used in earlier episodes reach neither the script nor the RSS feed."""
+        mock_get_config.return_value = self.mock_config
+        used_article = Article(title="Used Article", content="Old story", url="https://example.com/used")
+
+        pipeline = PodcastPipeline()
+        with (
+            patch.object(pipeline, "_collect_articles", return_value=[used_article, self.sample_article]),
+            patch.object(pipeline, "_claim_new_articles", return_value=[self.sample_article]),
+            patch.object(pipeline, "_generate_script", return_value="Script") as mock_generate_script,
+            patch.object(pipeline, "_publish_script"),
+            patch.object(pipeline, "_generate_audio", return_value=Mock(output_file=Path("/tmp/test/audio.wav"))),
+            patch.object(
+                pipeline, "_upload_to_s3", return_value=Mock(s3_url="https://s3.amazonaws.com/bucket/audio.mp3")
+            ),
+            patch.object(pipeline, "_generate_rss_feed") as mock_rss,
+            patch.object(pipeline, "_warm_up_generators"),
+        ):
+            result = pipeline.run()
+
+        self.assertTrue(result.success)
+        mock_generate_script.assert_called_once_with([self.sample_article])
+        self.assertEqual(mock_rss.call_args.args[0], [self.sample_article])
+
+    @patch("the_data_packet.workflows.podcast.S3Storage")
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_run_publishes_script_during_audio_generation(
+        self, mock_validate: MagicMock, mock_get_config: MagicMock, mock_s3_storage_class: MagicMock
+    ):
+        """Test that the script is saved and uploaded while audio is generated."""
+        self.mock_config.generate_rss = False
+        mock_get_config.return_value = self.mock_config
+        script_path = Path("/tmp/test/script.txt")
+        publishing = threading.Event()
+
+        def save_script(script_content: str):
+            publishing.set()
+            return script_path
+
+        def generate_audio(script_content: str):
+            # Only returns if the script is published concurrently
+            self.assertTrue(publishing.wait(timeout=5))
+            return Mock(output_file=Path("/tmp/test/audio.wav"))
+
+        pipeline = PodcastPipeline()
+        with (
+            patch.object(pipeline, "_collect_articles", return_value=[self.sample_article]),
+            patch.object(pipeline, "_generate_script", return_value="Script"),
+            patch.object(pipeline, "_save_script", side_effect=save_script),
+            patch.object(pipeline, "_generate_audio", side_effect=generate_audio),
+            patch.object(
+                pipeline,
+                "_upload_to_s3",
+                side_effect=lambda path: Mock(s3_url=f"https://s3.amazonaws.com/bucket/{path.name}"),
+            ),
+            patch.object(pipeline, "_warm_up_generators"),
+        ):
+            result = pipeline.run()
+
+        self.assertTrue(result.success)
+        self.assertTrue(result.script_generated)
+        self.assertEqual(result.script_path, script_path)
+        self.assertEqual(result.s3_script_url, "https://s3.amazonaws.com/bucket/script.txt")
+        self.assertTrue(result.audio_generated)
+        self.assertEqual(result.s3_audio_url, "https://s3.amazonaws.com/bucket/audio.wav")
+
+    @patch("the_data_packet.workflows.podcast.S3Storage")
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_run_reports_published_script_when_audio_fails(
+        self, mock_validate: MagicMock, mock_get_config: MagicMock, mock_s3_storage_class: MagicMock
+    ):
+        """Test that a failed audio step still reports the script already written and uploaded."""
+        mock_get_config.return_value = self.mock_config
+        script_path = Path("/tmp/test/script.txt")
+
+        pipeline = PodcastPipeline()
+        with (
+            patch.object(pipeline, "_collect_articles", return_value=[self.sample_article]),
+            patch.object(pipeline, "_generate_script", return_value="Script"),
+            patch.object(pipeline, "_save_script", return_value=script_path),
+            patch.object(
+                pipeline, "_upload_to_s3", return_value=Mock(s3_url="https://s3.amazonaws.com/bucket/script.txt")
+            ),
+            patch.object(pipeline, "_generate_audio", side_effect=Exception("TTS unavailable")),
+            patch.object(pipeline, "_warm_up_generators"),
+        ):
+            result = pipeline.run()
+
+        self.assertFalse(result.success)
+        self.assertIn("TTS unavailable", result.error_message)
+        self.assertTrue(result.script_generated)
+        self.assertEqual(result.script_path, script_path)
+        self.assertEqual(result.s3_script_url, "https://s3.amazonaws.com/bucket/script.txt")
+
+    @patch("the_data_packet.workflows.podcast.S3Storage")
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_run_shares_one_s3_storage_between_threads(
+        self, mock_validate: MagicMock, mock_get_config: MagicMock, mock_s3_storage_class: MagicMock
+    ):
+        """Test that the storage client is built once, before the script is published in the background."""
+        self.mock_config.generate_rss = False
+        mock_get_config.return_value = self.mock_config
+
+        pipeline = PodcastPipeline()
+        with (
+            patch.object(pipeline, "_collect_articles", return_value=[self.sample_article]),
+            patch.object(pipeline, "_generate_script", return_value="Script"),
+            patch.object(pipeline, "_save_script", return_value=Path("/tmp/test/script.txt")),
+            patch.object(pipeline, "_generate_audio", return_value=Mock(output_file=Path("/tmp/test/audio.wav"))),
+            patch.object(pipeline, "_warm_up_generators"),
+        ):
+            result = pipeline.run()
+
+        self.assertTrue(result.success)
+        mock_s3_storage_class.assert_called_once_with()
+        self.assertEqual(mock_s3_storage_class.return_value.upload_file.call_count, 2)
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    @patch("the_data_packet.generation.audio.AudioGenerator")
+    @patch("the_data_packet.generation.script.ScriptGenerator")
+    def test_warm_up_generators_failure_is_deferred(
+        self,
+        mock_script_generator_class: MagicMock,
+        mock_audio_generator_class: MagicMock,
+        mock_validate: MagicMock,
+        mock_get_config: MagicMock,
+    ):
+        """Test that a warm-up failure is left for the step that needs the generator."""
+        mock_get_config.return_value = self.mock_config
+        mock_script_generator_class.side_effect = Exception("no API key")
+
+        pipeline = PodcastPipeline()
+        pipeline._warm_up_generators()
+
+        self.assertIsNone(pipeline._script_generator)
+
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    @patch("the_data_packet.generation.script.ScriptGenerator")
     def test_generate_script_lazy_loading(
         self,
         mock_script_generator_class: MagicMock,
@@ -289,7 +682,7 @@ class TestPodcastPipeline(unittest.TestCase):
 
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
-    @patch("the_data_packet.workflows.podcast.AudioGenerator")
+    @patch("the_data_packet.generation.audio.AudioGenerator")
     def test_generate_audio_lazy_loading(
         self,
         mock_audio_generator_class: MagicMock,
@@ -322,7 +715,7 @@ class TestPodcastPipeline(unittest.TestCase):
         pipeline = PodcastPipeline()
 
         with patch("pathlib.Path.mkdir") as mock_mkdir:
-            with patch("builtins.open", create=True) as mock_open:
+            with patch("pathlib.Path.write_bytes") as mock_write_bytes:
                 with patch("the_data_packet.workflows.podcast.datetime") as mock_datetime:
                     mock_datetime.now.return_value.strftime.return_value = "20231201_120000"
 
@@ -331,7 +724,7 @@ class TestPodcastPipeline(unittest.TestCase):
                     expected_path = self.mock_config.output_directory / "episode_script_20231201_120000.txt"
                     self.assertEqual(script_path, expected_path)
                 mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-                mock_open.assert_called_once_with(expected_path, "w", encoding="utf-8")
+                mock_write_bytes.assert_called_once_with(b"Test script content")
 
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
@@ -342,6 +735,22 @@ class TestPodcastPipeline(unittest.TestCase):
         pipeline = PodcastPipeline()
         self.assertTrue(pipeline._should_use_s3())
 
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_upload_to_s3_uses_run_prefix(self, mock_validate: MagicMock, mock_get_config: MagicMock):
+        """Test that uploads share the key prefix fixed at the start of the run."""
+        mock_get_config.return_value = self.mock_config
+
+        pipeline = PodcastPipeline()
+        pipeline._s3_storage = MagicMock()
+        pipeline._s3_prefix = pipeline._build_s3_prefix(datetime(2023, 12, 1, 23, 59))
+
+        pipeline._upload_to_s3(Path("/tmp/test/episode.txt"))
+        pipeline._upload_to_s3(Path("/tmp/test/episode.mp3"))
+
+        keys = [call.args[1] for call in pipeline._s3_storage.upload_file.call_args_list]
+        self.assertEqual(keys, ["test-podcast/2023-12-01/episode.txt", "test-podcast/2023-12-01/episode.mp3"])
+
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
     def test_should_use_s3_false(self, mock_validate: MagicMock, mock_get_config: MagicMock):
@@ -357,24 +766,19 @@ class TestPodcastPipeline(unittest.TestCase):
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch("the_data_packet.workflows.podcast.MongoDBClient")
     @patch.object(PodcastPipeline, "_validate_config")
-    def test_remove_already_used_articles_with_mongodb(
+    def test_claim_new_articles_with_mongodb(
         self,
         mock_validate: MagicMock,
         mock_mongodb_client: Mock,
         mock_get_config: MagicMock,
     ):
-        """Test article deduplication with MongoDB integration."""
+        """Test that articles are upserted by URL and only newly inserted ones are returned."""
         # Setup config with MongoDB credentials
         config_with_mongo = Mock()
         config_with_mongo.mongodb_username = "test_user"
         config_with_mongo.mongodb_password = "test_password"
         mock_get_config.return_value = config_with_mongo
 
-        # Setup MongoDB client mock
-        mock_client_instance = Mock()
-        mock_mongodb_client.return_value = mock_client_instance
-
-        # Mock one article as existing, one as new
         existing_article = Article(
             title="Existing Article",
             url="https://example.com/existing",
@@ -390,79 +794,76 @@ class TestPodcastPipeline(unittest.TestCase):
             category="test",
         )
 
-        # Mock MongoDB responses
-        def mock_find_documents(collection, query):
-            if query["url"] == "https://example.com/existing":
-                # Article exists
-                return [{"url": "https://example.com/existing"}]
-            return []  # Article doesn't exist
-
-        mock_client_instance.find_documents.side_effect = mock_find_documents
+        # Only the new article's URL is inserted by the upsert
+        mock_client_instance = Mock()
+        mock_client_instance.insert_new_documents.return_value = {"https://example.com/new"}
+        mock_mongodb_client.return_value = mock_client_instance
 
         pipeline = PodcastPipeline()
-        articles = [existing_article, new_article]
-        result = pipeline._remove_already_used_articles(articles)
-
-        # Should only return new article
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].title, "New Article")
+        result = pipeline._claim_new_articles([existing_article, new_article])
 
-        # Verify MongoDB client was created and called correctly
+        self.assertEqual(result, [new_article])
         mock_mongodb_client.assert_called_once_with(username="test_user", password="test_password")
-        self.assertEqual(mock_client_instance.find_documents.call_count, 2)
+        mock_client_instance.insert_new_documents.assert_called_once_with(
+            "articles", [existing_article.to_dict(), new_article.to_dict()], key="url"
+        )
+        # Kept open for the rest of the run
+        mock_client_instance.close.assert_not_called()
 
     @patch("the_data_packet.workflows.podcast.get_config")
+    @patch("the_data_packet.workflows.podcast.MongoDBClient")
     @patch.object(PodcastPipeline, "_validate_config")
-    def test_remove_already_used_articles_no_mongodb_credentials(
-        self, mock_validate: MagicMock, mock_get_config: MagicMock
+    def test_claim_new_articles_duplicate_url_in_run(
+        self,
+        mock_validate: MagicMock,
+        mock_mongodb_client: Mock,
+        mock_get_config: MagicMock,
     ):
-        """Test article deduplication without MongoDB credentials."""
-        # Setup config without MongoDB credentials
-        config_no_mongo = Mock()
-        config_no_mongo.mongodb_username = None
-        config_no_mongo.mongodb_password = None
-        mock_get_config.return_value = config_no_mongo
+        """Test that an article collected twice in one run is only returned once."""
+        config_with_mongo = Mock()
+        config_with_mongo.mongodb_username = "test_user"
+        config_with_mongo.mongodb_password = "test_password"
+        mock_get_config.return_value = config_with_mongo
+
+        mock_client_instance = Mock()
+        mock_client_instance.insert_new_documents.return_value = {self.sample_article.url}
+        mock_mongodb_client.return_value = mock_client_instance
 
         pipeline = PodcastPipeline()
-        articles = [self.sample_article]
-        result = pipeline._remove_already_used_articles(articles)
+        result = pipeline._claim_new_articles([self.sample_article, self.sample_article])
 
-        # Should return all articles when MongoDB is not configured
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], self.sample_article)
+        self.assertEqual(result, [self.sample_article])
 
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch("the_data_packet.workflows.podcast.MongoDBClient")
     @patch.object(PodcastPipeline, "_validate_config")
-    def test_add_article_to_db_with_mongodb(
+    def test_claim_new_articles_failure_keeps_all_articles(
         self,
         mock_validate: MagicMock,
         mock_mongodb_client: Mock,
         mock_get_config: MagicMock,
     ):
-        """Test adding articles to MongoDB database."""
-        # Setup config with MongoDB credentials
+        """Test that a failed upsert falls back to using every collected article."""
         config_with_mongo = Mock()
         config_with_mongo.mongodb_username = "test_user"
         config_with_mongo.mongodb_password = "test_password"
         mock_get_config.return_value = config_with_mongo
 
-        # Setup MongoDB client mock
         mock_client_instance = Mock()
+        mock_client_instance.insert_new_documents.side_effect = Exception("write failed")
         mock_mongodb_client.return_value = mock_client_instance
 
         pipeline = PodcastPipeline()
-        articles = [self.sample_article]
-        pipeline._add_article_to_db(articles)
+        result = pipeline._claim_new_articles([self.sample_article])
 
-        # Verify MongoDB client was created and insert was called
-        mock_mongodb_client.assert_called_once_with(username="test_user", password="test_password")
-        mock_client_instance.insert_document.assert_called_once_with("articles", self.sample_article.to_dict())
+        self.assertEqual(result, [self.sample_article])
+        # Kept open for the rest of the run
+        mock_client_instance.close.assert_not_called()
 
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
-    def test_add_article_to_db_no_mongodb_credentials(self, mock_validate: MagicMock, mock_get_config: MagicMock):
-        """Test adding articles to database without MongoDB credentials."""
+    def test_claim_new_articles_no_mongodb_credentials(self, mock_validate: MagicMock, mock_get_config: MagicMock):
+        """Test article deduplication without MongoDB credentials."""
         # Setup config without MongoDB credentials
         config_no_mongo = Mock()
         config_no_mongo.mongodb_username = None
@@ -471,10 +872,10 @@ class TestPodcastPipeline(unittest.TestCase):
 
         pipeline = PodcastPipeline()
         articles = [self.sample_article]
+        result = pipeline._claim_new_articles(articles)
 
-        # Should not raise an error, just log warning and return
-        pipeline._add_article_to_db(articles)
-        # No assertions needed, just ensuring no exceptions
+        # Should return all articles when MongoDB is not configured
+        self.assertEqual(result, [self.sample_article])
 
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch("the_data_packet.workflows.podcast.MongoDBClient")
@@ -490,6 +891,7 @@ class TestPodcastPipeline(unittest.TestCase):
         config_with_mongo = Mock()
         config_with_mongo.mongodb_username = "test_user"
         config_with_mongo.mongodb_password = "test_password"
+        config_with_mongo.mongodb_ack_episode_writes = False
         mock_get_config.return_value = config_with_mongo
 
         # Setup MongoDB client mock
@@ -512,9 +914,10 @@ class TestPodcastPipeline(unittest.TestCase):
         # Verify MongoDB client was created and insert was called
         mock_mongodb_client.assert_called_once_with(username="test_user", password="test_password")
 
-        # Verify insert was called once with episode metadata
-        self.assertEqual(mock_client_instance.insert_document.call_count, 1)
-        call_args = mock_client_instance.insert_document.call_args
+        # Verify an unacknowledged insert was sent once with episode metadata
+        mock_client_instance.insert_document.assert_not_called()
+        self.assertEqual(mock_client_instance.fire_and_forget_insert.call_count, 1)
+        call_args = mock_client_instance.fire_and_forget_insert.call_args
         collection_name = call_args[0][0]
         episode_dict = call_args[0][1]
 
@@ -529,6 +932,29 @@ class TestPodcastPipeline(unittest.TestCase):
         article_dict = episode_dict["articles_collected"][0]
         self.assertNotIn("content", article_dict)
 
+    @patch("the_data_packet.workflows.podcast.get_config")
+    @patch("the_data_packet.workflows.podcast.MongoDBClient")
+    @patch.object(PodcastPipeline, "_validate_config")
+    def test_save_episode_metadata_acknowledged_when_configured(
+        self,
+        mock_validate: MagicMock,
+        mock_mongodb_client: Mock,
+        mock_get_config: MagicMock,
+    ):
+        """Test that episode metadata uses an acknowledged insert when requested."""
+        config_with_mongo = Mock()
+        config_with_mongo.mongodb_username = "test_user"
+        config_with_mongo.mongodb_password = "test_password"
+        config_with_mongo.mongodb_ack_episode_writes = True
+        mock_get_config.return_value = config_with_mongo
+
+        pipeline = PodcastPipeline()
+        pipeline._save_episode_metadata(PodcastResult(success=True))
+
+        mock_client_instance = mock_mongodb_client.return_value
+        mock_client_instance.insert_document.assert_called_once()
+        mock_client_instance.fire_and_forget_insert.assert_not_called()
+
     @patch("the_data_packet.workflows.podcast.get_config")
     @patch.object(PodcastPipeline, "_validate_config")
     def test_save_episode_metadata_no_mongodb_credentials(self, mock_validate: MagicMock, mock_get_config: MagicMock):
@@ -31,6 +31,8 @@ Individual Components:
     >>> from the_data_packet.utils import S3Storage
 """
 
+from typing import TYPE_CHECKING
+
 from the_data_packet.__about__ import __version__
 
 # Core components
@@ -47,32 +49,14 @@ from the_data_packet.core import (
     get_logger,
     setup_logging,
 )
+from the_data_packet.core.lazy import lazy_getattr
 
-# Generation modules
-from the_data_packet.generation import (
-    AudioGenerator,
-    ScriptGenerator,
-)
-
-# Article sources
-from the_data_packet.sources import (
-    Article,
-    ArticleSource,
-    TechCrunchSource,
-    WiredSource,
-)
-
-# Storage modules
-from the_data_packet.utils import (
-    S3Storage,
-    S3UploadResult,
-)
-
-# Main workflows
-from the_data_packet.workflows import (
-    PodcastPipeline,
-    PodcastResult,
-)
+# Everything outside core is imported on first access
+if TYPE_CHECKING:
+    from the_data_packet.generation import AudioGenerator, ScriptGenerator
+    from the_data_packet.sources import Article, ArticleSource, TechCrunchSource, WiredSource
+    from the_data_packet.utils import S3Storage, S3UploadResult
+    from the_data_packet.workflows import PodcastPipeline, PodcastResult
 
 __all__ = [
     # Version
@@ -105,3 +89,20 @@ __all__ = [
     "PodcastPipeline",
     "PodcastResult",
 ]
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "Article": "sources",
+        "ArticleSource": "sources",
+        "TechCrunchSource": "sources",
+        "WiredSource": "sources",
+        "ScriptGenerator": "generation",
+        "AudioGenerator": "generation",
+        "S3Storage": "utils",
+        "S3UploadResult": "utils",
+        "PodcastPipeline": "workflows",
+        "PodcastResult": "workflows",
+    },
+)
@@ -73,6 +73,7 @@ Environment Variables:
         SHOW_NAME - Podcast name override
         LOG_LEVEL - Logging level (DEBUG/INFO/WARNING/ERROR)
         MAX_ARTICLES - Max articles per source
+        MAX_ARTICLE_CHARS - Stop collecting article paragraphs past this many characters
 
     Logging configuration:
         LOG_DIRECTORY - Directory for JSONL log files (default: output/logs)
@@ -109,6 +110,8 @@ class Config:
                              Optional. Loaded from MONGODB_USERNAME.
             mongodb_password: MongoDB password for episode tracking and article deduplication.
                              Optional. Loaded from MONGODB_PASSWORD.
+            mongodb_ack_episode_writes: Wait for MongoDB to acknowledge episode metadata
+                             writes (for debugging). Loaded from MONGODB_ACK_EPISODE_WRITES.
 
         Google Cloud Configuration:
             google_credentials_path: Path to Google Cloud service account JSON file.
@@ -129,10 +132,12 @@ class Config:
         Podcast Configuration:
             show_name: Podcast show name. Used in RSS feeds and file names.
             episode_number: Episode number for RSS feeds. Auto-generated if None.
-            output_directory: Local directory for generated files.
+            output_directory: Local directory for generated files. Created by the
+                steps that write to it, not when the config is built.
 
         Article Collection:
             max_articles_per_source: Maximum articles to collect per source.
+            max_article_chars: Optional cap on extracted article text (None = whole article).
             article_sources: List of news sources to use (wired, techcrunch).
             article_categories: List of categories to fetch from each source.
             source_category_mapping: Maps each source to its supported categories.
@@ -142,11 +147,14 @@ class Config:
             tts_model: Text-to-speech service type (now "google_cloud_tts").
             max_tokens: Maximum tokens for Claude API calls.
             temperature: AI generation temperature (0.0-1.0, lower = more consistent).
+            use_message_batches: Submit segment prompts as one Message Batch (cheaper, slower).
 
         Audio Settings (Google Cloud Studio Multi-speaker voices):
             voice_a: First speaker voice name (Alex - male narrator).
             voice_b: Second speaker voice name (Sam - female narrator).
             audio_sample_rate: Audio sample rate in Hz.
+            tts_cache_dir: Directory caching synthesized dialogue turns. Defaults to
+                <output_directory>/cache/tts; None disables the cache.
 
         Processing Options:
             generate_script: Whether to generate podcast scripts.
@@ -166,6 +174,8 @@ class Config:
         Network Settings:
             http_timeout: HTTP request timeout in seconds.
             user_agent: User agent string for HTTP requests.
+            article_cache_dir: Directory for cached article pages and RSS feeds (ETag/Last-Modified).
+                Defaults to <output_directory>/cache.
             log_level: Logging level (DEBUG/INFO/WARNING/ERROR/CRITICAL).
 
     Example:
@@ -191,6 +201,8 @@ class Config:
     elevenlabs_api_key: Optional[str] = None
     mongodb_username: Optional[str] = None
     mongodb_password: Optional[str] = None
+    # Episode metadata is analytics-only, so it is sent unacknowledged unless set
+    mongodb_ack_episode_writes: bool = False
 
     # Google Cloud Configuration
     # Path to service account JSON
@@ -218,6 +230,7 @@ class Config:
 
     # Article Collection
     max_articles_per_source: int = 1
+    max_article_chars: Optional[int] = None
     article_sources: List[str] = field(default_factory=lambda: ["wired", "techcrunch"])
     article_categories: List[str] = field(default_factory=lambda: ["security", "ai"])
     source_category_mapping: Dict[str, List[str]] = field(
@@ -232,12 +245,16 @@ class Config:
     tts_model: str = "google_cloud_tts"  # Updated to use Google Cloud TTS
     max_tokens: int = 3000
     temperature: float = 0.7
+    use_message_batches: bool = False
 
     # Audio Settings (Vertex AI Gemini TTS voices)
     male_voice: str = "Puck"  # Alex (male narrator)
     female_voice: str = "Kore"  # Sam (female narrator)
     audio_sample_rate: int = 24000
     google_cloud_project: str = "gen-lang-client-0429374219"
+    # Synthesized turns reused across runs; empty means <output_directory>/cache/tts,
+    # None disables the cache
+    tts_cache_dir: Optional[str] = ""
 
     # Processing Options
     generate_script: bool = True
@@ -260,6 +277,8 @@ class Config:
     # Network Settings
     http_timeout: int = 30
     user_agent: str = "The Data Packet/1.0 (+https://github.com/TheWinterShadow/The-Data-Packet)"
+    # Empty means <output_directory>/cache
+    article_cache_dir: str = ""
 
     # Logging
     log_level: str = "INFO"
@@ -288,6 +307,8 @@ class Config:
             self.google_cloud_project = env_project
         self.mongodb_username = self.mongodb_username or os.getenv("MONGODB_USERNAME")
         self.mongodb_password = self.mongodb_password or os.getenv("MONGODB_PASSWORD")
+        if env_ack_episodes := os.getenv("MONGODB_ACK_EPISODE_WRITES"):
+            self.mongodb_ack_episode_writes = env_ack_episodes.lower() in ("true", "1", "yes")
 
         # AWS
         self.aws_access_key_id = self.aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID")
@@ -355,6 +376,12 @@ class Config:
             except ValueError:
                 pass
 
+        if env_max_chars := os.getenv("MAX_ARTICLE_CHARS"):
+            try:
+                self.max_article_chars = int(env_max_chars)
+            except ValueError:
+                pass
+
         if env_max_episodes := os.getenv("MAX_RSS_EPISODES"):
             try:
                 self.max_rss_episodes = int(env_max_episodes)
@@ -364,23 +391,31 @@ class Config:
         if env_generate_rss := os.getenv("GENERATE_RSS"):
             self.generate_rss = env_generate_rss.lower() in ("true", "1", "yes")
 
+        if env_use_batches := os.getenv("CLAUDE_USE_MESSAGE_BATCHES"):
+            self.use_message_batches = env_use_batches.lower() in ("true", "1", "yes")
+
         if env_timeout := os.getenv("HTTP_TIMEOUT"):
             try:
                 self.http_timeout = int(env_timeout)
             except ValueError:
                 pass
 
+        if env_cache_dir := os.getenv("ARTICLE_CACHE_DIRECTORY"):
+            self.article_cache_dir = env_cache_dir
+
+        if env_tts_cache_dir := os.getenv("TTS_CACHE_DIRECTORY"):
+            self.tts_cache_dir = env_tts_cache_dir
+
+        # Caches live under the output directory unless placed elsewhere
+        if not self.article_cache_dir:
+            self.article_cache_dir = str(self.output_directory / "cache")
+        if self.tts_cache_dir == "":
+            self.tts_cache_dir = str(self.output_directory / "cache" / "tts")
+
     def _validate(self) -> None:
         """Validate configuration."""
         errors = []
 
-        # Ensure output directory exists
-        if not self.output_directory.exists():
-            try:
-                self.output_directory.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                errors.append(f"Cannot create output directory {self.output_directory}: {e}")
-
         # Validate log level
         valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if self.log_level.upper() not in valid_log_levels:
@@ -451,6 +486,22 @@ class Config:
         return result
 
 
+def show_slug(show_name: str) -> str:
+    """
+    Build the S3 path/file name slug for a show name.
+
+    The mapping must stay stable: existing feeds, episodes and logs live
+    under this key prefix, so changing it would orphan them in S3.
+
+    Args:
+        show_name: Podcast show name (e.g. "The Data Packet")
+
+    Returns:
+        Lowercase name with every space replaced by a dash
+    """
+    return show_name.lower().replace(" ", "-")
+
+
 # Global configuration instance
 _config: Optional[Config] = None
 
@@ -0,0 +1,44 @@
+"""Lazy package exports for The Data Packet.
+
+Several packages re-export classes whose modules pull in heavy third-party
+SDKs (Anthropic, google-genai, boto3, pymongo, lxml). Importing those
+modules eagerly would make every ``import the_data_packet`` - and so every
+CLI invocation, including ``--help`` - pay for all of them. Instead, such
+packages define a module-level ``__getattr__`` (PEP 562) built here, which
+imports the providing submodule the first time a name is accessed.
+
+Usage:
+    from typing import TYPE_CHECKING
+
+    from the_data_packet.core.lazy import lazy_getattr
+
+    if TYPE_CHECKING:
+        from the_data_packet.generation.script import ScriptGenerator
+
+    __all__ = ["ScriptGenerator"]
+
+    __getattr__ = lazy_getattr(__name__, {"ScriptGenerator": "script"})
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict
+
+
+def lazy_getattr(package: str, attributes: Dict[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports exported names on first access.
+
+    Args:
+        package: ``__name__`` of the package defining the hook
+        attributes: Exported name -> submodule of ``package`` that defines it
+
+    Returns:
+        Function to assign to the package's ``__getattr__``
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            module = import_module(f"{package}.{attributes[name]}")
+            return getattr(module, name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
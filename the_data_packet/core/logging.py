@@ -40,7 +40,7 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from the_data_packet.utils.s3 import S3Storage
 
-from the_data_packet.core.config import Config, get_config
+from the_data_packet.core.config import Config, get_config, show_slug
 
 
 class JSONLHandler(logging.Handler):
@@ -397,8 +397,8 @@ def get_logger(name: str) -> logging.Logger:
 
         # Usage examples
         logger.info("Starting article collection")
-        logger.warning("Article content is short: %d chars", len(content))
-        logger.error("Failed to generate script: %s", str(error))
+        logger.warning(f"Article content is short: {len(content)} chars")
+        logger.error(f"Failed to generate script: {error}")
 
         # With structured data (for log aggregation)
         logger.info("Article processed", extra={
@@ -478,7 +478,7 @@ def upload_current_day_log(config: Config) -> None:
 
         # Upload to S3 with structured path
         timestamp = datetime.now().strftime("%Y-%m-%d")
-        s3_key = f"{config.show_name.lower().replace(' ', '-')}/{timestamp}/{log_file.name}"
+        s3_key = f"{show_slug(config.show_name)}/{timestamp}/{log_file.name}"
 
         result = s3_storage.upload_file(local_path=log_file, s3_key=s3_key, content_type="application/x-ndjson")
 
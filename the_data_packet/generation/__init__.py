@@ -1,11 +1,27 @@
 """AI content generation modules for The Data Packet."""
 
-from the_data_packet.generation.audio import AudioGenerator
-from the_data_packet.generation.rss import RSSGenerator
-from the_data_packet.generation.script import ScriptGenerator
+from typing import TYPE_CHECKING
+
+from the_data_packet.core.lazy import lazy_getattr
+
+# Each generator is imported on first access, so using one does not load
+# the other's SDK (Anthropic for scripts, google-genai for audio)
+if TYPE_CHECKING:
+    from the_data_packet.generation.audio import AudioGenerator
+    from the_data_packet.generation.rss import RSSGenerator
+    from the_data_packet.generation.script import ScriptGenerator
 
 __all__ = [
     "ScriptGenerator",
     "AudioGenerator",
     "RSSGenerator",
 ]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "ScriptGenerator": "script",
+        "AudioGenerator": "audio",
+        "RSSGenerator": "rss",
+    },
+)
@@ -1,13 +1,16 @@
 """Audio generation using Vertex AI Gemini TTS."""
 
+import hashlib
+import os
 import tempfile
 import time
 import wave
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from google import genai
+from google.genai.errors import APIError, ServerError
 from google.genai.types import (
     GenerateContentConfig,
     HttpOptions,
@@ -15,6 +18,7 @@ from google.genai.types import (
     SpeechConfig,
     VoiceConfig,
 )
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from the_data_packet.core.config import get_config
 from the_data_packet.core.exceptions import AudioGenerationError, ConfigurationError
@@ -23,6 +27,11 @@ from the_data_packet.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _is_transient_tts_error(error: BaseException) -> bool:
+    """Whether a TTS failure is worth retrying (rate limits and server errors)."""
+    return isinstance(error, ServerError) or (isinstance(error, APIError) and error.code == 429)
+
+
 @dataclass
 class AudioResult:
     """Result of audio generation."""
@@ -39,8 +48,13 @@ class AudioGenerator:
     AVAILABLE_VOICES = {"male": ["Puck"], "female": ["Kore"]}
 
     TTS_MODEL = "gemini-3.1-flash-tts-preview"
+    TTS_TEMPERATURE = 0.7
     SAMPLE_RATE = 24000  # Vertex AI TTS outputs 24kHz PCM
 
+    # Synthesized turns are cached on disk by (model, voice, text); least
+    # recently used entries are pruned once the cache grows past this size
+    TTS_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
     def __init__(
         self,
         male_voice: Optional[str] = None,
@@ -55,6 +69,8 @@ class AudioGenerator:
         self.project = project or getattr(config, "google_cloud_project", "gen-lang-client-0429374219")
         self.location = location
         self.config = config
+        tts_cache_dir = getattr(config, "tts_cache_dir", None)
+        self.cache_dir: Optional[Path] = Path(tts_cache_dir) if tts_cache_dir else None
 
         try:
             self.tts_client = genai.Client(
@@ -86,45 +102,127 @@ class AudioGenerator:
                 turns.append(("Alex", line))
         return turns
 
-    def _synthesize_turns(self, turns: List[Tuple[str, str]]) -> bytes:
-        """Synthesize a list of (speaker, text) turns into combined PCM bytes."""
-        combined_pcm = bytearray()
+    def _synthesize_turns(self, turns: List[Tuple[str, str]]) -> Iterator[bytes]:
+        """Synthesize a list of (speaker, text) turns, yielding each turn's PCM bytes.
 
+        Turns are yielded as soon as they are available so callers can write
+        them out without holding the whole episode in memory.
+        """
         for i, (speaker, text) in enumerate(turns):
             voice_name = self.male_voice if speaker == "Alex" else self.female_voice
             logger.info(f"  [{i + 1}/{len(turns)}] Synthesizing {speaker} using {voice_name}...")
 
-            tts_config = GenerateContentConfig(
-                temperature=0.7,
-                speech_config=SpeechConfig(
-                    voice_config=VoiceConfig(prebuilt_voice_config=PrebuiltVoiceConfig(voice_name=voice_name))
-                ),
-            )
-
             full_text = f"[short pause] {text}" if i > 0 else text
 
+            # Identical turns from earlier runs (e.g. a re-rendered script) are reused
+            cache_key = self._turn_cache_key(voice_name, full_text)
+            cached_pcm = self._read_cached_turn(cache_key)
+            if cached_pcm is not None:
+                yield cached_pcm
+                continue
+
             try:
-                response = self.tts_client.models.generate_content(
-                    model=self.TTS_MODEL,
-                    contents=full_text,
-                    config=tts_config,
-                )
-                candidates = response.candidates or []
-                content = candidates[0].content if candidates else None
-                parts = content.parts if content is not None else None
-                inline_data = parts[0].inline_data if parts else None
-                if inline_data and inline_data.data:
-                    combined_pcm.extend(inline_data.data)
+                pcm = self._request_turn_audio(voice_name, full_text)
+                if pcm:
+                    self._write_cached_turn(cache_key, pcm)
                 else:
-                    logger.warning("Turn %d (%s) returned no audio data", i + 1, speaker)
+                    logger.warning(f"Turn {i + 1} ({speaker}) returned no audio data")
 
                 time.sleep(0.5)
 
             except Exception as e:
-                logger.error("Error synthesizing turn %d (%s): %s", i + 1, speaker, e)
+                logger.error(f"Error synthesizing turn {i + 1} ({speaker}): {e}")
                 raise AudioGenerationError(f"Failed to synthesize turn {i + 1}: {e}") from e
 
-        return bytes(combined_pcm)
+            if pcm:
+                yield pcm
+
+        self._prune_turn_cache()
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=1, min=1, max=30),
+        retry=retry_if_exception(_is_transient_tts_error),
+        reraise=True,
+    )
+    def _request_turn_audio(self, voice_name: Optional[str], text: str) -> Optional[bytes]:
+        """Synthesize one turn, retrying rate limits and server errors.
+
+        Returns:
+            PCM bytes, or None if the response carried no audio
+        """
+        tts_config = GenerateContentConfig(
+            temperature=self.TTS_TEMPERATURE,
+            speech_config=SpeechConfig(
+                voice_config=VoiceConfig(prebuilt_voice_config=PrebuiltVoiceConfig(voice_name=voice_name))
+            ),
+        )
+        response = self.tts_client.models.generate_content(
+            model=self.TTS_MODEL,
+            contents=text,
+            config=tts_config,
+        )
+        candidates = response.candidates or []
+        content = candidates[0].content if candidates else None
+        parts = content.parts if content is not None else None
+        inline_data = parts[0].inline_data if parts else None
+        return inline_data.data if inline_data else None
+
+    def _turn_cache_key(self, voice_name: Optional[str], text: str) -> str:
+        """Hash everything that determines a turn's synthesized audio."""
+        key = f"{self.TTS_MODEL}\0{self.TTS_TEMPERATURE}\0{voice_name}\0{text}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _read_cached_turn(self, cache_key: str) -> Optional[bytes]:
+        """Return cached PCM for a turn, or None on a miss or unreadable entry."""
+        if self.cache_dir is None:
+            return None
+
+        path = self.cache_dir / f"{cache_key}.pcm"
+        try:
+            data = path.read_bytes()
+            # Mark as recently used for pruning
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Ignoring unreadable TTS cache entry {path}: {e}")
+            return None
+        return data or None
+
+    def _write_cached_turn(self, cache_key: str, pcm: bytes) -> None:
+        """Store a turn's PCM in the cache; failures are logged and ignored."""
+        if self.cache_dir is None:
+            return
+
+        path = self.cache_dir / f"{cache_key}.pcm"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(pcm)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.debug(f"Could not write TTS cache entry {path}: {e}")
+
+    def _prune_turn_cache(self) -> None:
+        """Delete least recently used cache entries until under TTS_CACHE_MAX_BYTES."""
+        if self.cache_dir is None:
+            return
+
+        try:
+            entries = [(entry.stat(), entry) for entry in self.cache_dir.glob("*.pcm")]
+        except OSError:
+            return
+
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+            if total <= self.TTS_CACHE_MAX_BYTES:
+                break
+            try:
+                entry.unlink()
+                total -= stat.st_size
+            except OSError as e:
+                logger.debug(f"Could not prune TTS cache entry {entry}: {e}")
 
     def generate_audio(self, script: str, output_file: Optional[Path] = None) -> AudioResult:
         """Generate audio from a podcast script."""
@@ -140,7 +238,6 @@ class AudioGenerator:
             raise AudioGenerationError("No speakable turns found in script")
 
         logger.info(f"Synthesizing {len(turns)} turns with Vertex AI TTS...")
-        pcm_data = self._synthesize_turns(turns)
 
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
             tmp_path = Path(tmp.name)
@@ -149,7 +246,9 @@ class AudioGenerator:
                 wav_file.setnchannels(1)
                 wav_file.setsampwidth(2)
                 wav_file.setframerate(self.SAMPLE_RATE)
-                wav_file.writeframes(pcm_data)
+                # Each turn goes straight to disk; the header is fixed up on close
+                for pcm in self._synthesize_turns(turns):
+                    wav_file.writeframesraw(pcm)
 
             self.convert_wav_to_mp3(tmp_path, output_file)
         finally:
@@ -158,7 +257,10 @@ class AudioGenerator:
             except Exception:
                 pass
 
-        file_size = output_file.stat().st_size if output_file.exists() else None
+        try:
+            file_size: Optional[int] = output_file.stat().st_size
+        except FileNotFoundError:
+            file_size = None
         logger.info(f"Audio generated at {output_file}")
         return AudioResult(output_file=output_file, file_size_bytes=file_size)
 
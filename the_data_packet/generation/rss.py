@@ -6,7 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from the_data_packet.core.config import Config, get_config
+from the_data_packet.core.config import Config, get_config, show_slug
 from the_data_packet.core.exceptions import TheDataPacketError
 from the_data_packet.core.logging import get_logger
 from the_data_packet.sources.base import Article
@@ -380,7 +380,7 @@ class RSSGenerator:
         if not self.s3_storage:
             self.s3_storage = S3Storage()
 
-        rss_key = f"{self.config.show_name.lower().replace(' ', '-')}/feed.xml"
+        rss_key = f"{show_slug(self.config.show_name)}/feed.xml"
 
         try:
             response = self.s3_storage.s3_client.get_object(Bucket=self.s3_storage.bucket_name, Key=rss_key)
@@ -398,7 +398,7 @@ class RSSGenerator:
         self.config.output_directory.mkdir(parents=True, exist_ok=True)
 
         # Generate filename
-        rss_filename = f"{self.config.show_name.lower().replace(' ', '-')}_feed.xml"
+        rss_filename = f"{show_slug(self.config.show_name)}_feed.xml"
         rss_path = self.config.output_directory / rss_filename
 
         try:
@@ -417,7 +417,7 @@ class RSSGenerator:
             self.s3_storage = S3Storage()
 
         # Use consistent S3 key for RSS feed
-        rss_key = f"{self.config.show_name.lower().replace(' ', '-')}/feed.xml"
+        rss_key = f"{show_slug(self.config.show_name)}/feed.xml"
 
         return self.s3_storage.upload_file(rss_path, rss_key, content_type="application/rss+xml")
 
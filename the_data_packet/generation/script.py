@@ -1,14 +1,16 @@
 """Script generation using Anthropic Claude."""
 
 import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-from anthropic import Anthropic, APIError, RateLimitError
+from anthropic import Anthropic, APIConnectionError, APIError, APIStatusError, RateLimitError
 from tenacity import (
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from the_data_packet.core.config import get_config
@@ -19,9 +21,28 @@ from the_data_packet.sources.base import Article
 logger = get_logger(__name__)
 
 
+def _is_transient_api_error(error: BaseException) -> bool:
+    """Whether an Anthropic API failure is worth retrying.
+
+    Rate limits, server errors (5xx, including 529 overloaded) and
+    connection failures or timeouts are; bad requests, auth and
+    permission errors would fail the same way again.
+    """
+    if isinstance(error, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+
 class ScriptGenerator:
     """Generates podcast scripts from articles using Claude AI."""
 
+    # Message Batches polling; batches usually finish within minutes but may take up to 24h
+    BATCH_POLL_INTERVAL = 30  # seconds
+    BATCH_MAX_WAIT = 3600  # seconds before giving up and generating segments one by one
+    # Upper bound on segment requests in flight at once (kept low for API rate
+    # limits); a 429 on one of them is retried by _request_text, not fatal
+    MAX_SEGMENT_WORKERS = 4
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the script generator.
@@ -69,19 +90,38 @@ class ScriptGenerator:
             summaries: List[str] = []
             processed_articles: List[Article] = []
 
-            for i, article in enumerate(valid_articles, 1):
-                logger.info(f"Generating segment {i}/{len(valid_articles)}: {article.title}")
-                try:
-                    segment, summary = self._generate_segment(article)
-                    segments.append(segment)
-                    summaries.append(summary)
-                    processed_articles.append(article)
-                except AIGenerationError as e:
-                    if "AI refused to process content" in str(e):
-                        logger.warning(f"Skipping non-tech article: {article.title}")
-                        continue  # Skip this article and continue with others
-                    else:
-                        raise  # Re-raise other AIGenerationErrors
+            # Segment responses fetched up front through the Message Batches API;
+            # articles missing here are generated with individual requests
+            batch_responses: Dict[int, str] = {}
+            if self.config.use_message_batches and len(valid_articles) > 1:
+                batch_responses = self._generate_segment_responses_batch(valid_articles)
+
+            # Segments are independent requests, so the ones not answered by the
+            # batch run side by side; results are consumed in article order
+            pending = [i for i in range(len(valid_articles)) if i not in batch_responses]
+            with ThreadPoolExecutor(max_workers=max(1, min(len(pending), self.MAX_SEGMENT_WORKERS))) as executor:
+                futures: Dict[int, Future] = {
+                    i: executor.submit(self._generate_segment, valid_articles[i]) for i in pending
+                }
+
+                for i, article in enumerate(valid_articles, 1):
+                    logger.info(f"Generating segment {i}/{len(valid_articles)}: {article.title}")
+                    try:
+                        if i - 1 in batch_responses:
+                            segment, summary = self._parse_segment_response(batch_responses[i - 1])
+                        else:
+                            segment, summary = futures[i - 1].result()
+                        segments.append(segment)
+                        summaries.append(summary)
+                        processed_articles.append(article)
+                    except AIGenerationError as e:
+                        if "AI refused to process content" in str(e):
+                            logger.warning(f"Skipping non-tech article: {article.title}")
+                            continue  # Skip this article and continue with others
+                        else:
+                            # Don't start segments that are still queued
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            raise  # Re-raise other AIGenerationErrors
 
             if not segments:
                 raise AIGenerationError("No valid tech articles were processed")
@@ -106,38 +146,18 @@ class ScriptGenerator:
                 raise
             raise AIGenerationError(f"Script generation failed: {e}")
 
-    @retry(
-        stop=stop_after_attempt(5),  # More retries for server issues
-        # Faster initial retries
-        wait=wait_exponential(multiplier=1, min=1, max=30),
-        retry=retry_if_exception_type((RateLimitError, APIError)),
-    )
     def _generate_segment(self, article: Article) -> tuple[str, str]:
         """Generate a segment script and summary from an article."""
-        prompt = ARTICLE_TO_SEGMENT_PROMPT.format(
-            article_text=f"TITLE: {article.title}\nAUTHOR: {article.author or 'Unknown'}\nCONTENT: {article.content}"
-        )
-
         try:
-            response = self.client.messages.create(
-                model=self.config.claude_model,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                messages=[{"role": "user", "content": prompt}],
-            )
-
-            # Get text content from response
-            content_block = response.content[0]
-            if hasattr(content_block, "text"):
-                content = content_block.text.strip()
-            else:
-                raise AIGenerationError("Response content block has no text attribute")
+            content = self._request_text(**self._segment_request_params(article))
 
             # Parse response to extract segment and summary
             segment, summary = self._parse_segment_response(content)
 
             return segment, summary
 
+        except AIGenerationError:
+            raise
         except RateLimitError as e:
             logger.warning(f"Rate limit hit for '{article.title}': {e}")
             raise AIGenerationError(f"Rate limit exceeded: {e}")
@@ -150,10 +170,77 @@ class ScriptGenerator:
 
     @retry(
         stop=stop_after_attempt(5),  # More retries for server issues
-        # Faster initial retries
-        wait=wait_exponential(multiplier=1, min=1, max=30),
-        retry=retry_if_exception_type((RateLimitError, APIError)),
+        # Jittered so concurrent segment workers hitting the same 429 don't
+        # all retry in lockstep
+        wait=wait_random_exponential(multiplier=1, min=1, max=30),
+        retry=retry_if_exception(_is_transient_api_error),
+        reraise=True,
     )
+    def _request_text(self, **params: Any) -> str:
+        """Send one Messages API request and return its stripped text.
+
+        SDK errors propagate so the retry policy can see them; callers
+        convert whatever is left after retries into AIGenerationError.
+        """
+        response = self.client.messages.create(**params)
+
+        # Get text content from response
+        content_block = response.content[0]
+        if not hasattr(content_block, "text"):
+            raise AIGenerationError("Response content block has no text attribute")
+        text: str = content_block.text.strip()
+        return text
+
+    def _segment_request_params(self, article: Article) -> Dict[str, Any]:
+        """Build the Messages API parameters for an article's segment prompt."""
+        prompt = ARTICLE_TO_SEGMENT_PROMPT.format(
+            article_text=f"TITLE: {article.title}\nAUTHOR: {article.author or 'Unknown'}\nCONTENT: {article.content}"
+        )
+        return {
+            "model": self.config.claude_model,
+            "max_tokens": self.config.max_tokens,
+            "temperature": self.config.temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _generate_segment_responses_batch(self, articles: List[Article]) -> Dict[int, str]:
+        """Generate all segment responses with one Message Batches request.
+
+        Returns the raw response text keyed by article index. Requests that
+        error, expire, or don't finish within BATCH_MAX_WAIT are left out so
+        the caller generates them individually instead.
+        """
+        requests: List[Any] = [
+            {"custom_id": str(i), "params": self._segment_request_params(article)} for i, article in enumerate(articles)
+        ]
+
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+            logger.info(f"Submitted message batch {batch.id} with {len(articles)} segment requests")
+
+            deadline = time.monotonic() + self.BATCH_MAX_WAIT
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    logger.warning(f"Message batch {batch.id} did not finish in time, generating segments individually")
+                    self.client.messages.batches.cancel(batch.id)
+                    return {}
+                time.sleep(self.BATCH_POLL_INTERVAL)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            responses: Dict[int, str] = {}
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    logger.warning(f"Batch request {entry.custom_id} {entry.result.type}, will retry individually")
+                    continue
+                content_block = entry.result.message.content[0]
+                if hasattr(content_block, "text"):
+                    responses[int(entry.custom_id)] = content_block.text.strip()
+            return responses
+
+        except APIError as e:
+            logger.warning(f"Message batch failed, generating segments individually: {e}")
+            return {}
+
     def _generate_framework(self, summaries: List[str]) -> str:
         """Generate show opening, transitions, and closing."""
         prompt = SUMMARIES_TO_FRAMEWORK_PROMPT.format(
@@ -164,20 +251,13 @@ class ScriptGenerator:
         )
 
         try:
-            response = self.client.messages.create(
+            return self._request_text(
                 model=self.config.claude_model,
                 max_tokens=self.config.max_tokens,
                 temperature=self.config.temperature,
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            # Get text content from response
-            content_block = response.content[0]
-            if hasattr(content_block, "text"):
-                return content_block.text.strip()
-            else:
-                raise AIGenerationError("Response content block has no text attribute")
-
         except Exception as e:
             raise AIGenerationError(f"Failed to generate show framework: {e}")
 
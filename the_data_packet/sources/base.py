@@ -24,12 +24,21 @@ Future Sources (extensible):
     - HackerNewsSource
 """
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
+from the_data_packet.utils.http import HTTPClient
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__; the flag needs Python 3.10+.
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+# Public fields serialized by Article.to_dict(), in output order
+_ARTICLE_FIELDS = ("title", "content", "author", "url", "category", "source")
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Article:
     """Represents a single news article from any source.
 
@@ -45,6 +54,9 @@ class Article:
         category: Article category (e.g., 'security', 'guide'). Optional.
         source: Source identifier (e.g., 'wired'). Optional but recommended.
 
+    The stripped content length is measured once at construction, so content
+    should be treated as immutable after the article is created.
+
     Content Requirements:
         - Title must be non-empty
         - Content must be at least 100 characters after stripping whitespace
@@ -71,6 +83,11 @@ class Article:
     url: Optional[str] = None
     category: Optional[str] = None
     source: Optional[str] = None
+    _content_length: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the stripped content length used by is_valid()."""
+        self._content_length = len(self.content.strip()) if self.content else 0
 
     def is_valid(self) -> bool:
         """Check if article has sufficient content for podcast generation.
@@ -88,26 +105,25 @@ class Article:
                 logger.warning(f"Skipping invalid article: {article.title}")
                 continue
         """
-        return bool(self.title and self.content and len(self.content.strip()) > 100)
+        return bool(self.title) and self._content_length > 100
 
-    def to_dict(self) -> Dict[str, Optional[str]]:
+    def to_dict(self, exclude: Iterable[str] = ()) -> Dict[str, Optional[str]]:
         """Convert article to dictionary representation.
 
+        Args:
+            exclude: Field names to leave out (e.g. ``{"content"}`` for metadata)
+
         Returns:
-            Dictionary with all article fields
+            Dictionary with all article fields not in ``exclude``
 
         Example:
             article_data = article.to_dict()
             json.dump(article_data, file)
         """
-        return {
-            "title": self.title,
-            "content": self.content,
-            "author": self.author,
-            "url": self.url,
-            "category": self.category,
-            "source": self.source,
-        }
+        if not exclude:
+            return {name: getattr(self, name) for name in _ARTICLE_FIELDS}
+        skip = frozenset(exclude)
+        return {name: getattr(self, name) for name in _ARTICLE_FIELDS if name not in skip}
 
 
 class ArticleSource(ABC):
@@ -151,6 +167,11 @@ class ArticleSource(ABC):
             articles = source.get_multiple_articles("security", count=5)
     """
 
+    # Feed URLs to skip before anything is fetched (see exclude_urls)
+    excluded_urls: FrozenSet[str] = frozenset()
+    # HTTP client (and its connection pool) shared by every source instance
+    _shared_http_client: Optional[HTTPClient] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -223,6 +244,45 @@ class ArticleSource(ABC):
         """
         pass
 
+    def prefetch_feeds(self, categories: List[str]) -> None:
+        """Warm any per-category feed data ahead of article collection.
+
+        Sources that read one feed per category can override this to fetch
+        those feeds concurrently before the categories are processed one by
+        one. The default implementation does nothing.
+
+        Args:
+            categories: Categories that are about to be collected
+        """
+
+    def exclude_urls(self, urls: Iterable[str]) -> None:
+        """Skip the given article URLs when reading feeds.
+
+        Excluded URLs are dropped from feed results before any page is
+        downloaded, and the next entries in the feed take their place. Used
+        to pass in articles already covered by earlier episodes.
+
+        Args:
+            urls: Article URLs to skip
+        """
+        self.excluded_urls = frozenset(urls)
+
+    @staticmethod
+    def _get_shared_http_client() -> HTTPClient:
+        """Return the HTTP client shared by all sources, creating it on first use.
+
+        One session serves every source and category, so keep-alive
+        connections and TLS sessions are reused for the whole process.
+        """
+        if ArticleSource._shared_http_client is None:
+            ArticleSource._shared_http_client = HTTPClient()
+        return ArticleSource._shared_http_client
+
+    @cached_property
+    def _supported_set(self) -> FrozenSet[str]:
+        """Supported categories as a frozenset, built once per instance for O(1) lookups."""
+        return frozenset(self.supported_categories)
+
     def validate_category(self, category: str) -> None:
         """Validate if a category is supported by this source.
 
@@ -238,7 +298,7 @@ class ArticleSource(ABC):
         """
         from ..core.exceptions import ValidationError
 
-        if category not in self.supported_categories:
+        if category not in self._supported_set:
             raise ValidationError(
                 f"Category '{category}' not supported by {self.name}. "
                 f"Supported categories: {', '.join(self.supported_categories)}"
@@ -31,6 +31,7 @@ Supported Categories:
 Rate Limiting:
     - Respectful delays between requests
     - Connection reuse via HTTP session
+    - Conditional GETs (ETag/Last-Modified) against an on-disk article cache
     - Proper User-Agent identification
 
 Example Usage:
@@ -49,15 +50,19 @@ Example Usage:
 
 import re
 import time
-from typing import List, Optional
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from pathlib import Path
+from typing import Iterator, List, Optional
 
-import feedparser
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
+from the_data_packet.core.config import get_config
 from the_data_packet.core.exceptions import NetworkError, ScrapingError
 from the_data_packet.core.logging import get_logger
 from the_data_packet.sources.base import Article, ArticleSource
-from the_data_packet.utils.http import HTTPClient
+from the_data_packet.utils.cache import ResponseCache
 
 logger = get_logger(__name__)
 
@@ -67,7 +72,8 @@ class TechCrunchSource(ArticleSource):
 
     def __init__(self) -> None:
         """Initialize TechCrunch source."""
-        self.http_client = HTTPClient()
+        self.http_client = self._get_shared_http_client()
+        self._cache = ResponseCache(Path(get_config().article_cache_dir) / self.name)
         logger.info("Initialized TechCrunch source")
 
     # RSS feed URLs for different categories
@@ -92,6 +98,56 @@ class TechCrunchSource(ArticleSource):
         "share this article",
     ]
 
+    # Single alternation so skip checks are one C-level scan instead of a Python loop
+    _SKIP_ALTERNATION = "|".join(map(re.escape, SKIP_PATTERNS))
+    _SKIP_RE = re.compile(_SKIP_ALTERNATION)
+
+    # Fallback for text whose lowercase form changes length (e.g. "İ"), where
+    # offsets into a lowercased copy would not line up with the original
+    _SKIP_RE_IGNORECASE = re.compile(_SKIP_ALTERNATION, re.IGNORECASE)
+
+    # Patterns used on every extracted article
+    _TITLE_SUFFIX_RE = re.compile(r"\s*\|\s*TechCrunch.*$")
+    _WS_RE = re.compile(r"\s+")
+
+    # CSS selectors compiled once at class load; each list is tried in order
+    _TITLE_SELECTORS = [
+        sv.compile(selector)
+        for selector in (
+            'h1[data-module="ArticleTitle"]',
+            "h1.article__title",
+            "h1",
+            '[data-module="ArticleTitle"]',
+            ".post-title",
+            ".entry-title",
+        )
+    ]
+    _AUTHOR_SELECTORS = [
+        sv.compile(selector)
+        for selector in (
+            '[data-module="ArticleByline"] a',
+            ".byline a",
+            ".author a",
+            ".post-author a",
+            '[rel="author"]',
+            ".article-author a",
+        )
+    ]
+    _CONTENT_SELECTORS = [
+        sv.compile(selector)
+        for selector in (
+            '[data-module="ArticleBody"]',
+            ".article-content",
+            ".post-content",
+            ".entry-content",
+            ".article__content",
+            "div.article-entry",
+        )
+    ]
+
+    # Elements stripped from the page before content extraction
+    _UNWANTED_SELECTOR = sv.compile("script, style, .advertisement, .ad, .promo")
+
     @property
     def name(self) -> str:
         """Source name identifier."""
@@ -136,8 +192,8 @@ class TechCrunchSource(ArticleSource):
         logger.info(f"Fetching {count} {category} articles from TechCrunch")
 
         try:
-            # Get multiple URLs from RSS
-            urls = self._get_urls_from_rss(category, count)
+            # URLs are pulled from the feed as each article is processed
+            urls = self._iter_urls_from_rss(category, count)
 
             articles = []
             for i, url in enumerate(urls):
@@ -168,70 +224,77 @@ class TechCrunchSource(ArticleSource):
 
     def _get_latest_url_from_rss(self, category: str) -> str:
         """Get the latest article URL from RSS feed."""
+        return next(self._iter_urls_from_rss(category, 1))
+
+    def _iter_urls_from_rss(self, category: str, count: int) -> Iterator[str]:
+        """Yield up to ``count`` article URLs from the category's RSS feed."""
         rss_url = self.RSS_FEEDS[category]
 
         try:
             logger.debug(f"Fetching RSS feed: {rss_url}")
-            response = self.http_client.get(rss_url)
-            response.raise_for_status()
-
-            # Parse RSS feed
-            feed = feedparser.parse(response.text)
-
-            if not feed.entries:
-                raise ScrapingError(f"No articles found in RSS feed: {rss_url}")
-
-            # Get latest article URL
-            latest_entry = feed.entries[0]
-            if not hasattr(latest_entry, "link"):
-                raise ScrapingError(f"RSS entry missing link: {latest_entry}")
-
-            return str(latest_entry.link)
-
+            content = self.http_client.get_bounded(rss_url, max_bytes=self.http_client.MAX_FEED_BYTES)
         except Exception as e:
             if isinstance(e, ScrapingError):
                 raise
             raise NetworkError(f"Failed to fetch RSS feed {rss_url}: {e}")
 
-    def _get_urls_from_rss(self, category: str, count: int) -> List[str]:
-        """Get multiple article URLs from RSS feed."""
-        rss_url = self.RSS_FEEDS[category]
+        found = 0
+        for link in self._iter_feed_links(content):
+            if link in self.excluded_urls:
+                continue
+            yield link
+            found += 1
+            if found >= count:
+                return
 
-        try:
-            logger.debug(f"Fetching RSS feed: {rss_url}")
-            response = self.http_client.get(rss_url)
-            response.raise_for_status()
+        if not found:
+            raise ScrapingError(f"No valid URLs found in RSS feed: {rss_url}")
 
-            # Parse RSS feed
-            feed = feedparser.parse(response.text)
+    @staticmethod
+    def _iter_feed_links(xml_bytes: bytes) -> Iterator[str]:
+        """Yield item links from RSS or Atom feed bytes.
 
-            if not feed.entries:
-                raise ScrapingError(f"No articles found in RSS feed: {rss_url}")
+        Items are parsed incrementally, so the feed is only walked as far as
+        the caller consumes links.
+        """
+        found = 0
 
-            # Extract URLs up to requested count
-            urls = []
-            for entry in feed.entries[:count]:
-                if hasattr(entry, "link"):
-                    urls.append(entry.link)
+        try:
+            for _, element in ET.iterparse(BytesIO(xml_bytes), events=("end",)):
+                tag = element.tag.rsplit("}", 1)[-1]
+                if tag not in ("item", "entry"):
+                    continue
 
-            if not urls:
-                raise ScrapingError(f"No valid URLs found in RSS feed: {rss_url}")
+                link_elem = element.find("{*}link")
+                element.clear()
+                if link_elem is None:
+                    continue
 
-            return urls
+                # RSS puts the URL in the text, Atom in the href attribute
+                link = (link_elem.text or "").strip() or link_elem.get("href", "")
+                if link:
+                    found += 1
+                    yield link
 
-        except Exception as e:
-            if isinstance(e, ScrapingError):
-                raise
-            raise NetworkError(f"Failed to fetch RSS feed {rss_url}: {e}")
+        except ET.ParseError as e:
+            if not found:
+                raise ScrapingError(f"Malformed RSS feed: {e}")
+            logger.warning(f"RSS feed truncated after {found} links: {e}")
 
     def _extract_article(self, url: str, category: str) -> Article:
         """Extract article content from a TechCrunch URL."""
         try:
             logger.debug(f"Extracting article: {url}")
-            response = self.http_client.get(url)
-            response.raise_for_status()
+            cached = self._cache.get(url)
+            headers = cached.conditional_headers() if cached else None
+            response = self.http_client.get(url, stream=True, headers=headers)
+
+            if cached and response.status_code == 304:
+                response.close()
+                logger.debug(f"Article not modified, using cached copy: {url}")
+                return Article(**cached.data)
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self.http_client.parse_soup(response, url)
 
             # Extract title
             title = self._extract_title(soup)
@@ -249,7 +312,7 @@ class TechCrunchSource(ArticleSource):
             # Clean content
             content = self._clean_content(content)
 
-            return Article(
+            article = Article(
                 title=title,
                 content=content,
                 author=author,
@@ -258,6 +321,14 @@ class TechCrunchSource(ArticleSource):
                 source=self.name,
             )
 
+            self._cache.set(
+                url,
+                article.to_dict(),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            return article
+
         except Exception as e:
             if isinstance(e, (ScrapingError, NetworkError)):
                 raise
@@ -266,17 +337,8 @@ class TechCrunchSource(ArticleSource):
     def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract article title from HTML."""
         # Try multiple selectors for title
-        title_selectors = [
-            'h1[data-module="ArticleTitle"]',
-            "h1.article__title",
-            "h1",
-            '[data-module="ArticleTitle"]',
-            ".post-title",
-            ".entry-title",
-        ]
-
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
+        for selector in self._TITLE_SELECTORS:
+            title_elem = selector.select_one(soup)
             if title_elem:
                 title = title_elem.get_text().strip()
                 if title:
@@ -287,7 +349,7 @@ class TechCrunchSource(ArticleSource):
         if title_tag:
             title = title_tag.get_text().strip()
             # Remove common TechCrunch suffixes
-            title = re.sub(r"\s*\|\s*TechCrunch.*$", "", title)
+            title = self._TITLE_SUFFIX_RE.sub("", title)
             return title
 
         return None
@@ -295,17 +357,8 @@ class TechCrunchSource(ArticleSource):
     def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract article author from HTML."""
         # Try multiple selectors for author
-        author_selectors = [
-            '[data-module="ArticleByline"] a',
-            ".byline a",
-            ".author a",
-            ".post-author a",
-            '[rel="author"]',
-            ".article-author a",
-        ]
-
-        for selector in author_selectors:
-            author_elem = soup.select_one(selector)
+        for selector in self._AUTHOR_SELECTORS:
+            author_elem = selector.select_one(soup)
             if author_elem:
                 author = author_elem.get_text().strip()
                 if author:
@@ -315,71 +368,74 @@ class TechCrunchSource(ArticleSource):
 
     def _extract_content(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract article content from HTML."""
-        # Try multiple selectors for content
-        content_selectors = [
-            '[data-module="ArticleBody"]',
-            ".article-content",
-            ".post-content",
-            ".entry-content",
-            ".article__content",
-            "div.article-entry",
-        ]
+        # Remove unwanted elements once for the whole page rather than per tried container
+        for unwanted in self._UNWANTED_SELECTOR.select(soup):
+            unwanted.decompose()
 
-        for selector in content_selectors:
-            content_elem = soup.select_one(selector)
+        # Try multiple selectors for content
+        for selector in self._CONTENT_SELECTORS:
+            content_elem = selector.select_one(soup)
             if content_elem:
-                # Remove unwanted elements
-                for unwanted in content_elem.select("script, style, .advertisement, .ad, .promo"):
-                    unwanted.decompose()
-
+                # get_text(strip=True) output is already trimmed, so length alone decides
                 content = content_elem.get_text(separator=" ", strip=True)
-                if content and len(content.strip()) > 100:
+                if len(content) > 100:
                     return content
 
-        # Fallback: try to get all paragraphs
-        paragraphs = soup.select("p")
+        # Fallback: try to get all paragraphs (plain tag walk, no CSS engine needed)
+        paragraphs = soup.find_all("p")
         if paragraphs:
-            content_parts = []
+            content_parts: List[str] = []
             for p in paragraphs:
                 text = p.get_text().strip()
                 if text and not self._should_skip_content(text):
                     content_parts.append(text)
 
             content = " ".join(content_parts)
-            if len(content.strip()) > 100:
+            if len(content) > 100:
                 return content
 
         return None
 
     def _clean_content(self, content: str) -> str:
-        """Clean extracted content."""
+        """Clean extracted content.
+
+        Skip patterns are located with one regex scan over the whole text;
+        each hit removes the ". "-delimited sentence containing it.
+        """
         if not content:
             return ""
 
         # Remove multiple whitespace
-        content = re.sub(r"\s+", " ", content)
+        content = self._WS_RE.sub(" ", content)
 
-        # Remove content that matches skip patterns
-        lines = content.split(". ")
-        cleaned_lines = []
+        haystack = content.lower()
+        matcher = self._SKIP_RE
+        if len(haystack) != len(content):
+            haystack, matcher = content, self._SKIP_RE_IGNORECASE
 
-        for line in lines:
-            if not self._should_skip_content(line):
-                cleaned_lines.append(line)
+        # Remove sentences that contain skip patterns
+        kept = []
+        pos = 0
+        for match in matcher.finditer(haystack):
+            if match.start() < pos:
+                continue  # Sentence already removed
 
-        return ". ".join(cleaned_lines).strip()
+            sentence_start = content.rfind(". ", pos, match.start())
+            sentence_start = pos if sentence_start == -1 else sentence_start + 2
+            sentence_end = content.find(". ", match.end())
+            sentence_end = len(content) if sentence_end == -1 else sentence_end + 2
 
-    def _should_skip_content(self, text: str) -> bool:
-        """Check if content should be skipped based on patterns."""
-        text_lower = text.lower()
+            kept.append(content[pos:sentence_start])
+            pos = sentence_end
 
-        # Skip if matches any skip pattern
-        for pattern in self.SKIP_PATTERNS:
-            if pattern in text_lower:
-                return True
+        kept.append(content[pos:])
+        return "".join(kept).strip()
 
+    def _should_skip_content(self, text: str) -> bool:
+        """Check if content should be skipped based on patterns."""
         # Skip if too short
         if len(text.strip()) < 10:
             return True
 
-        return False
+        # Skip if matches any skip pattern
+        return self._SKIP_RE.search(text.lower()) is not None
@@ -32,7 +32,7 @@ Supported Categories:
     - ai: Artificial intelligence and machine learning
 
 Rate Limiting:
-    - Respectful delays between requests
+    - At most MAX_WORKERS article pages fetched concurrently
     - Connection reuse via HTTP session
     - Proper User-Agent identification
 
@@ -51,25 +51,46 @@ Example Usage:
 """
 
 import re
-from typing import List, Optional
-
-import feedparser
-from bs4 import BeautifulSoup
-
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+from lxml.html import HtmlElement
+
+from the_data_packet.core.config import get_config
 from the_data_packet.core.exceptions import NetworkError, ScrapingError
 from the_data_packet.core.logging import get_logger
 from the_data_packet.sources.base import Article, ArticleSource
-from the_data_packet.utils.http import HTTPClient
+from the_data_packet.utils.cache import ResponseCache
 
 logger = get_logger(__name__)
 
 
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains ``name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
 class WiredSource(ArticleSource):
     """Article source for Wired.com."""
 
     def __init__(self) -> None:
         """Initialize Wired source."""
-        self.http_client = HTTPClient()
+        config = get_config()
+        self.http_client = self._get_shared_http_client()
+        self.max_content_chars = config.max_article_chars
+        # category -> (monotonic fetch time, entry links)
+        self._feed_cache: Dict[str, Tuple[float, List[str]]] = {}
+        # Feed validators and links kept across runs for conditional requests
+        self._feed_http_cache = ResponseCache(Path(config.article_cache_dir) / self.name / "feeds")
+        # url -> (monotonic extraction time, article), least recently used first
+        self._article_cache: OrderedDict[str, Tuple[float, Article]] = OrderedDict()
+        self._article_cache_lock = threading.Lock()
         logger.info("Initialized Wired source")
 
     # RSS feed URLs for different categories
@@ -79,6 +100,18 @@ class WiredSource(ArticleSource):
         "ai": "https://www.wired.com/feed/tag/ai/latest/rss",
     }
 
+    # Upper bound on article pages fetched concurrently
+    MAX_WORKERS = 4
+
+    # Seconds a fetched RSS feed is reused before being downloaded again
+    FEED_CACHE_TTL = 300
+
+    # Seconds an extracted article is reused before its page is scraped again
+    ARTICLE_CACHE_TTL = 3600
+
+    # Most extracted articles kept in memory; least recently used go first
+    ARTICLE_CACHE_MAX_ENTRIES = 256
+
     # Content patterns to skip during extraction
     SKIP_PATTERNS = [
         "subscribe to wired",
@@ -90,6 +123,34 @@ class WiredSource(ArticleSource):
         "newsletter",
     ]
 
+    _WS_RE = re.compile(r"\s+")
+
+    # Page selectors, tried in order; the first match of the first XPath that
+    # matches wins, mirroring select_one() over a CSS selector list.
+    _TITLE_XPATHS = [
+        etree.XPath("//h1[@data-testid='ContentHeaderHed']"),
+        etree.XPath(f"//h1[{_has_class('ContentHeaderHed')}]"),
+        etree.XPath(f"//h1[{_has_class('entry-title')}]"),
+        etree.XPath("//h1"),
+        etree.XPath("//title"),
+    ]
+    _AUTHOR_XPATHS = [
+        etree.XPath("//*[@data-testid='ContentHeaderAccreditation']//a"),
+        etree.XPath(f"//*[{_has_class('ContentHeaderAccreditation')}]//a"),
+        etree.XPath(f"//*[{_has_class('byline')}]//a"),
+        etree.XPath(f"//*[{_has_class('author')}]//a"),
+        etree.XPath("//*[@rel='author']"),
+    ]
+    _CONTENT_XPATHS = [
+        etree.XPath("//*[@data-testid='ArticleBodyWrapper']"),
+        etree.XPath(f"//*[{_has_class('ArticleBodyWrapper')}]"),
+        etree.XPath(f"//*[{_has_class('content-body')}]"),
+        etree.XPath(f"//*[{_has_class('entry-content')}]"),
+        etree.XPath("//article"),
+    ]
+    # Every <p> and <div> below the content container, in document order
+    _PARAGRAPH_XPATH = etree.XPath(".//p|.//div")
+
     @property
     def name(self) -> str:
         """Source name identifier."""
@@ -134,17 +195,10 @@ class WiredSource(ArticleSource):
             # Get multiple URLs from RSS
             urls = self._get_urls_from_rss(category, count)
 
-            articles = []
-            for url in urls:
-                try:
-                    article = self._extract_article(url, category)
-                    if article.is_valid():
-                        articles.append(article)
-                    else:
-                        logger.warning(f"Skipping invalid article: {url}")
-                except Exception as e:
-                    logger.warning(f"Failed to extract article {url}: {e}")
-                    continue
+            # Page fetches are I/O-bound, so overlap them; map() keeps feed order
+            with ThreadPoolExecutor(max_workers=min(len(urls), self.MAX_WORKERS)) as executor:
+                results = executor.map(lambda url: self._try_extract_article(url, category), urls)
+                articles = [article for article in results if article is not None]
 
             if not articles:
                 raise ScrapingError(f"No valid articles found in {category}")
@@ -157,6 +211,41 @@ class WiredSource(ArticleSource):
                 raise
             raise ScrapingError(f"Failed to get articles from {category}: {e}")
 
+    def prefetch_feeds(self, categories: List[str]) -> None:
+        """Download the RSS feeds for several categories concurrently.
+
+        Fetched feeds are cached for FEED_CACHE_TTL seconds so the following
+        per-category calls skip the network. Failures are logged and left for
+        the per-category call to retry and report.
+        """
+        categories = [c for c in dict.fromkeys(categories) if c in self.RSS_FEEDS]
+        if not categories:
+            return
+
+        def fetch(category: str) -> None:
+            try:
+                self._store_feed(category, self._fetch_feed(category))
+            except Exception as e:
+                logger.warning(f"Failed to prefetch RSS feed for {category}: {e}")
+
+        logger.debug(f"Prefetching RSS feeds: {', '.join(categories)}")
+        with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+            list(executor.map(fetch, categories))
+
+    def _try_extract_article(self, url: str, category: str) -> Optional[Article]:
+        """Extract an article, logging and returning None if it fails or is invalid."""
+        try:
+            article = self._extract_article(url, category)
+        except Exception as e:
+            logger.warning(f"Failed to extract article {url}: {e}")
+            return None
+
+        if not article.is_valid():
+            logger.warning(f"Skipping invalid article: {url}")
+            return None
+
+        return article
+
     def _get_latest_url_from_rss(self, category: str) -> str:
         """Get the latest article URL from RSS feed."""
         urls = self._get_urls_from_rss(category, 1)
@@ -171,17 +260,18 @@ class WiredSource(ArticleSource):
         logger.debug(f"Fetching RSS feed: {rss_url}")
 
         try:
-            # Parse RSS feed
-            feed = feedparser.parse(rss_url)
+            links = self._get_feed(category)
 
-            if not feed.entries:
+            if not links:
                 raise ScrapingError(f"No entries found in RSS feed for {category}")
 
             # Extract URLs
             urls = []
-            for entry in feed.entries[:count]:
-                if hasattr(entry, "link"):
-                    urls.append(entry.link)
+            for link in links:
+                if link not in self.excluded_urls:
+                    urls.append(link)
+                    if len(urls) >= count:
+                        break
 
             if not urls:
                 raise ScrapingError(f"No valid URLs found in RSS feed for {category}")
@@ -194,18 +284,109 @@ class WiredSource(ArticleSource):
                 raise
             raise NetworkError(f"Failed to fetch RSS feed {rss_url}: {e}")
 
+    def _get_feed(self, category: str) -> List[str]:
+        """Return a category's feed entry links, reusing a fresh cached copy."""
+        cached = self._feed_cache.get(category)
+        if cached and time.monotonic() - cached[0] < self.FEED_CACHE_TTL:
+            return cached[1]
+
+        feed = self._fetch_feed(category)
+        self._store_feed(category, feed)
+        return feed
+
+    def _fetch_feed(self, category: str) -> List[str]:
+        """Download a category's RSS feed and return its entry links.
+
+        The feed's ETag/Last-Modified validators are sent on the next poll; a
+        304 Not Modified reply reuses the links stored from the last download
+        without reading or parsing a body.
+        """
+        # Imported here so loading the CLI doesn't pay for feedparser and its
+        # sgmllib/chardet dependencies until a feed is actually read.
+        import feedparser
+
+        rss_url = self.RSS_FEEDS[category]
+        cached = self._feed_http_cache.get(rss_url)
+        headers = cached.conditional_headers() if cached else None
+
+        # Fetching through the client reuses its pooled keep-alive connections
+        # and gzip headers instead of letting feedparser open its own.
+        response = self.http_client.get(rss_url, stream=True, headers=headers)
+        if response.status_code == 304 and cached:
+            response.close()
+            logger.debug(f"RSS feed not modified, reusing cached links: {rss_url}")
+            return list(cached.data["links"])
+
+        # Caps how much of an oversized feed is held in memory
+        content = self.http_client.read_bounded(response, rss_url, max_bytes=self.http_client.MAX_FEED_BYTES)
+        # Only entry links are read, so skip sanitizing and URI-resolving
+        # every entry's HTML summary and content.
+        feed = feedparser.parse(content, sanitize_html=False, resolve_relative_uris=False)
+        links = [entry.link for entry in feed.entries if hasattr(entry, "link")]
+
+        self._feed_http_cache.set(
+            rss_url,
+            {"links": links},
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return links
+
+    def _store_feed(self, category: str, links: List[str]) -> None:
+        """Cache a feed's entry links with their fetch time."""
+        self._feed_cache[category] = (time.monotonic(), links)
+
+    def clear_article_cache(self) -> None:
+        """Forget every extracted article so later requests scrape pages again."""
+        with self._article_cache_lock:
+            self._article_cache.clear()
+
     def _extract_article(self, url: str, category: str) -> Article:
         """Extract article content from a Wired article page."""
+        with self._article_cache_lock:
+            cached = self._article_cache.get(url)
+            if cached and time.monotonic() - cached[0] < self.ARTICLE_CACHE_TTL:
+                self._article_cache.move_to_end(url)
+            else:
+                cached = None
+
+        if cached:
+            logger.debug(f"Using cached article: {url}")
+            # The same story can appear in several category feeds
+            return replace(cached[1], category=category)
+
+        article = self._scrape_article(url, category)
+        self._cache_article(url, article)
+        return article
+
+    def _cache_article(self, url: str, article: Article) -> None:
+        """Cache an extracted article, dropping expired and least recently used entries."""
+        now = time.monotonic()
+        with self._article_cache_lock:
+            self._article_cache[url] = (now, article)
+            self._article_cache.move_to_end(url)
+
+            expired = [
+                key for key, (fetched, _) in self._article_cache.items() if now - fetched >= self.ARTICLE_CACHE_TTL
+            ]
+            for key in expired:
+                del self._article_cache[key]
+
+            while len(self._article_cache) > self.ARTICLE_CACHE_MAX_ENTRIES:
+                self._article_cache.popitem(last=False)
+
+    def _scrape_article(self, url: str, category: str) -> Article:
+        """Fetch and parse a Wired article page."""
         logger.debug(f"Extracting article: {url}")
 
         try:
             # Fetch article page
-            soup = self._fetch_page(url)
+            doc = self._fetch_page(url)
 
             # Extract article data
-            title = self._extract_title(soup)
-            author = self._extract_author(soup)
-            content = self._extract_content(soup)
+            title = self._extract_title(doc)
+            author = self._extract_author(doc)
+            content = self._extract_content(doc, self.max_content_chars)
 
             return Article(
                 title=title,
@@ -221,96 +402,78 @@ class WiredSource(ArticleSource):
                 raise
             raise ScrapingError(f"Failed to extract article from {url}: {e}")
 
-    def _fetch_page(self, url: str) -> BeautifulSoup:
+    def _fetch_page(self, url: str) -> HtmlElement:
         """Fetch and parse a web page."""
-        soup = self.http_client.get_soup(url)
-        return soup
+        return self.http_client.get_lxml(url)
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, doc: HtmlElement) -> str:
         """Extract article title."""
-        # Try multiple selectors for title
-        selectors = [
-            "h1[data-testid='ContentHeaderHed']",
-            "h1.ContentHeaderHed",
-            "h1.entry-title",
-            "h1",
-            "title",
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text(strip=True):
-                title = element.get_text(strip=True)
-                # Clean title
-                title = re.sub(r"\s+", " ", title)
+        for xpath in self._TITLE_XPATHS:
+            for element in xpath(doc):
+                title = self._WS_RE.sub(" ", self._text(element))
                 if title and len(title) > 5:  # Basic validation
                     return title
+                break
 
         raise ScrapingError("Could not extract article title")
 
-    def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_author(self, doc: HtmlElement) -> Optional[str]:
         """Extract article author."""
-        # Try multiple selectors for author
-        selectors = [
-            "[data-testid='ContentHeaderAccreditation'] a",
-            ".ContentHeaderAccreditation a",
-            ".byline a",
-            ".author a",
-            "[rel='author']",
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text(strip=True):
-                author = element.get_text(strip=True)
-                author = re.sub(r"\s+", " ", author)
+        for xpath in self._AUTHOR_XPATHS:
+            for element in xpath(doc):
+                author = self._WS_RE.sub(" ", self._text(element))
                 if author:
                     return author
+                break
 
         return None
 
-    def _extract_content(self, soup: BeautifulSoup) -> str:
-        """Extract article content."""
-        # Try multiple selectors for content
-        selectors = [
-            "[data-testid='ArticleBodyWrapper']",
-            ".ArticleBodyWrapper",
-            ".content-body",
-            ".entry-content",
-            "article",
-        ]
+    def _extract_content(self, doc: HtmlElement, max_chars: Optional[int] = None) -> str:
+        """Extract article content.
 
+        Args:
+            doc: Parsed article page
+            max_chars: Stop collecting paragraphs once this many characters are gathered
+        """
         content_element = None
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                content_element = element
+        for xpath in self._CONTENT_XPATHS:
+            matches = xpath(doc)
+            if matches:
+                content_element = matches[0]
                 break
 
-        if not content_element:
+        if content_element is None:
             raise ScrapingError("Could not find article content")
 
-        # Extract text and clean it
+        # itertext() would include inline ad/JSON scripts, styles and comments
+        etree.strip_elements(content_element, "script", "style", etree.Comment, with_tail=False)
+
+        # Extract text, collapsing whitespace per paragraph as it is collected
         paragraphs = []
-        for p in content_element.find_all(["p", "div"], recursive=True):
-            text = p.get_text(strip=True)
+        collected = 0
+        for node in self._PARAGRAPH_XPATH(content_element):
+            text = self._WS_RE.sub(" ", self._text(node))
             if text and len(text) > 20:  # Filter out short snippets
                 # Skip unwanted content
                 text_lower = text.lower()
                 if any(pattern in text_lower for pattern in self.SKIP_PATTERNS):
                     continue
                 paragraphs.append(text)
+                collected += len(text)
+                if max_chars and collected >= max_chars:
+                    break
 
         if not paragraphs:
             raise ScrapingError("No content paragraphs found")
 
-        content = "\n\n".join(paragraphs)
-
-        # Final cleaning
-        content = re.sub(r"\s+", " ", content)
-        content = content.strip()
+        content = " ".join(paragraphs)
 
         if len(content) < 100:
             raise ScrapingError("Article content too short")
 
         return content
+
+    @staticmethod
+    def _text(element: HtmlElement) -> str:
+        """Concatenate an element's stripped text nodes (like BeautifulSoup's get_text(strip=True))."""
+        return "".join(text.strip() for text in element.itertext())
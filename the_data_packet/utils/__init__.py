@@ -1,10 +1,13 @@
 """Utility functions and classes for The Data Packet."""
 
+from the_data_packet.utils.cache import CachedResponse, ResponseCache
 from the_data_packet.utils.http import HTTPClient
 from the_data_packet.utils.s3 import S3Storage, S3UploadResult
 
 __all__ = [
+    "CachedResponse",
     "HTTPClient",
+    "ResponseCache",
     "S3Storage",
     "S3UploadResult",
 ]
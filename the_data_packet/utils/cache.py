@@ -0,0 +1,126 @@
+"""On-disk cache of HTTP validators and parsed payloads keyed by URL.
+
+Entries store the ``ETag`` / ``Last-Modified`` validators returned with a
+response together with a JSON-serializable payload derived from it (for
+example ``Article.to_dict()``). On the next run the validators are sent as
+``If-None-Match`` / ``If-Modified-Since``; a ``304 Not Modified`` reply means
+the cached payload can be reused without downloading or parsing the page.
+
+Each URL maps to one small JSON file named by a hash of the URL, so the
+cache needs no extra dependencies and survives process restarts.
+
+Example:
+    cache = ResponseCache(Path("output/cache/techcrunch"))
+
+    entry = cache.get(url)
+    headers = entry.conditional_headers() if entry else {}
+    response = http_client.get(url, headers=headers)
+
+    if response.status_code == 304 and entry:
+        article = Article(**entry.data)
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from the_data_packet.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """Validators and payload stored for a single URL."""
+
+    url: str
+    data: Dict[str, Any]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build the conditional request headers for this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """JSON-file cache of HTTP validators and payloads keyed by URL."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up the cached entry for a URL.
+
+        Unreadable or corrupt entries are treated as misses.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            CachedResponse if present, otherwise None
+        """
+        path = self._path_for(url)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = CachedResponse(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        # Guard against hash collisions
+        return entry if entry.url == url else None
+
+    def set(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store a payload with its validators.
+
+        Entries without any validator are not stored, since they could never
+        be revalidated. Write failures are logged and otherwise ignored.
+
+        Args:
+            url: URL the payload was derived from
+            data: JSON-serializable payload
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        if not etag and not last_modified:
+            return
+
+        entry = CachedResponse(url=url, data=data, etag=etag, last_modified=last_modified)
+        path = self._path_for(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(asdict(entry), f)
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write cache entry {path}: {e}")
+
+    def _path_for(self, url: str) -> Path:
+        """Map a URL to its cache file."""
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
@@ -1,11 +1,16 @@
 """HTTP client utility."""
 
-from typing import Any, Optional
+from typing import Any, Generator, Optional, Tuple
 
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
-from the_data_packet.core.exceptions import NetworkError
+from the_data_packet.core.exceptions import NetworkError, ScrapingError
 from the_data_packet.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -14,13 +19,33 @@ logger = get_logger(__name__)
 class HTTPClient:
     """Simple HTTP client with error handling and configuration."""
 
-    def __init__(self, timeout: Optional[int] = None, user_agent: Optional[str] = None):
+    # Upper bound on bytes read from a page before parsing; article bodies sit
+    # well within this, the rest is scripts and trackers.
+    MAX_RESPONSE_BYTES = 512 * 1024
+    CHUNK_SIZE = 16384
+    # Upper bound on bytes read from an RSS/Atom feed; real feeds are a few
+    # hundred KB, anything larger is a misbehaving endpoint.
+    MAX_FEED_BYTES = 2 * 1024 * 1024
+
+    # Connections kept alive per host; sized above the scrapers' worker counts
+    # so concurrent fetches don't evict each other and redo TLS handshakes.
+    POOL_SIZE = 32
+    # Transient failures retried at the transport level with exponential backoff
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        timeout: Optional[int] = None,
+        user_agent: Optional[str] = None,
+        parser: str = "lxml",
+    ):
         """
         Initialize HTTP client.
 
         Args:
             timeout: Request timeout (defaults to config)
             user_agent: User agent string (defaults to config)
+            parser: BeautifulSoup parser backend ("html.parser" avoids the lxml C extension)
         """
         from ..core.config import get_config
 
@@ -28,15 +53,25 @@ class HTTPClient:
 
         self.timeout = timeout or config.http_timeout
         self.user_agent = user_agent or config.user_agent
+        self.parser = parser
 
         # Create session
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=self.RETRY_STATUSES),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": self.user_agent,
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
+                # Every codec urllib3 can decode here: gzip/deflate plus br
+                # (brotli) and zstd (zstandard) when those packages are present
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "Connection": "keep-alive",
             }
         )
@@ -66,6 +101,46 @@ class HTTPClient:
         except requests.RequestException as e:
             raise NetworkError(f"HTTP request failed for {url}: {e}")
 
+    def get_bounded(self, url: str, max_bytes: Optional[int] = None, **kwargs: Any) -> bytes:
+        """
+        Stream a URL and return at most ``max_bytes`` of its body.
+
+        Args:
+            url: URL to fetch
+            max_bytes: Maximum number of bytes to read (defaults to MAX_RESPONSE_BYTES)
+            **kwargs: Additional arguments passed to get()
+
+        Returns:
+            Raw response body, truncated to the byte limit
+
+        Raises:
+            NetworkError: If request fails
+        """
+        kwargs["stream"] = True
+        response = self.get(url, **kwargs)
+        return self.read_bounded(response, url, max_bytes)
+
+    def read_bounded(self, response: requests.Response, url: str, max_bytes: Optional[int] = None) -> bytes:
+        """
+        Read at most ``max_bytes`` of a streamed response's body and close it.
+
+        For callers that inspect the response (e.g. for a 304) before
+        deciding whether to read the body.
+
+        Args:
+            response: Response obtained with ``stream=True``
+            url: URL the response came from (for error messages)
+            max_bytes: Maximum number of bytes to read (defaults to MAX_RESPONSE_BYTES)
+
+        Returns:
+            Raw response body, truncated to the byte limit
+
+        Raises:
+            NetworkError: If reading the body fails
+        """
+        body, _ = self._read_bounded(response, url, max_bytes)
+        return body
+
     def get_soup(self, url: str, **kwargs: Any) -> BeautifulSoup:
         """
         Get a URL and return parsed HTML.
@@ -80,5 +155,95 @@ class HTTPClient:
         Raises:
             NetworkError: If request fails
         """
+        kwargs["stream"] = True
         response = self.get(url, **kwargs)
-        return BeautifulSoup(response.content, "html.parser")
+        return self.parse_soup(response, url)
+
+    def get_lxml(self, url: str, **kwargs: Any) -> lxml.html.HtmlElement:
+        """
+        Get a URL and return it parsed as an lxml HTML tree.
+
+        Cheaper than get_soup() for callers that walk the tree with XPath:
+        chunks are fed to lxml's incremental parser as they arrive, so the
+        body is never buffered whole and no BeautifulSoup objects are built.
+
+        Args:
+            url: URL to fetch
+            **kwargs: Additional arguments passed to get()
+
+        Returns:
+            Root element of the parsed document
+
+        Raises:
+            NetworkError: If request fails
+            ScrapingError: If the body is empty or cannot be parsed as HTML
+        """
+        kwargs["stream"] = True
+        response = self.get(url, **kwargs)
+
+        parser = lxml.html.HTMLParser(encoding=self._declared_charset(response))
+        chunks = self._iter_bounded(response, url)
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+            root: lxml.html.HtmlElement = parser.close()
+            return root
+        except etree.LxmlError as e:
+            raise ScrapingError(f"Could not parse HTML from {url}: {e}")
+        finally:
+            # Releases the connection even if parsing stops mid-stream
+            chunks.close()
+
+    def parse_soup(self, response: requests.Response, url: str, max_bytes: Optional[int] = None) -> BeautifulSoup:
+        """
+        Parse the bounded body of a streamed response as HTML.
+
+        The charset declared in the Content-Type header is handed to
+        BeautifulSoup so it can skip sniffing the body for an encoding.
+
+        Args:
+            response: Response obtained with ``stream=True``
+            url: URL the response came from (for error messages)
+            max_bytes: Maximum number of bytes to read (defaults to MAX_RESPONSE_BYTES)
+
+        Returns:
+            BeautifulSoup object
+
+        Raises:
+            NetworkError: If reading the body fails
+        """
+        content, charset = self._read_bounded(response, url, max_bytes)
+        return BeautifulSoup(content, self.parser, from_encoding=charset)
+
+    def _read_bounded(
+        self, response: requests.Response, url: str, max_bytes: Optional[int] = None
+    ) -> Tuple[bytes, Optional[str]]:
+        """Read up to ``max_bytes`` of a streamed response and return (body, declared charset)."""
+        charset = self._declared_charset(response)
+        return b"".join(self._iter_bounded(response, url, max_bytes)), charset
+
+    def _iter_bounded(
+        self, response: requests.Response, url: str, max_bytes: Optional[int] = None
+    ) -> Generator[bytes, None, None]:
+        """Yield decoded body chunks of a streamed response, stopping at ``max_bytes``."""
+        remaining = max_bytes or self.MAX_RESPONSE_BYTES
+        try:
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                if len(chunk) >= remaining:
+                    yield chunk[:remaining]
+                    logger.debug(f"Response from {url} truncated at {max_bytes or self.MAX_RESPONSE_BYTES} bytes")
+                    return
+                remaining -= len(chunk)
+                yield chunk
+        except requests.RequestException as e:
+            raise NetworkError(f"HTTP request failed for {url}: {e}")
+        finally:
+            response.close()
+
+    @staticmethod
+    def _declared_charset(response: requests.Response) -> Optional[str]:
+        """Return the response encoding only if the server declared one."""
+        # requests fills in ISO-8859-1 for text/* without a charset; only trust
+        # an encoding the server actually declared.
+        content_type = response.headers.get("Content-Type", "")
+        return response.encoding if "charset=" in content_type.lower() else None
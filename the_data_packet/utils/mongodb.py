@@ -1,16 +1,30 @@
 import os
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne, WriteConcern
 from pymongo.collection import Collection
 from pymongo.cursor import Cursor
 from pymongo.database import Database
-from pymongo.results import InsertOneResult
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
+from pymongo.results import BulkWriteResult, InsertOneResult
 
 from the_data_packet.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# One MongoClient (and so one connection pool) per (username, password, host),
+# shared by every MongoDBClient in the process so repeated construction reuses
+# pooled, already-authenticated connections.
+_client_cache: Dict[Tuple[str, str, str], MongoClient] = {}
+_client_lock = threading.Lock()
+
+# (database, collection, field) unique indexes already ensured in this process
+_unique_indexes: Set[Tuple[str, str, str]] = set()
+
+# Server error code for a unique index violation
+_DUPLICATE_KEY = 11000
+
 
 class MongoDBClient:
     """A MongoDB client wrapper for database operations.
@@ -19,7 +33,7 @@ class MongoDBClient:
     and performing common database operations like inserting and querying documents.
 
     Attributes:
-        client (MongoClient): The MongoDB client instance.
+        client (MongoClient): The MongoDB client instance, shared per credentials and host.
         db (Database): The MongoDB database instance.
     """
 
@@ -40,18 +54,27 @@ class MongoDBClient:
         logger.info(f"Environment check - MONGODB_HOST: {os.getenv('MONGODB_HOST', 'not set')}")
         logger.info(f"Docker environment detected: {os.path.exists('/.dockerenv')}")
 
-        try:
-            self.client: MongoClient = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
-            # Test the connection
-            self.client.admin.command("ping")
-            logger.info("MongoDB connection successful!")
-            self.db: Database = self.client.the_data_packet
-        except Exception as e:
-            logger.error(f"MongoDB connection failed: {e}")
-            logger.error(
-                f"Connection string used: mongodb://{username}:***@{mongodb_host}:27017/the_data_packet?authSource=admin"  # noqa: E501
-            )
-            raise
+        key = (username, password, mongodb_host)
+        with _client_lock:
+            client = _client_cache.get(key)
+            if client is None:
+                try:
+                    client = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+                    # Test the connection
+                    client.admin.command("ping")
+                    logger.info("MongoDB connection successful!")
+                except Exception as e:
+                    logger.error(f"MongoDB connection failed: {e}")
+                    logger.error(
+                        f"Connection string used: mongodb://{username}:***@{mongodb_host}:27017/the_data_packet?authSource=admin"  # noqa: E501
+                    )
+                    raise
+                _client_cache[key] = client
+            else:
+                logger.debug("Reusing pooled MongoDB connection")
+
+        self.client: MongoClient = client
+        self.db: Database = self.client.the_data_packet
 
     def get_collection(self, collection_name: str) -> Collection:
         """Get a collection from the database.
@@ -85,6 +108,117 @@ class MongoDBClient:
             logger.error(f"Failed to insert document into collection '{collection_name}': {e}")
             raise
 
+    def fire_and_forget_insert(self, collection_name: str, document: Dict[str, Any]) -> None:
+        """Insert a single document without waiting for the server to acknowledge it.
+
+        Uses an unacknowledged write concern (``w=0``), so the call returns as
+        soon as the document is sent. Write errors on the server side (e.g.
+        duplicate keys) are not reported; use this only for data whose loss
+        is acceptable, such as analytics.
+
+        Args:
+            collection_name (str): The name of the collection to insert into.
+            document (Dict[str, Any]): The document to insert.
+        """
+        try:
+            logger.debug(f"Sending unacknowledged insert to collection '{collection_name}'")
+            collection = self.get_collection(collection_name)
+            collection.with_options(write_concern=WriteConcern(w=0)).insert_one(document)
+        except Exception as e:
+            logger.error(f"Failed to send document to collection '{collection_name}': {e}")
+            raise
+
+    def bulk_write(self, collection_name: str, operations: Sequence[Any], ordered: bool = False) -> BulkWriteResult:
+        """Apply a mix of write operations to a collection in one request.
+
+        Args:
+            collection_name (str): The name of the collection to write to.
+            operations (Sequence[Any]): pymongo write operations such as
+                                      ``InsertOne``, ``UpdateOne`` or ``DeleteOne``.
+            ordered (bool): Whether to stop at the first failing operation.
+
+        Returns:
+            BulkWriteResult: The result of the bulk write.
+        """
+        try:
+            logger.debug(f"Bulk writing {len(operations)} operations to collection '{collection_name}'")
+            collection = self.get_collection(collection_name)
+            result = collection.bulk_write(list(operations), ordered=ordered)
+            logger.debug("Bulk write completed successfully")
+            return result
+        except Exception as e:
+            logger.error(f"Failed to bulk write to collection '{collection_name}': {e}")
+            raise
+
+    def ensure_unique_index(self, collection_name: str, field: str) -> None:
+        """Create a unique index on a field, once per process.
+
+        Index creation is idempotent on the server; the in-process record only
+        saves the round-trip on later calls. If the index cannot be built a
+        warning is logged and callers fall back to upserts without the
+        server-side guarantee. Collections written before the index existed
+        may hold the same value several times, which blocks the build until
+        the duplicates are removed; the warning says how to find them.
+
+        Args:
+            collection_name (str): The name of the collection to index.
+            field (str): The field whose values must be unique.
+        """
+        key = (self.db.name, collection_name, field)
+        if key in _unique_indexes:
+            return
+
+        try:
+            self.get_collection(collection_name).create_index(field, unique=True)
+            _unique_indexes.add(key)
+        except OperationFailure as e:
+            if e.code != _DUPLICATE_KEY:
+                logger.warning(f"Could not create unique index on '{collection_name}.{field}': {e}")
+                return
+            logger.warning(
+                f"Could not create unique index on '{collection_name}.{field}': the collection already holds "
+                "duplicate values. Deduplication still works through upserts, but concurrent runs are not guarded. "
+                "To enable the index, list the duplicates with "
+                f"db.{collection_name}.aggregate([{{$group: {{_id: '${field}', n: {{$sum: 1}}, "
+                "ids: {$push: '$_id'}}}, {$match: {n: {$gt: 1}}}]) and delete all but one document per value"
+            )
+        except PyMongoError as e:
+            logger.warning(f"Could not create unique index on '{collection_name}.{field}': {e}")
+
+    def insert_new_documents(self, collection_name: str, documents: List[Dict[str, Any]], key: str) -> Set[Any]:
+        """Insert the documents whose ``key`` is not yet in a collection, in one round-trip.
+
+        Each document becomes an upsert that only sets fields on insert, so
+        existing documents are left untouched. With the unique index this
+        method ensures on ``key``, concurrent callers cannot both insert the
+        same value.
+
+        Args:
+            collection_name (str): The name of the collection to write to.
+            documents (List[Dict[str, Any]]): The documents to insert; each must have ``key``.
+            key (str): The field identifying a document (e.g. ``"url"``).
+
+        Returns:
+            Set[Any]: The ``key`` values that were newly inserted.
+        """
+        if not documents:
+            return set()
+
+        self.ensure_unique_index(collection_name, key)
+        operations = [
+            UpdateOne({key: document[key]}, {"$setOnInsert": document}, upsert=True) for document in documents
+        ]
+
+        try:
+            upserted: Dict[int, Any] = self.bulk_write(collection_name, operations).upserted_ids or {}
+        except BulkWriteError as e:
+            # A concurrent writer inserted the same key first; that document is not new
+            if any(error.get("code") != _DUPLICATE_KEY for error in e.details.get("writeErrors", [])):
+                raise
+            upserted = {entry["index"]: entry["_id"] for entry in e.details.get("upserted", [])}
+
+        return {documents[index][key] for index in upserted}
+
     def find_documents(self, collection_name: str, query: Optional[Dict[str, Any]] = None) -> Cursor:
         """Find documents in a collection based on a query.
 
@@ -110,11 +244,9 @@ class MongoDBClient:
             raise
 
     def close(self) -> None:
-        """Close the MongoDB client connection.
+        """Release this client.
 
-        This should be called when the client is no longer needed
-        to properly close the connection and free resources.
+        The underlying MongoClient is shared across instances, so its
+        connection pool is left open for the next MongoDBClient to reuse.
         """
-        logger.debug("Closing MongoDB connection")
-        self.client.close()
-        logger.debug("MongoDB connection closed")
+        logger.debug("Releasing MongoDB client; pooled connections stay open")
@@ -1,18 +1,26 @@
 """AWS S3 storage backend."""
 
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from the_data_packet.core.config import get_config
-from the_data_packet.core.exceptions import ConfigurationError, NetworkError
+from the_data_packet.core.exceptions import ConfigurationError
 from the_data_packet.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# boto3 clients are thread-safe but slow to build (service model loading), so
+# one per (region, access key, secret key) is shared by every S3Storage in the
+# process: the pipeline, RSS generator and log uploads reuse its connections.
+_client_cache: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+_client_lock = threading.Lock()
+
 
 @dataclass
 class S3UploadResult:
@@ -27,6 +35,12 @@ class S3UploadResult:
 class S3Storage:
     """AWS S3 storage backend."""
 
+    # Files above the threshold go up as multipart uploads, with parts sent
+    # in parallel threads; episode audio is typically several parts.
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024
+    MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+    MAX_CONCURRENCY = 10
+
     def __init__(
         self,
         bucket_name: Optional[str] = None,
@@ -50,6 +64,12 @@ class S3Storage:
             raise ConfigurationError("S3 bucket name is required")
 
         self.region = region or config.aws_region
+        self._transfer_config = TransferConfig(
+            multipart_threshold=self.MULTIPART_THRESHOLD,
+            multipart_chunksize=self.MULTIPART_CHUNK_SIZE,
+            max_concurrency=self.MAX_CONCURRENCY,
+            use_threads=True,
+        )
 
         # Initialize S3 client
         try:
@@ -64,10 +84,18 @@ class S3Storage:
                     }
                 )
 
-            self.s3_client = boto3.client("s3", **session_kwargs)
-
-            # Test credentials
-            self._test_credentials()
+            # Credentials are resolved and checked by the first real request
+            # (upload_file reports a missing or rejected key there), so no
+            # probe round-trip is made up front.
+            key = (self.region, session_kwargs.get("aws_access_key_id"), session_kwargs.get("aws_secret_access_key"))
+            with _client_lock:
+                client = _client_cache.get(key)
+                if client is None:
+                    client = boto3.client("s3", **session_kwargs)
+                    _client_cache[key] = client
+                else:
+                    logger.debug(f"Reusing S3 client for region {self.region}")
+            self.s3_client = client
 
         except NoCredentialsError:
             raise ConfigurationError(
@@ -97,7 +125,10 @@ class S3Storage:
         Returns:
             S3UploadResult with upload details
         """
-        if not local_path.exists():
+        # One stat both checks the file exists and sizes it
+        try:
+            file_size = local_path.stat().st_size
+        except FileNotFoundError:
             return S3UploadResult(success=False, error_message=f"File not found: {local_path}")
 
         if s3_key is None:
@@ -106,13 +137,12 @@ class S3Storage:
         logger.info(f"Uploading {local_path} to s3://{self.bucket_name}/{s3_key}")
 
         try:
-            file_size = local_path.stat().st_size
-
             # Prepare upload arguments
             upload_args: Dict[str, Any] = {
                 "Filename": str(local_path),
                 "Bucket": self.bucket_name,
                 "Key": s3_key,
+                "Config": self._transfer_config,
             }
 
             # Add content type if specified
@@ -136,6 +166,17 @@ class S3Storage:
                 file_size_bytes=file_size,
             )
 
+        except NoCredentialsError:
+            error_message = (
+                "S3 upload failed: AWS credentials not found. Set AWS_ACCESS_KEY_ID and "
+                "AWS_SECRET_ACCESS_KEY environment variables or configure AWS CLI."
+            )
+            logger.error(error_message)
+
+            return S3UploadResult(
+                success=False,
+                error_message=error_message,
+            )
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             error_message = f"S3 upload failed ({error_code}): {e}"
@@ -154,21 +195,6 @@ class S3Storage:
                 error_message=error_message,
             )
 
-    def _test_credentials(self) -> None:
-        """Test S3 credentials by listing buckets."""
-        try:
-            self.s3_client.list_buckets()
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            if error_code == "AccessDenied":
-                raise ConfigurationError("AWS credentials are invalid or lack permissions")
-            elif error_code == "SignatureDoesNotMatch":
-                raise ConfigurationError("AWS secret access key is incorrect")
-            else:
-                raise ConfigurationError(f"AWS credentials test failed: {e}")
-        except Exception as e:
-            raise NetworkError(f"Failed to test AWS credentials: {e}")
-
     def bucket_exists(self) -> bool:
         """Check if the configured bucket exists and is accessible."""
         try:
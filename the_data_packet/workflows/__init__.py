@@ -1,8 +1,15 @@
 """Workflows package for The Data Packet."""
 
-from the_data_packet.workflows.podcast import PodcastPipeline, PodcastResult
+from typing import TYPE_CHECKING
+
+from the_data_packet.core.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from the_data_packet.workflows.podcast import PodcastPipeline, PodcastResult
 
 __all__ = [
     "PodcastPipeline",
     "PodcastResult",
 ]
+
+__getattr__ = lazy_getattr(__name__, dict.fromkeys(__all__, "podcast"))
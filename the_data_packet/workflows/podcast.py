@@ -1,27 +1,33 @@
 """Main podcast generation workflow."""
 
+import time
 import traceback
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type
 
-from the_data_packet.core.config import Config, get_config
+from the_data_packet.core.config import Config, get_config, show_slug
 from the_data_packet.core.exceptions import TheDataPacketError, ValidationError
 from the_data_packet.core.logging import get_logger, upload_current_day_log
-from the_data_packet.generation.audio import AudioGenerator, AudioResult
 from the_data_packet.generation.rss import RSSGenerator
-from the_data_packet.generation.script import ScriptGenerator
-from the_data_packet.sources.base import Article
+from the_data_packet.sources.base import _DATACLASS_SLOTS, Article, ArticleSource
 from the_data_packet.sources.techcrunch import TechCrunchSource
 from the_data_packet.sources.wired import WiredSource
 from the_data_packet.utils.mongodb import MongoDBClient
 from the_data_packet.utils.s3 import S3Storage, S3UploadResult
 
+# The generators load the Anthropic/Gemini SDKs, so they are imported only
+# when a step that needs them runs
+if TYPE_CHECKING:
+    from the_data_packet.generation.audio import AudioGenerator, AudioResult
+    from the_data_packet.generation.script import ScriptGenerator
+
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PodcastResult:
     """Result of podcast generation workflow."""
 
@@ -45,10 +51,12 @@ class PodcastPipeline:
     """Main podcast generation pipeline."""
 
     # Available article sources
-    SOURCES = {
+    SOURCES: Dict[str, Type[ArticleSource]] = {
         "wired": WiredSource,
         "techcrunch": TechCrunchSource,
     }
+    # Upper bound on (source, category) pairs collected at once
+    MAX_COLLECT_WORKERS = 8
 
     def __init__(self, config: Optional[Config] = None):
         """
@@ -63,10 +71,13 @@ class PodcastPipeline:
         self._validate_config()
 
         # Initialize components (lazy loading)
-        self._script_generator: Optional[ScriptGenerator] = None
-        self._audio_generator: Optional[AudioGenerator] = None
+        self._script_generator: Optional["ScriptGenerator"] = None
+        self._audio_generator: Optional["AudioGenerator"] = None
         self._rss_generator: Optional[RSSGenerator] = None
         self._s3_storage: Optional[S3Storage] = None
+        self._mongo_client: Optional[MongoDBClient] = None
+        # "<show-slug>/<YYYY-MM-DD>" key prefix shared by a run's uploads
+        self._s3_prefix: Optional[str] = None
 
         logger.info(f"Initialized podcast pipeline for '{self.config.show_name}'")
 
@@ -77,8 +88,11 @@ class PodcastPipeline:
         Returns:
             PodcastResult with execution details
         """
-        start_time = datetime.now()
+        # Monotonic clock for the run duration; unaffected by wall-clock jumps
+        start_time = time.perf_counter()
         result = PodcastResult()
+        # Fixed at the start so every upload of a run lands under the same date
+        self._s3_prefix = self._build_s3_prefix(datetime.now())
 
         logger.info("Starting podcast generation pipeline")
         logger.info(f"Sources: {self.config.article_sources}")
@@ -86,68 +100,20 @@ class PodcastPipeline:
         logger.info(f"Output: {self.config.output_directory}")
 
         try:
-            # Step 1: Collect articles
-            articles = self._collect_articles()
-            new_articles = self._remove_already_used_articles(articles)
-            result.number_of_articles_collected = len(new_articles)
-            result.articles_collected = new_articles
-
-            if not new_articles:
-                logger.error("No new articles collected after deduplication")
-                # Upload log file before failing
-                if self._should_use_s3():
-                    try:
-                        logger.info("Uploading current day's log file to S3")
-                        upload_current_day_log(self.config)
-                    except Exception as e:
-                        logger.warning(f"Failed to upload current day's log file to S3: {e}")
-                raise TheDataPacketError("No new articles were collected")
-
-            # Add used articles to database
-            self._add_article_to_db(new_articles)
-
-            # Step 2: Generate script (if enabled)
-            script_content = None
-            if self.config.generate_script:
-                self.config.validate_for_script_generation()
-                script_content = self._generate_script(articles)
-                script_path = self._save_script(script_content)
-                result.script_generated = True
-                result.script_path = script_path
-
-                # Upload to S3 (if configured)
-                if self._should_use_s3():
-                    s3_result = self._upload_to_s3(script_path)
-                    result.s3_script_url = s3_result.s3_url
-
-            # Step 3: Generate audio (if enabled)
-            if self.config.generate_audio:
-                if not script_content:
-                    raise TheDataPacketError("Script content required for audio generation")
-
-                self.config.validate_for_audio_generation()
-                audio_result = self._generate_audio(script_content)
-                result.audio_generated = True
-                result.audio_path = audio_result.output_file
-
-                # Upload to S3 (if configured)
-                if self._should_use_s3():
-                    s3_result = self._upload_to_s3(audio_result.output_file)
-                    result.s3_audio_url = s3_result.s3_url
-
-            # Step 4: Generate/Update RSS feed (if enabled and audio was uploaded)
-            if self.config.generate_rss and result.s3_audio_url:
-                self._generate_rss_feed(
-                    articles,
-                    result,
-                    audio_result if "audio_result" in locals() else None,
-                )
-
-            # Calculate execution time
-            result.execution_time_seconds = (datetime.now() - start_time).total_seconds()
-            result.success = True
+            try:
+                self._run_steps(result)
+                result.success = True
+            except Exception as e:
+                result.error_message = str(e)
 
-            logger.info(f"Pipeline completed successfully in {result.execution_time_seconds:.1f} seconds")
+            # Single finalize step for both outcomes
+            result.execution_time_seconds = time.perf_counter() - start_time
+            if result.success:
+                logger.info(f"Pipeline completed successfully in {result.execution_time_seconds:.1f} seconds")
+            else:
+                logger.error(
+                    f"Pipeline failed after {result.execution_time_seconds:.1f} seconds: {result.error_message}"
+                )
 
             # Upload current log file to S3 alongside generated files
             if self._should_use_s3():
@@ -158,173 +124,333 @@ class PodcastPipeline:
                     logger.warning(f"Failed to upload current day's log file to S3: {e}")
 
             # Save episode metadata (non-critical, don't fail pipeline)
-            try:
-                self._save_episode_metadata(result)
-            except Exception as e:
-                logger.warning(f"Failed to save episode metadata to MongoDB: {e}")
-
-            return result
-
-        except Exception as e:
-            result.execution_time_seconds = (datetime.now() - start_time).total_seconds()
-            result.error_message = str(e)
-            logger.error(f"Pipeline failed after {result.execution_time_seconds:.1f} seconds: {e}")
-            if self._should_use_s3():
+            if result.success:
                 try:
-                    logger.info("Uploading current day's log file to S3")
-                    upload_current_day_log(self.config)
+                    self._save_episode_metadata(result)
                 except Exception as e:
-                    logger.warning(f"Failed to upload current day's log file to S3: {e}")
+                    logger.warning(f"Failed to save episode metadata to MongoDB: {e}")
 
             return result
 
+        finally:
+            self._close_mongo()
+
+    def _run_steps(self, result: PodcastResult) -> None:
+        """Run the pipeline steps, recording their outputs on ``result``.
+
+        Raises:
+            TheDataPacketError: If no new articles are found or a step cannot run
+        """
+        # Step 1: Collect articles. Generator clients don't depend on the
+        # articles, so they are built in the background meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(self._warm_up_generators)
+            articles = self._collect_articles()
+            # Dedup against previous episodes and record these articles as used
+            new_articles = self._claim_new_articles(articles)
+        result.number_of_articles_collected = len(new_articles)
+        result.articles_collected = new_articles
+
+        if not new_articles:
+            logger.error("No new articles collected after deduplication")
+            raise TheDataPacketError("No new articles were collected")
+
+        # Step 2: Generate script (if enabled). Writing and uploading it don't
+        # feed into audio generation, so they run in the background meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            script_content = None
+            script_future: Optional["Future[None]"] = None
+            if self.config.generate_script:
+                self.config.validate_for_script_generation()
+                script_content = self._generate_script(new_articles)
+                # Built here so the publish thread and the audio upload below
+                # share one storage client instead of racing to create it
+                if self._should_use_s3() and not self._s3_storage:
+                    self._s3_storage = S3Storage()
+                script_future = executor.submit(self._publish_script, script_content, result)
+
+            try:
+                # Step 3: Generate audio (if enabled)
+                audio_result: Optional["AudioResult"] = None
+                if self.config.generate_audio:
+                    if not script_content:
+                        raise TheDataPacketError("Script content required for audio generation")
+
+                    self.config.validate_for_audio_generation()
+                    audio_result = self._generate_audio(script_content)
+                    result.audio_generated = True
+                    result.audio_path = audio_result.output_file
+
+                    # Upload to S3 (if configured)
+                    if self._should_use_s3():
+                        s3_result = self._upload_to_s3(audio_result.output_file)
+                        result.s3_audio_url = s3_result.s3_url
+            finally:
+                # Even if audio fails, the result reports the script that was
+                # written and uploaded
+                if script_future:
+                    wait((script_future,))
+
+            if script_future:
+                # Surfaces a failed save or upload
+                script_future.result()
+
+        # Step 4: Generate/Update RSS feed (if enabled and audio was uploaded)
+        if self.config.generate_rss and result.s3_audio_url:
+            self._generate_rss_feed(new_articles, result, audio_result)
+
     def _collect_articles(self) -> List[Article]:
         """Collect articles from all configured sources."""
         logger.info("Collecting articles")
 
-        all_articles = []
+        used_urls = self._load_used_urls()
+        tasks: List[Tuple[str, ArticleSource, str]] = []
+
+        for source_name, source, categories in self._build_sources():
+            source.exclude_urls(used_urls)
+            source.prefetch_feeds(categories)
+            tasks.extend((source_name, source, category) for category in categories)
+
+        all_articles: List[Article] = []
+        if tasks:
+            # Each (source, category) fetch is network-bound, so run them side by
+            # side; results are gathered in task order to keep output stable
+            with ThreadPoolExecutor(max_workers=min(len(tasks), self.MAX_COLLECT_WORKERS)) as executor:
+                futures = [executor.submit(self._collect_category, *task) for task in tasks]
+                for future in futures:
+                    all_articles.extend(future.result())
+
+        # Filter valid articles
+        valid_articles = [a for a in all_articles if a.is_valid()]
+
+        logger.info(f"Collected {len(valid_articles)} valid articles (out of {len(all_articles)} total)")
+
+        return self._deduplicate_articles(valid_articles)
+
+    @staticmethod
+    def _deduplicate_articles(articles: List[Article]) -> List[Article]:
+        """Drop repeats of the same story, keeping the first occurrence.
+
+        Sources file some stories under several categories, and every copy
+        would otherwise be sent to the LLM. Articles are keyed by URL, or by
+        (title, author) when they have none.
+        """
+        seen: Set[Any] = set()
+        unique_articles = []
+        for article in articles:
+            key = article.url or (article.title, article.author)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique_articles.append(article)
+
+        duplicates = len(articles) - len(unique_articles)
+        if duplicates:
+            logger.info(f"Dropped {duplicates} duplicate articles collected under multiple categories")
+        return unique_articles
+
+    def _build_sources(self) -> List[Tuple[str, ArticleSource, List[str]]]:
+        """Build each configured source once, with the configured categories it supports.
 
-        for source_name in self.config.article_sources:
+        Unknown sources and unsupported categories are logged and dropped here,
+        so the collection loop only sees (source, categories) pairs with
+        something to fetch.
+        """
+        sources: List[Tuple[str, ArticleSource, List[str]]] = []
+        for source_name in dict.fromkeys(self.config.article_sources):
             if source_name not in self.SOURCES:
                 logger.warning(f"Unknown article source: {source_name}")
                 continue
 
-            source_class = self.SOURCES[source_name]
-            source = source_class()
-
+            source = self.SOURCES[source_name]()
+            supported = source.supported_categories
+            categories = []
             for category in self.config.article_categories:
-                # Skip categories not supported by this source
-                if category not in source.supported_categories:
+                if category in supported:
+                    categories.append(category)
+                else:
                     logger.warning(f"Category '{category}' not supported by {source_name}")
-                    continue
-
-                try:
-                    logger.info(f"Collecting {category} articles from {source_name}")
-
-                    if self.config.max_articles_per_source == 1:
-                        article = source.get_latest_article(category)
-                        all_articles.append(article)
-                    else:
-                        articles = source.get_multiple_articles(category, self.config.max_articles_per_source)
-                        all_articles.extend(articles)
 
-                except Exception as e:
-                    logger.error(f"Failed to collect {category} articles from {source_name}: {e}")
-                    logger.error(traceback.format_exc())
+            if categories:
+                sources.append((source_name, source, categories))
+        return sources
 
-        # Filter valid articles
-        valid_articles = [a for a in all_articles if a.is_valid()]
-
-        logger.info(f"Collected {len(valid_articles)} valid articles (out of {len(all_articles)} total)")
+    def _collect_category(self, source_name: str, source: ArticleSource, category: str) -> List[Article]:
+        """Collect one category from one source, logging and returning [] on failure."""
+        try:
+            logger.info(f"Collecting {category} articles from {source_name}")
 
-        return valid_articles
+            if self.config.max_articles_per_source == 1:
+                return [source.get_latest_article(category)]
+            return source.get_multiple_articles(category, self.config.max_articles_per_source)
 
-    def _remove_already_used_articles(self, articles: List[Article]) -> List[Article]:
-        """Check if the article has already been used in previous episodes.
+        except Exception as e:
+            logger.error(f"Failed to collect {category} articles from {source_name}: {e}")
+            logger.error(traceback.format_exc())
+            return []
 
-        This prevents content duplication by checking the MongoDB 'articles' collection
-        for any articles that have been used in previous podcast episodes.
+    def _get_mongo(self) -> Optional[MongoDBClient]:
+        """Return the pipeline's MongoDB client, creating it on first use.
 
-        Args:
-            articles: List of articles to check for duplication
+        One client serves every MongoDB step of a run and is closed when the
+        run ends. Connection errors propagate so each caller can decide
+        whether its step is optional.
 
         Returns:
-            List of articles that have not been used before
+            MongoDBClient, or None if MongoDB credentials are not configured
         """
         if not self.config.mongodb_username or not self.config.mongodb_password:
-            logger.warning("MongoDB credentials are not configured, skipping deduplication")
-            return articles
+            return None
 
-        logger.info(f"Attempting MongoDB connection for deduplication with username: {self.config.mongodb_username}")
-        try:
-            mongo_client = MongoDBClient(
+        if self._mongo_client is None:
+            logger.info(f"Attempting MongoDB connection with username: {self.config.mongodb_username}")
+            self._mongo_client = MongoDBClient(
                 username=self.config.mongodb_username,
                 password=self.config.mongodb_password,
             )
-            logger.info("MongoDB client created successfully for deduplication")
+            logger.info("MongoDB client created successfully")
+            # The 'url' index serves the used-URL lookup from the index alone
+            # and enforces uniqueness for _claim_new_articles
+            self._mongo_client.ensure_unique_index("articles", "url")
+        return self._mongo_client
+
+    def _close_mongo(self) -> None:
+        """Close the pipeline's MongoDB client if one was created."""
+        if self._mongo_client is not None:
+            self._mongo_client.close()
+            self._mongo_client = None
+
+    def _load_used_urls(self) -> Set[str]:
+        """Load the URLs of articles used in previous episodes.
+
+        Reads the distinct URLs of the MongoDB 'articles' collection once
+        (answered from its 'url' index, not the documents) so sources can skip
+        known URLs before fetching them. Returns an empty set if MongoDB is
+        not configured or unreachable; _claim_new_articles still checks the
+        collected articles afterwards.
+
+        Returns:
+            Set of previously used article URLs
+        """
+        try:
+            mongo_client = self._get_mongo()
+        except Exception as e:
+            logger.warning(f"Failed to create MongoDB client for used article lookup: {e}")
+            return set()
+
+        if mongo_client is None:
+            return set()
+
+        try:
+            used_urls = set(mongo_client.get_collection("articles").distinct("url"))
+            logger.info(f"Loaded {len(used_urls)} previously used article URLs")
+            return used_urls
+        except Exception as e:
+            logger.warning(f"Failed to load previously used article URLs: {e}")
+            return set()
+
+    def _claim_new_articles(self, articles: List[Article]) -> List[Article]:
+        """Record articles as used and return the ones not used in previous episodes.
+
+        Deduplication and storage are a single MongoDB round-trip: each
+        article is upserted by URL into the 'articles' collection (which has
+        a unique index on 'url'), and only the ones actually inserted are
+        new. Two runs collecting the same article cannot both claim it.
+
+        Args:
+            articles: Collected articles
+
+        Returns:
+            Articles that had not been used before, in their original order
+        """
+        try:
+            mongo_client = self._get_mongo()
         except Exception as e:
             logger.error(f"Failed to create MongoDB client for deduplication: {e}")
             logger.warning("Proceeding without deduplication")
             return articles
 
-        new_articles = []
+        if mongo_client is None:
+            logger.warning("MongoDB credentials are not configured, skipping deduplication and article storage")
+            return articles
+
+        # Articles without a URL cannot be deduplicated; they are kept but not stored
+        article_docs = [article.to_dict() for article in articles if article.url]
 
         try:
-            for article in articles:
-                # Check if article URL already exists in the database
-                logger.debug(f"Checking if article already exists: {article.title}")
-                existing = mongo_client.find_documents("articles", {"url": article.url})
-                if len(list(existing)) > 0:
-                    logger.info(f"Article already used in previous episode: {article.title}")
-                    continue
-                new_articles.append(article)
-
-            logger.info(f"Deduplication complete: {len(new_articles)}/{len(articles)} articles are new")
+            new_urls = mongo_client.insert_new_documents("articles", article_docs, key="url")
         except Exception as e:
             logger.error(f"Error during deduplication: {e}")
             logger.warning("Proceeding with all articles (deduplication failed)")
-            new_articles = articles
-        finally:
-            mongo_client.close()
+            return articles
 
-        return new_articles
+        new_articles = []
+        for article in articles:
+            if article.url and article.url not in new_urls:
+                # Lazy %-args: only formatted when debug logging is on
+                logger.debug(f"Article already used in previous episode: {article.title}")
+                continue
+            new_articles.append(article)
+            if article.url:
+                # A URL collected twice in this run is only new the first time
+                new_urls.discard(article.url)
 
-    def _add_article_to_db(self, articles: List[Article]) -> None:
-        """Add used articles to the MongoDB database for future deduplication.
+        logger.info(f"Deduplication complete: {len(new_articles)}/{len(articles)} articles are new")
+        return new_articles
 
-        Stores article information to prevent reuse in future episodes.
-        This ensures that each podcast episode contains unique content.
+    def _warm_up_generators(self) -> None:
+        """Create the enabled script/audio generators ahead of their steps.
 
-        Args:
-            articles: List of Article objects to store in the database
+        Failures are only logged: the generator is then created, and the
+        error raised, by the step that needs it.
         """
-        if not self.config.mongodb_username or not self.config.mongodb_password:
-            logger.warning("MongoDB credentials are not configured, skipping article storage")
-            return
-
-        logger.info(f"Attempting MongoDB connection for article storage with username: {self.config.mongodb_username}")
         try:
-            mongo_client = MongoDBClient(
-                username=self.config.mongodb_username,
-                password=self.config.mongodb_password,
-            )
-            logger.info("MongoDB client created successfully for article storage")
-        except Exception as e:
-            logger.error(f"Failed to create MongoDB client for article storage: {e}")
-            logger.warning("Proceeding without storing articles")
-            return
+            if self.config.generate_script and not self._script_generator:
+                from the_data_packet.generation.script import ScriptGenerator
 
-        article_docs = [article.to_dict() for article in articles]
-        logger.info(f"Storing {len(article_docs)} articles to MongoDB")
+                self._script_generator = ScriptGenerator()
+            if self.config.generate_audio and not self._audio_generator:
+                from the_data_packet.generation.audio import AudioGenerator
 
-        try:
-            for i, article in enumerate(article_docs):
-                logger.debug(f"Storing article {i + 1}/{len(article_docs)}: {article.get('title', 'Unknown')}")
-                mongo_client.insert_document("articles", article)
-            logger.info(f"Successfully stored {len(article_docs)} articles to MongoDB database")
+                self._audio_generator = AudioGenerator()
         except Exception as e:
-            logger.error(f"Failed to store articles to MongoDB: {e}")
-        finally:
-            mongo_client.close()
+            logger.debug(f"Generator warm-up failed, retrying when the step runs: {e}")
 
     def _generate_script(self, articles: List[Article]) -> str:
         """Generate podcast script from articles."""
         logger.info("Generating podcast script")
 
         if not self._script_generator:
+            from the_data_packet.generation.script import ScriptGenerator
+
             self._script_generator = ScriptGenerator()
 
         return self._script_generator.generate_script(articles)
 
-    def _generate_audio(self, script_content: str) -> AudioResult:
+    def _generate_audio(self, script_content: str) -> "AudioResult":
         """Generate audio from script."""
         logger.info("Generating podcast audio")
 
         if not self._audio_generator:
+            from the_data_packet.generation.audio import AudioGenerator
+
             self._audio_generator = AudioGenerator()
 
         return self._audio_generator.generate_audio(script_content)
 
+    def _publish_script(self, script_content: str, result: PodcastResult) -> None:
+        """Save the script and upload it to S3 (if configured).
+
+        Each output is recorded on ``result`` as soon as it exists, so a
+        later failure elsewhere in the run doesn't hide it.
+        """
+        script_path = self._save_script(script_content)
+        result.script_generated = True
+        result.script_path = script_path
+
+        if self._should_use_s3():
+            result.s3_script_url = self._upload_to_s3(script_path).s3_url
+
     def _save_script(self, script_content: str) -> Path:
         """Save script to file."""
         # Ensure output directory exists
@@ -335,8 +461,8 @@ class PodcastPipeline:
         script_path = self.config.output_directory / script_filename
 
         try:
-            with open(script_path, "w", encoding="utf-8") as f:
-                f.write(script_content)
+            # One binary write; skips the text layer's newline translation
+            script_path.write_bytes(script_content.encode("utf-8"))
 
             logger.info(f"Script saved to {script_path}")
             return script_path
@@ -349,11 +475,12 @@ class PodcastPipeline:
         if not self._s3_storage:
             self._s3_storage = S3Storage()
 
-        # Generate S3 key with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d")
-        s3_key = f"{self.config.show_name.lower().replace(' ', '-')}/{timestamp}/{file_path.name}"
+        prefix = self._s3_prefix or self._build_s3_prefix(datetime.now())
+        return self._s3_storage.upload_file(file_path, f"{prefix}/{file_path.name}")
 
-        return self._s3_storage.upload_file(file_path, s3_key)
+    def _build_s3_prefix(self, timestamp: datetime) -> str:
+        """Build the "<show-slug>/<YYYY-MM-DD>" S3 key prefix for a run."""
+        return f"{show_slug(self.config.show_name)}/{timestamp.strftime('%Y-%m-%d')}"
 
     def _should_use_s3(self) -> bool:
         """Check if S3 should be used for uploads."""
@@ -363,7 +490,7 @@ class PodcastPipeline:
         self,
         articles: List[Article],
         result: PodcastResult,
-        audio_result: Optional[AudioResult] = None,
+        audio_result: Optional["AudioResult"] = None,
     ) -> None:
         """Generate and upload RSS feed for the new episode."""
         try:
@@ -375,11 +502,11 @@ class PodcastPipeline:
             # Determine episode number (will be auto-assigned in RSS generator)
             episode_number = None  # Let RSS generator determine the next number
 
-            # Get audio file size if available
+            # Audio file size was recorded when the file was written
             file_size = None
             duration = None
-            if audio_result and audio_result.output_file.exists():
-                file_size = audio_result.output_file.stat().st_size
+            if audio_result:
+                file_size = audio_result.file_size_bytes
                 # Duration could be extracted from audio_result if available
                 duration = getattr(audio_result, "duration", None)
 
@@ -418,7 +545,8 @@ class PodcastPipeline:
         errors = []
 
         # Validate article sources
-        unknown_sources = set(self.config.article_sources) - set(self.SOURCES.keys())
+        # Dict membership checks need no temporary sets, and keep config order
+        unknown_sources = [name for name in dict.fromkeys(self.config.article_sources) if name not in self.SOURCES]
         if unknown_sources:
             errors.append(f"Unknown article sources: {', '.join(unknown_sources)}")
 
@@ -441,33 +569,28 @@ class PodcastPipeline:
         Args:
             episode_data: PodcastResult containing episode information to save
         """
-        if not self.config.mongodb_username or not self.config.mongodb_password:
-            logger.warning("MongoDB credentials are not configured, skipping metadata save")
-            return
-
         try:
-            mongo_client = MongoDBClient(
-                username=self.config.mongodb_username,
-                password=self.config.mongodb_password,
-            )
-
-            # Convert the episode data to a dictionary, converting Article objects to dicts
-            episode_dict = episode_data.__dict__.copy()
-            episode_dict["articles_collected"] = [article.to_dict() for article in episode_data.articles_collected]
-
-            # Convert Path objects to strings for MongoDB compatibility
-            if episode_dict.get("script_path"):
-                episode_dict["script_path"] = str(episode_dict["script_path"])
-            if episode_dict.get("audio_path"):
-                episode_dict["audio_path"] = str(episode_dict["audio_path"])
-            if episode_dict.get("rss_path"):
-                episode_dict["rss_path"] = str(episode_dict["rss_path"])
-
-            # Remove article content to save space in database
-            for article in episode_dict["articles_collected"]:
-                article.pop("content", None)
+            mongo_client = self._get_mongo()
+            if mongo_client is None:
+                logger.warning("MongoDB credentials are not configured, skipping metadata save")
+                return
 
-            mongo_client.insert_document("episodes", episode_dict)
+            # Single pass over the result fields: Paths become strings for MongoDB
+            # and articles are stored without their content to save space
+            episode_dict: Dict[str, Any] = {}
+            for result_field in fields(episode_data):
+                value = getattr(episode_data, result_field.name)
+                if result_field.name == "articles_collected":
+                    value = [article.to_dict(exclude=("content",)) for article in value]
+                elif isinstance(value, Path):
+                    value = str(value)
+                episode_dict[result_field.name] = value
+
+            if self.config.mongodb_ack_episode_writes:
+                mongo_client.insert_document("episodes", episode_dict)
+            else:
+                # Analytics only: don't hold up the run waiting for the server
+                mongo_client.fire_and_forget_insert("episodes", episode_dict)
             logger.info("Added episode metadata to MongoDB database")
 
         except Exception as e: